@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structures.charts
+import structures.fixtures
+import structures.players
+import structures.simulation
+import structures.standings
+
+
+# Record classes converted to use __slots__
+CLASSES = (structures.fixtures.Fixture,
+           structures.fixtures.FixtureTeam,
+           structures.standings.Standing,
+           structures.charts.Goalscorers.Goal,
+           structures.players.Rating,
+           structures.players.Injury,
+           structures.players.Suspension)
+
+
+def get_slotted_size(instance):
+    '''
+    Return bytes used by slotted instance.
+    '''
+    return sys.getsizeof(instance)
+
+
+def get_dictionary_size(instance):
+    '''
+    Return bytes used by equivalent instance storing attributes in __dict__.
+    '''
+    equivalent = type(type(instance).__name__, (), {})()
+
+    for name in type(instance).__slots__:
+        if hasattr(instance, name):
+            setattr(equivalent, name, getattr(instance, name))
+
+    return sys.getsizeof(equivalent) + sys.getsizeof(equivalent.__dict__)
+
+
+def run(season=2014, seed=1):
+    '''
+    Simulate full season and report memory used by each record class.
+    '''
+    structures.simulation.simulate_season(season, seed)
+
+    gc.collect()
+
+    instances = {cls: [] for cls in CLASSES}
+
+    for instance in gc.get_objects():
+        if type(instance) in instances:
+            instances[type(instance)].append(instance)
+
+    print("%-12s %8s %12s %12s %12s" % ("Class", "Count", "Slotted", "Dictionary", "Saved"))
+
+    slotted_total = 0
+    dictionary_total = 0
+
+    for cls, items in instances.items():
+        slotted = sum(get_slotted_size(instance) for instance in items)
+        dictionary = sum(get_dictionary_size(instance) for instance in items)
+
+        slotted_total += slotted
+        dictionary_total += dictionary
+
+        print("%-12s %8i %12i %12i %12i" % (cls.__name__, len(items), slotted, dictionary, dictionary - slotted))
+
+    print("%-12s %8s %12i %12i %12i" % ("Total", "", slotted_total, dictionary_total, dictionary_total - slotted_total))
+
+
+if __name__ == "__main__":
+    run()
@@ -20,6 +20,7 @@ import database
 import music
 import preferences
 import structures.currency
+import structures.reference
 import structures.user
 
 
@@ -37,6 +38,7 @@ preferences = preferences.Preferences()      # Preferences configuration object
 database = database.Database()               # Database connection object
 names = structures.user.Names()              # Names object
 currency = structures.currency.Currency()    # Currency object
+reference = structures.reference.Reference() # Shared reference data object
 
 # In-game data handling objects
 players = None
@@ -56,3 +58,4 @@ negotiations = None     # Negotiations handler class
 loans = None            # Loans handler class
 comparison = None       # Comparison object
 calendar = None         # Calendar object
+journal = None          # Autosave journal object
@@ -16,45 +16,64 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
-import gi
-gi.require_version('Gst', '1.0')
-
-from gi.repository import Gst
 import os
 import sys
 
 import data
 
 
-Gst.init(sys.argv)
+class Music:
+    '''
+    Theme music player, with GStreamer set up on first playback so the
+    game data can be imported without it.
+    '''
+    def __init__(self):
+        self.music_file = os.path.join("resources", "usmtheme.wav")
 
+        self.gst = None
+        self.pipeline = None
 
-class Music(Gst.Pipeline):
-    def __init__(self):
-        Gst.Pipeline.__init__(self)
+    def initialise(self):
+        '''
+        Import and initialise GStreamer and build the playback pipeline.
+        '''
+        import gi
+        gi.require_version('Gst', '1.0')
 
-        self.music_file = os.path.join("resources", "usmtheme.wav")
+        from gi.repository import Gst
+
+        Gst.init(sys.argv)
+
+        self.gst = Gst
         self.music_uri = Gst.filename_to_uri(self.music_file)
 
+        self.pipeline = Gst.Pipeline()
+
         self.playbin = Gst.ElementFactory.make("playbin")
         self.playbin.set_property("uri", self.music_uri)
         self.playbin.set_state(Gst.State.NULL)
         self.playbin.connect("about-to-finish", self.on_about_to_finish)
-        self.add(self.playbin)
+        self.pipeline.add(self.playbin)
 
     def play(self):
         '''
         Begin playing of music and set playing state.
         '''
         data.preferences.play_music = True
-        self.set_state(Gst.State.PLAYING)
+
+        if not self.pipeline:
+            self.initialise()
+
+        self.pipeline.set_state(self.gst.State.PLAYING)
 
     def stop(self):
         '''
         Stop playing of music and set playing state.
         '''
         data.preferences.play_music = False
-        self.set_state(Gst.State.NULL)
+
+        if self.pipeline:
+            self.pipeline.set_state(self.gst.State.NULL)
 
     def on_about_to_finish(self, playbin):
         '''
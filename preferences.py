@@ -36,6 +36,8 @@ class Preferences:
 
         self.play_music = False
 
+        self.news_retention = 2
+
         self.window_size = [800, 480]
         self.window_position = [0, 0]
         self.window_maximized = False
@@ -61,6 +63,7 @@ class Preferences:
                                            "Maximized": False,
                                            "HideWarnings": False,
                                            "ConfirmQuit": False,
+                                           "NewsRetention": 2,
                                            "Width": 780,
                                            "Height": 480,
                                            "XPosition": 0,
@@ -82,6 +85,7 @@ class Preferences:
         self.currency = int(self.confighandler["INTERFACE"]["Currency"])
         self.hide_warnings = self.confighandler["INTERFACE"].getboolean("HideWarnings")
         self.confirm_quit = self.confighandler["INTERFACE"].getboolean("ConfirmQuit")
+        self.news_retention = self.confighandler["INTERFACE"].getint("NewsRetention", fallback=2)
 
         width = int(self.confighandler["INTERFACE"]["Width"])
         height = int(self.confighandler["INTERFACE"]["Height"])
@@ -105,6 +109,7 @@ class Preferences:
         self.confighandler["INTERFACE"]["Currency"] = str(self.currency)
         self.confighandler["INTERFACE"]["HideWarnings"] = str(self.hide_warnings)
         self.confighandler["INTERFACE"]["ConfirmQuit"] = str(self.confirm_quit)
+        self.confighandler["INTERFACE"]["NewsRetention"] = str(self.news_retention)
         self.confighandler["INTERFACE"]["Maximized"] = str(data.window.is_maximized())
 
         width, height = data.window.get_size()
@@ -56,6 +56,8 @@ class Accounts:
         self.expenditure = 0
         self.balance = 0
 
+        self.changed = False
+
     def request(self, amount):
         '''
         Verify whether the passed amount will overdraw the account.
@@ -74,6 +76,8 @@ class Accounts:
         self.expenditure += amount
         self.balance -= amount
 
+        self.changed = True
+
     def deposit(self, amount, category):
         '''
         Deposit the passed amount and set on appropriate category.
@@ -84,6 +88,8 @@ class Accounts:
         self.income += amount
         self.balance += amount
 
+        self.changed = True
+
     def reset_weekly(self):
         '''
         Clear weekly deposits and withdrawals.
@@ -91,3 +97,5 @@ class Accounts:
         for finances in (self.incomes, self.expenditures):
             for item in finances.values():
                 item.week = 0
+
+        self.changed = True
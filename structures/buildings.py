@@ -60,9 +60,7 @@ class Buildings:
         return sum(shop.size * shop.number for shop in self.buildings)
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM buildings")
-
-        for count, shop in enumerate(data.database.cursor.fetchall()):
+        for count, shop in enumerate(data.reference.get_buildings()):
             building = self.Building()
             building.name = shop[0]
             building.size = shop[1]
@@ -35,6 +35,14 @@ class Calendar:
 
         self.event = 0
 
+        self.season = None
+
+    def compile_season(self, year):
+        '''
+        Build the season calendar for the season starting in given year.
+        '''
+        self.season = Season(year, self.calendar)
+
     def get_days(self):
         '''
         Return tuple of day names.
@@ -51,34 +59,28 @@ class Calendar:
         '''
         Return whether current date has a scheduled fixture.
         '''
-        state = False
-
-        for leagueid, league in data.leagues.get_leagues():
-            if self.event <= len(league.fixtures.events) - 1:
-                if data.date.get_date_for_event() == league.fixtures.events[self.event]:
-                    state = True
-
-        return state
+        return self.season.get_fixture_ordinal(self.event) == data.date.ordinal
 
     def get_user_fixture(self):
         '''
         Return fixture for user operated club.
         '''
-        fixtures = data.user.club.league.fixtures.get_fixtures_for_week(self.event)
+        fixtures = data.user.club.league.fixtures
 
-        if data.date.get_date_for_event() == data.user.club.league.fixtures.events[self.event]:
-            for fixtureid, fixture in fixtures.items():
-                if data.user.club in (fixture.home.club, fixture.away.club):
-                    club1 = fixture.home.club.name
-                    club2 = fixture.away.club.name
+        if data.date.get_date_for_event() == fixtures.events[self.event]:
+            fixture = fixtures.get_fixture_for_club(self.event, data.user.club)
 
-                    data.window.mainscreen.information.league = data.user.club.league
-                    data.window.mainscreen.information.fixture = fixture
-                    data.window.mainscreen.information.set_show_next_match(club1, club2)
+            if fixture:
+                club1 = fixture.home.club.name
+                club2 = fixture.away.club.name
 
-                    data.window.mainscreen.information.set_continue_to_match()
+                data.window.mainscreen.information.league = data.user.club.league
+                data.window.mainscreen.information.fixture = fixture
+                data.window.mainscreen.information.set_show_next_match(club1, club2)
 
-                    return fixture
+                data.window.mainscreen.information.set_continue_to_match()
+
+                return fixture
 
     def get_other_fixtures(self, leagueid):
         '''
@@ -117,4 +119,70 @@ class Calendar:
         '''
         Handle end of season event and initiate reset of data.
         '''
+        import uigtk.endofseason
+
         uigtk.endofseason.EndOfSeason()
+
+
+class Season:
+    '''
+    Compiled season calendar mapping each day from 1st August to the events
+    which fall on it.
+    '''
+    def __init__(self, year, calendar):
+        self.dates = []
+        self.ordinals = {}
+
+        self.daily = set()
+        self.monthly = set()
+
+        self.fixtures = {}
+
+        for month in (8, 9, 10, 11, 12, 1, 2, 3, 4, 5, 6, 7):
+            if month == 1:
+                year += 1
+
+            for day in range(1, calendar[month] + 1):
+                ordinal = len(self.dates)
+
+                self.dates.append((day, month, year))
+                self.ordinals[(day, month)] = ordinal
+
+                if day != 1:
+                    self.daily.add(ordinal)
+                elif month != 1:
+                    self.monthly.add(ordinal)
+
+        for leagueid, league in data.leagues.get_leagues():
+            for event, date in enumerate(league.fixtures.events):
+                self.fixtures[event] = self.ordinals[date]
+
+    def get_length(self):
+        '''
+        Return number of days in the season.
+        '''
+        return len(self.dates)
+
+    def get_date(self, ordinal):
+        '''
+        Return day, month and year tuple for given ordinal day.
+        '''
+        return self.dates[ordinal]
+
+    def get_daily_event(self, ordinal):
+        '''
+        Return whether daily events are processed on moving to ordinal day.
+        '''
+        return ordinal in self.daily
+
+    def get_monthly_event(self, ordinal):
+        '''
+        Return whether monthly events are processed on moving to ordinal day.
+        '''
+        return ordinal in self.monthly
+
+    def get_fixture_ordinal(self, event):
+        '''
+        Return ordinal day of given fixture event, or None if not scheduled.
+        '''
+        return self.fixtures.get(event)
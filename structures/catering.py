@@ -21,18 +21,10 @@ import data
 
 class Catering:
     def __init__(self):
-        self.catering = []
-
-        self.populate_data()
+        self.catering = data.reference.get_catering()
 
     def get_catering(self):
         '''
         Return list of catering items.
         '''
         return self.catering
-
-    def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM catering")
-
-        for item in data.database.cursor.fetchall():
-            self.catering.append(item)
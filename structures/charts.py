@@ -24,6 +24,8 @@ class Goalscorers:
         '''
         Individual goal record for each player with a goal.
         '''
+        __slots__ = ("player", "league")
+
         def __init__(self, player):
             self.player = player
 
@@ -32,6 +34,8 @@ class Goalscorers:
     def __init__(self):
         self.goals = {}
 
+        self.changed = set()
+
     def get_sorted_goals(self):
         '''
         Return sorted list of goalscorers.
@@ -66,10 +70,13 @@ class Goalscorers:
         goal = self.goals[player.playerid]
         goal.league += goals
 
+        self.changed.add(player.playerid)
+
     def clear_goals(self):
         '''
         Clear list of goals for end of season.
         '''
+        self.changed.update(self.goals)
         self.goals.clear()
 
 
@@ -89,6 +96,8 @@ class Assists:
     def __init__(self):
         self.assists = {}
 
+        self.changed = set()
+
     def get_sorted_assists(self):
         '''
         Return sorted list of assisters.
@@ -98,10 +107,13 @@ class Assists:
         '''
         Return assists for given player.
         '''
+        assists = 0
+
         if player.playerid in self.assists:
-            return self.assists[player.playerid]
-        else:
-            return None
+            assist = self.assists[player.playerid]
+            assists = assist.league
+
+        return assists
 
     def add_assist(self, player, assists):
         '''
@@ -115,10 +127,13 @@ class Assists:
             assist = self.assists[player.playerid]
             assist.league += assists
 
+        self.changed.add(player.playerid)
+
     def clear_assists(self):
         '''
         Clear list of goals for end of season.
         '''
+        self.changed.update(self.assists)
         self.assists.clear()
 
 
@@ -144,6 +159,8 @@ class Cards:
     def __init__(self):
         self.cards = {}
 
+        self.changed = set()
+
     def get_sorted_cards(self):
         '''
         Return list of player with most card points.
@@ -185,8 +202,11 @@ class Cards:
             card.yellow += yellow
             card.red += red
 
+        self.changed.add(player.playerid)
+
     def clear_cards(self):
         '''
         Clear list of cards for season.
         '''
+        self.changed.update(self.cards)
         self.cards.clear()
@@ -28,15 +28,18 @@ import structures.expectation
 import structures.finances
 import structures.form
 import structures.individualtraining
+import structures.loans
 import structures.merchandise
 import structures.news
 import structures.scouts
+import structures.shortlist
 import structures.sponsorship
 import structures.squad
 import structures.tactics
 import structures.teamtraining
 import structures.tickets
 import structures.training
+import structures.trainingcamp
 
 
 class Clubs:
@@ -141,23 +144,28 @@ class Clubs:
                 club.accounts.balance = finances.get_value_by_index(option)
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM club \
+        data.database.cursor.execute("SELECT club.id, name, nickname, league, \
+                                     manager, chairman, stadium, reputation \
+                                     FROM club \
                                      JOIN clubattr \
                                      ON club.id = clubattr.club \
                                      WHERE year = ?",
                                      (self.season,))
 
+        leagues = data.leagues.leagues
+        stadiums = data.stadiums.stadiums
+
         for item in data.database.cursor.fetchall():
             club = self.Club(item[0])
             self.clubs[club.clubid] = club
 
             club.name = item[1]
             club.nickname = item[2]
-            club.league = data.leagues.get_league_by_id(item[6])
-            club.manager = item[7]
-            club.chairman = item[8]
-            club.stadium = data.stadiums.get_stadium_by_id(item[9])
-            club.reputation = item[10]
+            club.league = leagues[item[3]]
+            club.manager = item[4]
+            club.chairman = item[5]
+            club.stadium = stadiums[item[6]]
+            club.reputation = item[7]
 
             club.league.add_club_to_league(club)
 
@@ -167,12 +175,16 @@ class History:
         self.club = club
         self.history = []
 
+        self.changed = False
+
     def add_history(self):
         '''
         Add current history tuple to previous history list.
         '''
         self.history.insert(0, self.get_current_history())
 
+        self.changed = True
+
     def get_history(self):
         '''
         Return list of history items.
@@ -16,9 +16,6 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
-import uigtk.comparison
-
-
 class Comparison:
     '''
     Storage class for players added to comparison.
@@ -57,6 +54,8 @@ class Comparison:
         '''
         Show comparison of two players, or error if unable.
         '''
+        import uigtk.comparison
+
         if self.get_comparison_valid():
             uigtk.comparison.ComparisonDialog()
         else:
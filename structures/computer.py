@@ -16,59 +16,79 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import math
 import random
 
 import data
 
 
+def get_random_rows(rows, probability):
+    '''
+    Return rows each selected with given probability.  Gaps between selected
+    rows are drawn from the geometric distribution, so the number selected
+    follows the binomial distribution and the cost follows that number.
+    '''
+    scale = math.log(1 - probability)
+
+    selected = []
+    row = int(math.log(1 - random.random()) / scale)
+
+    while row < rows:
+        selected.append(row)
+        row += int(math.log(1 - random.random()) / scale) + 1
+
+    return selected
+
+
 class InjuryGenerator:
     '''
     Generate random injuries for players outside of a match.
     '''
     def generate_injuries(self):
         '''
-        Generate injuries with weighting for players with lower fitness.
+        Generate injuries for a random selection of players at clubs.
         '''
-        for clubid, club in data.clubs.get_clubs():
-            for playerid, player in club.squad.get_squad():
-                number = random.randint(0, 256)
+        clubs = data.players.table.get_column("club")
+
+        for row in get_random_rows(data.players.table.get_row_count(), 1 / 257):
+            if clubs[row]:
+                player = data.players.get_player_by_row(row)
 
-                if number < 1:
-                    injury = data.injuries.get_random_injury()
-                    player.injury.set_injured(injury)
+                injury = data.injuries.get_random_injury()
+                player.injury.set_injured(injury)
 
-                    player.club.news.publish("IN01",
-                                             player=player.get_name(mode=1),
-                                             weeks=player.injury.period,
-                                             injury=injury.name)
+                player.club.news.publish("IN01",
+                                         player=player.get_name(mode=1),
+                                         weeks=player.injury.period,
+                                         injury=injury.name)
 
     def injury_recovery(self):
         '''
         Decrement injury recovery period for injured players.
         '''
-        for playerid, player in data.players.get_players():
-            if player.injury.get_injured():
-                player.injury.period -= 1
+        for playerid in sorted(data.players.injured):
+            player = data.players.get_player_by_id(playerid)
+            player.injury.period -= 1
+            player.set_changed()
 
-                if player.injury.period == 0:
-                    injury = data.injuries.get_injury_by_id(player.injury.injuryid)
+            if player.injury.period == 0:
+                injury = data.injuries.get_injury_by_id(player.injury.injuryid)
 
-                    player.club.news.publish("IN03",
-                                             player=player.get_name(mode=1),
-                                             injury=injury.name)
+                player.club.news.publish("IN03",
+                                         player=player.get_name(mode=1),
+                                         injury=injury.name)
 
-                    player.injury.injuryid = None
+                player.injury.injuryid = None
 
     def increment_fitness(self):
         '''
         Improve fitness for players with less than 100 fitness.
         '''
-        for playerid, player in data.players.get_players():
-            if player.injury.fitness < 100 and not player.injury.get_injured():
-                player.injury.fitness += random.randint(0, 5)
+        for playerid in sorted(data.players.unfit):
+            player = data.players.get_player_by_id(playerid)
 
-                if player.injury.fitness > 100:
-                    player.injury.fitness = 100
+            if not player.injury.get_injured():
+                player.injury.fitness = min(player.injury.fitness + random.randint(0, 5), 100)
 
 
 class AdvertHandler:
@@ -34,6 +34,20 @@ class Contract:
 
         self.set_initial_bonus()
 
+    def get_length(self):
+        '''
+        Return number of weeks remaining stored for the player.
+        '''
+        return self.player.table.columns["contract"][self.player.row]
+
+    def set_length(self, length):
+        '''
+        Store number of weeks remaining for the player.
+        '''
+        self.player.table.set_value("contract", self.player.row, length)
+
+    contract = property(get_length, set_length)
+
     def set_initial_bonus(self):
         '''
         Set initial bonus amounts based on starting player wage.
@@ -82,6 +96,8 @@ class Contract:
         self.winbonus = contract[2]
         self.goalbonus = contract[3]
 
+        self.player.set_changed()
+
     def set_contract_length(self, length):
         '''
         Define length of contract in weeks from passed year value.
@@ -108,6 +124,7 @@ class Contract:
             self.player.club = None
             self.contract = 0
             self.player.not_for_sale = False
+            self.player.set_changed()
 
             data.purchase_list.remove_from_list(self.player)
             data.loan_list.remove_from_list(self.player)
@@ -17,7 +17,6 @@
 
 
 import data
-import uigtk.continuedialog
 
 
 class Date:
@@ -29,11 +28,17 @@ class Date:
 
         self.week_count = 0
 
+        self.ordinal = 0
+
     def increment_date(self):
         '''
-        Increment date and week, and update display for user.
+        Increment date and week, processing any events that fall due.
         '''
-        maximum = data.calendar.get_maximum_days(self.month)
+        self.ordinal += 1
+
+        if self.ordinal == data.calendar.season.get_length():
+            data.calendar.compile_season(self.year)
+            self.ordinal = 0
 
         self.week_count += 1
 
@@ -43,21 +48,29 @@ class Date:
 
             data.events.process_weekly_events()
 
-        if self.day == maximum:
-            if self.month == 12:
-                self.set_end_of_year()
-            else:
-                self.month += 1
-                self.day = 1
-
-                data.events.process_monthly_events()
-        else:
-            self.day += 1
+        self.day, self.month, self.year = data.calendar.season.get_date(self.ordinal)
 
+        if data.calendar.season.get_monthly_event(self.ordinal):
+            data.events.process_monthly_events()
+        elif data.calendar.season.get_daily_event(self.ordinal):
             data.events.process_daily_events()
 
-        dialog = uigtk.continuedialog.ContinueDialog()
-        dialog.show()
+        if data.journal:
+            data.journal.record()
+
+    def skip_to_next_event(self):
+        '''
+        Advance date to the next fixture, processing events for days passed.
+        '''
+        ordinal = data.calendar.season.get_fixture_ordinal(data.calendar.event)
+
+        if ordinal is None or ordinal < self.ordinal:
+            return False
+
+        while self.ordinal < ordinal:
+            self.increment_date()
+
+        return True
 
     def set_end_of_year(self):
         '''
@@ -75,6 +88,9 @@ class Date:
         self.day = 1
         self.week = 1
 
+        self.ordinal = 0
+        data.calendar.compile_season(self.year)
+
     def get_season(self):
         '''
         Return the current season string.
@@ -31,6 +31,8 @@ class Events:
         data.advertising.assistant_handled()
         data.negotiations.update_negotiations()
 
+        data.players.increment_generation()
+
     def process_weekly_events(self):
         '''
         Events processed at the end of each week.
@@ -65,6 +67,11 @@ class Events:
 
         data.date.set_end_of_season()
 
+        for clubid, club in data.clubs.get_clubs():
+            club.news.end_season(data.preferences.news_retention)
+
+        data.players.value_all()
+
     def process_end_of_match_events(self, fixture):
         '''
         Events processed at the end of a match.
@@ -85,3 +92,6 @@ class Events:
         fixture.pay_televised_money()
 
         fixture.played = True
+        fixture.league.fixtures.changed.add(fixture.fixtureid)
+
+        data.players.increment_generation()
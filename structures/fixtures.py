@@ -26,6 +26,11 @@ class Fixtures:
         self.fixtures = {}
         self.fixtureid = 0
 
+        self.changed = set()
+
+        self.weeks = {}
+        self.club_fixtures = {}
+
         self.events = (16, 8), (23, 8), (30, 8), (13, 9), (20, 9), (27, 9), (4, 10), (18, 10), (25, 10), (1, 11), (8, 11), (22, 11), (29, 11), (2, 12), (6, 12), (13, 12), (20, 12), (26, 12), (28, 12), (1, 1), (10, 1), (17, 1), (31, 1), (7, 2), (10, 2), (21, 2), (28, 2), (3, 3), (14, 3), (21, 3), (4, 4), (11, 4), (18, 4), (25, 4), (2, 5), (9, 5), (16, 5), (24, 5),
 
     def get_fixtureid(self):
@@ -76,7 +81,7 @@ class Fixtures:
                     fixture.away.club = club
 
                 fixture.fixtureid = self.get_fixtureid()
-                self.fixtures[fixture.fixtureid] = fixture
+                self.add_fixture(fixture)
 
         for week in range(0, rounds):
             referees = self.get_referee_list()
@@ -105,10 +110,23 @@ class Fixtures:
                     fixture.away.club = club
 
                 fixture.fixtureid = self.get_fixtureid()
-                self.fixtures[fixture.fixtureid] = fixture
+                self.add_fixture(fixture)
 
         self.generate_televised_fixtures()
 
+    def add_fixture(self, fixture):
+        '''
+        Store fixture and index it by week and by competing clubs.
+        '''
+        self.fixtures[fixture.fixtureid] = fixture
+        self.changed.add(fixture.fixtureid)
+
+        week = self.weeks.setdefault(fixture.week, {})
+        week[fixture.fixtureid] = fixture
+
+        self.club_fixtures[(fixture.week, fixture.home.club.clubid)] = fixture
+        self.club_fixtures[(fixture.week, fixture.away.club.clubid)] = fixture
+
     def get_referee_list(self):
         '''
         Return randomly ordered list of referees for assignment to fixture.
@@ -132,15 +150,15 @@ class Fixtures:
 
     def get_fixtures_for_week(self, week):
         '''
-        Return list of fixtures for passed week value.
+        Return copy of fixtures dictionary for passed week value.
         '''
-        fixtures = {}
+        return dict(self.weeks.get(week, {}))
 
-        for fixtureid, fixture in self.fixtures.items():
-            if fixture.week == week:
-                fixtures[fixtureid] = fixture
-
-        return fixtures
+    def get_fixture_for_club(self, week, club):
+        '''
+        Return fixture for passed club in given week, or None if not playing.
+        '''
+        return self.club_fixtures.get((week, club.clubid))
 
     def get_number_of_rounds(self):
         '''
@@ -155,10 +173,11 @@ class Fixtures:
         fixtures = []
         initial = []
 
-        for fixture in self.fixtures.values():
-            if fixture.week in (0, 1, 2):
-                if data.user.club in (fixture.home.club, fixture.away.club):
-                    fixtures.append([fixture.home.club, fixture.away.club])
+        for week in (0, 1, 2):
+            fixture = self.get_fixture_for_club(week, data.user.club)
+
+            if fixture:
+                fixtures.append([fixture.home.club, fixture.away.club])
 
         for teams in fixtures:
             for count, team in enumerate(teams):
@@ -193,7 +212,19 @@ class Fixture:
     '''
     Fixture object representing match to be played.
     '''
+    __slots__ = ("fixtureid",
+                 "week",
+                 "played",
+                 "televised",
+                 "home",
+                 "away",
+                 "result",
+                 "attendance",
+                 "referee",
+                 "league")
+
     def __init__(self):
+        self.fixtureid = 0
         self.week = 0
         self.played = False
         self.televised = False
@@ -244,6 +275,15 @@ class FixtureTeam:
     '''
     Fixture team object storing squad, events, match statistics, and more.
     '''
+    __slots__ = ("club",
+                 "team_selection",
+                 "team_played",
+                 "goalscorers",
+                 "assisters",
+                 "formationid",
+                 "yellow_cards",
+                 "red_cards")
+
     def __init__(self):
         self.club = None
 
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import multiprocessing
+import random
+
+import data
+import structures.journal
+import structures.match
+import structures.simulation
+
+
+# Replay object held by each worker process
+replay = None
+
+
+class Replay:
+    '''
+    League model owned by a single process for replaying seeded seasons.
+    '''
+    def __init__(self, season, seed, clubid=None, filepath=None):
+        if filepath:
+            journal = structures.journal.Journal(filepath)
+            journal.load(readonly=True)
+        else:
+            simulation = structures.simulation.Simulation(season, seed, clubid)
+            simulation.setup()
+
+        self.event = data.calendar.event
+
+        self.standings = {}
+        self.fixtures = {}
+
+        for leagueid, league in data.leagues.get_leagues():
+            standings = {}
+
+            for clubid, standing in league.standings.standings.items():
+                standings[clubid] = [getattr(standing, name)
+                                     for name in standing.__slots__]
+
+            self.standings[leagueid] = (standings,
+                                        list(league.standings.order),
+                                        dict(league.standings.positions))
+
+            for fixtureid, fixture in league.fixtures.get_fixtures().items():
+                if not fixture.played:
+                    self.fixtures[fixture] = ([list(team) for team in fixture.home.team_selection],
+                                              [list(team) for team in fixture.away.team_selection],
+                                              fixture.result,
+                                              fixture.home.goalscorers,
+                                              fixture.away.goalscorers)
+
+        self.clubs = {}
+
+        for clubid, club in data.clubs.get_clubs():
+            self.clubs[clubid] = (list(club.form.form),
+                                  list(club.squad.teamselection.team),
+                                  list(club.squad.teamselection.subs),
+                                  dict(club.news.articles),
+                                  club.news.newsid,
+                                  club.news.unread)
+
+        self.players = {}
+
+        for playerid, player in data.players.get_players():
+            self.players[playerid] = (player.injury.injuryid,
+                                      player.injury.period,
+                                      player.injury.fitness,
+                                      player.suspension.suspensionid,
+                                      player.suspension.period,
+                                      player.morale)
+
+        self.goals = {}
+
+        for playerid, goal in data.goalscorers.goals.items():
+            self.goals[playerid] = goal.league
+
+    def reset(self):
+        '''
+        Restore every value changed by a replay to its initial state.
+        '''
+        for leagueid, league in data.leagues.get_leagues():
+            standings, order, positions = self.standings[leagueid]
+
+            for clubid, values in standings.items():
+                standing = league.standings.standings[clubid]
+
+                for name, value in zip(standing.__slots__, values):
+                    setattr(standing, name, value)
+
+            league.standings.order[:] = order
+            league.standings.positions.update(positions)
+
+        for fixture, values in self.fixtures.items():
+            home, away, result, homegoals, awaygoals = values
+
+            fixture.home.team_selection = [list(team) for team in home]
+            fixture.away.team_selection = [list(team) for team in away]
+            fixture.result = result
+            fixture.home.goalscorers = homegoals
+            fixture.away.goalscorers = awaygoals
+            fixture.played = False
+
+        for clubid, club in data.clubs.get_clubs():
+            form, team, subs, articles, newsid, unread = self.clubs[clubid]
+
+            club.form.form[:] = form
+
+            club.squad.teamselection.team[:] = team
+            club.squad.teamselection.subs[:] = subs
+            club.squad.teamselection.clear_goalscorers()
+
+            club.news.articles = dict(articles)
+            club.news.newsid = newsid
+            club.news.unread = unread
+
+        data.players.unfit.clear()
+        data.players.injured.clear()
+
+        for playerid, player in data.players.get_players():
+            values = self.players[playerid]
+
+            player.injury.injuryid = values[0]
+            player.injury.period = values[1]
+            player.injury.fitness = values[2]
+            player.suspension.suspensionid = values[3]
+            player.suspension.period = values[4]
+            player.morale = values[5]
+
+        data.players.table.changed.clear()
+
+        data.goalscorers.goals.clear()
+
+        for playerid, goals in self.goals.items():
+            player = data.players.get_player_by_id(playerid)
+            data.goalscorers.add_goal(player, goals)
+
+        data.calendar.event = self.event
+
+    def get_days(self, week):
+        '''
+        Return number of days between given week and the following fixture.
+        '''
+        ordinal = data.calendar.season.get_fixture_ordinal(week)
+        following = data.calendar.season.get_fixture_ordinal(week + 1)
+
+        if ordinal is None or following is None:
+            return 7
+
+        return following - ordinal
+
+    def process_end_of_match(self, fixture):
+        '''
+        Update standings and goals chart for played fixture.
+        '''
+        fixture.league.standings.update_standing(fixture)
+
+        for goalscorers in (fixture.home.goalscorers, fixture.away.goalscorers):
+            if goalscorers:
+                for goalscorer in goalscorers:
+                    data.goalscorers.add_goal(goalscorer, 1)
+
+        fixture.played = True
+
+    def process_days(self, days):
+        '''
+        Restore fitness each day and heal injuries each week until next round.
+        '''
+        for day in range(1, days + 1):
+            data.injury.increment_fitness()
+
+            if day % 7 == 0:
+                data.injury.injury_recovery()
+
+    def replay_season(self, seed):
+        '''
+        Play every remaining fixture for given seed and return final club
+        positions.
+        '''
+        self.reset()
+
+        random.seed(seed)
+
+        rounds = max(league.fixtures.get_number_of_rounds()
+                     for leagueid, league in data.leagues.get_leagues())
+
+        for week in range(self.event, rounds):
+            fixtures = []
+
+            for leagueid, league in data.leagues.get_leagues():
+                for fixture in league.fixtures.get_fixtures_for_week(week).values():
+                    if not fixture.played:
+                        fixtures.append(fixture)
+
+            for fixture in fixtures:
+                fixture.home.club.squad.generate_squad()
+                fixture.away.club.squad.generate_squad()
+
+                team = structures.match.Team(fixture)
+                team.set_team_selection()
+
+            batch = structures.match.Batch(fixtures)
+            batch.generate_results()
+
+            for fixture in fixtures:
+                self.process_end_of_match(fixture)
+
+            self.process_days(self.get_days(week))
+
+            data.calendar.increment_event()
+
+        positions = {}
+
+        for leagueid, league in data.leagues.get_leagues():
+            positions[leagueid] = list(league.standings.get_order())
+
+        return positions
+
+
+def initialise_worker(season, seed, clubid, filepath):
+    '''
+    Build league model for worker process from a fresh database connection,
+    loading the saved game at given file path if passed.
+    '''
+    global replay
+
+    data.database.connect(data.preferences.database_path)
+
+    replay = Replay(season, seed, clubid, filepath)
+
+
+def replay_season(seed):
+    '''
+    Replay season in worker process for given seed.
+    '''
+    return replay.replay_season(seed)
+
+
+class Forecast:
+    '''
+    Monte Carlo forecast of final league positions across seeded replays.
+    '''
+    def __init__(self, season, seed=None, clubid=None, processes=None,
+                 filepath=None):
+        self.season = season
+        self.seed = seed
+        self.clubid = clubid
+        self.processes = processes
+        self.filepath = filepath
+
+        self.replays = 0
+        self.distributions = {}
+
+    def get_seeds(self, replays):
+        '''
+        Return list of unique seeds for each replay.
+        '''
+        generator = random.Random(self.seed)
+
+        return [generator.getrandbits(64) for count in range(0, replays)]
+
+    def add_positions(self, positions):
+        '''
+        Add finishing positions from a single replay to distributions.
+        '''
+        self.replays += 1
+
+        for leagueid, clubs in positions.items():
+            distribution = self.distributions.setdefault(leagueid, {})
+
+            for position, clubid in enumerate(clubs):
+                if clubid not in distribution:
+                    distribution[clubid] = [0] * len(clubs)
+
+                distribution[clubid][position] += 1
+
+    def run(self, replays):
+        '''
+        Distribute replays across process pool and aggregate the results.
+        '''
+        seeds = self.get_seeds(replays)
+
+        processes = self.processes or multiprocessing.cpu_count()
+        chunksize = max(1, replays // (processes * 4))
+
+        pool = multiprocessing.Pool(processes,
+                                    initializer=initialise_worker,
+                                    initargs=(self.season,
+                                              self.seed,
+                                              self.clubid,
+                                              self.filepath))
+
+        with pool:
+            for positions in pool.imap_unordered(replay_season, seeds, chunksize):
+                self.add_positions(positions)
+
+        return self.distributions
+
+    def get_distribution_for_club(self, leagueid, clubid):
+        '''
+        Return list of probabilities for each finishing position of club.
+        '''
+        distribution = self.distributions[leagueid][clubid]
+
+        return [count / self.replays for count in distribution]
+
+    def get_title_odds(self, leagueid, clubid):
+        '''
+        Return probability of club finishing in first position.
+        '''
+        return self.get_distribution_for_club(leagueid, clubid)[0]
+
+    def get_relegation_odds(self, leagueid, clubid, places=3):
+        '''
+        Return probability of club finishing in the relegation places.
+        '''
+        return sum(self.get_distribution_for_club(leagueid, clubid)[-places:])
@@ -23,12 +23,16 @@ class Form:
     def __init__(self):
         self.form = []
 
+        self.changed = False
+
     def add_form(self, form):
         '''
         Insert form character to list.
         '''
         self.form.append(form)
 
+        self.changed = True
+
     def get_form(self):
         '''
         Return complete list of form strings.
@@ -46,3 +50,11 @@ class Form:
         Return form listing in string form.
         '''
         return "".join(self.get_form_for_length(length))
+
+    def clear_form(self):
+        '''
+        Empty form list for start of new season.
+        '''
+        self.form.clear()
+
+        self.changed = True
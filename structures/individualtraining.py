@@ -116,6 +116,7 @@ class IndividualTraining:
 
             individual.player.training.points += points
             individual.player.training.points = int(individual.player.training.points)
+            individual.player.set_changed()
 
             if individual.player.training.points >= 100:
                 if skill == 0:
@@ -145,6 +146,7 @@ class IndividualTraining:
             if not self.get_player_in_training(playerid):
                 reduction = random.randint(0, 3)
                 player.training.points -= reduction
+                player.set_changed()
 
                 if player.training.points <= 0:
                     skill = random.randint(0, 9)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import os
+import struct
+import zlib
+
+import data
+import structures.savegame
+
+
+class Journal:
+    '''
+    Append-only journal of changed fields written on top of a saved game
+    snapshot, which is rewritten once the journal outgrows it.
+    '''
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.journalpath = "%s.osj" % (os.path.splitext(filepath)[0])
+
+        self.sections = []
+        self.rows = []
+
+    def set_baseline(self):
+        '''
+        Store current rows as the state against which changes are found.
+        '''
+        self.sections = structures.savegame.get_sections()
+        self.rows = [section.get_rows() for section in self.sections]
+
+        for section in self.sections:
+            section.clear_changes()
+
+    def compact(self):
+        '''
+        Write new snapshot of in-game state and empty the journal.
+        '''
+        temporary = "%s.tmp" % (self.filepath)
+
+        savegame = structures.savegame.SaveGame(temporary)
+        savegame.save()
+        os.replace(temporary, self.filepath)
+        os.replace(savegame.tablepath, structures.savegame.SaveGame(self.filepath).tablepath)
+
+        open(self.journalpath, "wb").close()
+
+        self.set_baseline()
+
+    def record(self):
+        '''
+        Append fields of rows marked as changed since the previous record to
+        the journal.
+        '''
+        writer = structures.savegame.Writer()
+        changed = False
+
+        for count, section in enumerate(self.sections):
+            previous = self.rows[count]
+            keys = section.get_changes()
+
+            if keys is None:
+                keys = previous.keys() | section.get_keys()
+
+            current = {}
+            removed = []
+
+            for key in keys:
+                row = section.get_row(key)
+
+                if row is None:
+                    if key in previous:
+                        removed.append(key)
+                elif previous.get(key) != row:
+                    current[key] = row
+
+            for index, typecode in enumerate(section.typecodes):
+                fields = [key for key, row in current.items()
+                          if key not in previous or previous[key][index] != row[index]]
+
+                writer.add_rows(typecode, fields, [(current[key][index],) for key in fields])
+
+            writer.add_column("I", removed)
+
+            for key in removed:
+                del previous[key]
+
+            previous.update(current)
+            section.clear_changes()
+
+            if current or removed:
+                changed = True
+
+        if changed:
+            content = zlib.compress(writer.get_content(), 1)
+
+            with open(self.journalpath, "ab") as journal:
+                journal.write(struct.pack("<I", len(content)))
+                journal.write(content)
+
+            if os.path.getsize(self.journalpath) > os.path.getsize(self.filepath):
+                self.compact()
+
+    def load(self, readonly=False):
+        '''
+        Load snapshot and replay each complete journal record, returning
+        whether the snapshot was recognised.  The journal file is left
+        untouched if loaded as read only.
+        '''
+        savegame = structures.savegame.SaveGame(self.filepath)
+
+        if not savegame.load():
+            return False
+
+        sections = structures.savegame.get_sections()
+        rows = [section.get_rows() for section in sections]
+
+        if os.path.exists(self.journalpath):
+            with open(self.journalpath, "rb") as journal:
+                content = journal.read()
+
+            offset = 0
+
+            while offset + 4 <= len(content):
+                size, = struct.unpack_from("<I", content, offset)
+
+                if offset + 4 + size > len(content):
+                    break
+
+                record = zlib.decompress(content[offset + 4:offset + 4 + size])
+                reader = structures.savegame.Reader(record)
+                offset += 4 + size
+
+                for section, current in zip(sections, rows):
+                    changed = set()
+
+                    for index, typecode in enumerate(section.typecodes):
+                        keys, values = reader.get_rows(typecode)
+
+                        for key, (value,) in zip(keys, values):
+                            if key not in changed:
+                                row = current.get(key, (None,) * len(section.typecodes))
+                                current[key] = list(row)
+                                changed.add(key)
+
+                            current[key][index] = value
+
+                    for key in changed:
+                        section.set_row(key, current[key])
+
+                    for key in reader.get_column("I"):
+                        section.remove_row(key)
+                        current.pop(key, None)
+
+            for section in sections:
+                section.update()
+
+            # Discard record left incomplete by an interrupted write
+            if offset < len(content) and not readonly:
+                with open(self.journalpath, "r+b") as journal:
+                    journal.truncate(offset)
+
+        self.set_baseline()
+
+        return True
+
+
+def start_autosave():
+    '''
+    Begin journalling in-game state to the autosave file.
+    '''
+    data.journal = Journal(os.path.join(data.preferences.save_path, "autosave.osm"))
+    data.journal.compact()
@@ -85,7 +85,7 @@ class Leagues:
             league.fixtures.generate_fixtures(league)
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM league \
+        data.database.cursor.execute("SELECT league.id, name FROM league \
                                      JOIN leagueattr \
                                      ON league.id = leagueattr.league \
                                      WHERE year = ?",
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import time
+
+import data
+import structures.clubs
+import structures.leagues
+import structures.nations
+import structures.players
+import structures.referees
+import structures.stadiums
+
+
+class Loader:
+    '''
+    Loader building the game world for a season in timed phases, each
+    phase fetching its rows with one query and resolving ids through maps.
+    '''
+    def __init__(self, season):
+        self.season = season
+
+        self.timings = {}
+
+    def load(self):
+        '''
+        Load each phase of the game world in dependency order.
+        '''
+        phases = (("nations", self.load_nations),
+                  ("leagues", self.load_leagues),
+                  ("referees", self.load_referees),
+                  ("stadiums", self.load_stadiums),
+                  ("clubs", self.load_clubs),
+                  ("players", self.load_players))
+
+        for name, phase in phases:
+            start = time.perf_counter()
+            phase()
+            self.timings[name] = time.perf_counter() - start
+
+    def load_nations(self):
+        data.nations = structures.nations.Nations()
+
+    def load_leagues(self):
+        data.leagues = structures.leagues.Leagues(self.season)
+
+    def load_referees(self):
+        data.referees = structures.referees.Referees(self.season)
+
+    def load_stadiums(self):
+        data.stadiums = structures.stadiums.Stadiums(self.season)
+
+    def load_clubs(self):
+        data.clubs = structures.clubs.Clubs(self.season)
+
+    def load_players(self):
+        data.players = structures.players.Players(self.season)
+
+    def get_timings(self):
+        '''
+        Return phase names with load time in seconds.
+        '''
+        return self.timings.items()
+
+    def get_total_time(self):
+        '''
+        Return total load time across all phases in seconds.
+        '''
+        return sum(self.timings.values())
@@ -21,273 +21,335 @@ import random
 import data
 
 
-class Team:
-    def __init__(self, fixture):
-        self.fixture = fixture
+def get_weights(fixtures):
+    '''
+    Return home and away skill weights for each fixture, read from the
+    player table skill columns in a single pass over the fixtures.  The
+    weight is the skill total of the last selected player in the team.
+    '''
+    columns = data.players.get_skill_columns()
+    weights = []
+
+    for fixture in fixtures:
+        for club in (fixture.home.club, fixture.away.club):
+            weight = 1
 
-    def set_team_selection(self):
-        '''
-        Set team selection for match into fixture object.
-        '''
-        club = self.fixture.home.club
-        self.fixture.home.team_selection[0] = club.squad.teamselection.team
-        self.fixture.home.team_selection[1] = club.squad.teamselection.subs
+            for player in club.squad.teamselection.team:
+                if player:
+                    weight = sum(column[player.row] for column in columns)
 
-        club = self.fixture.away.club
-        self.fixture.away.team_selection[0] = club.squad.teamselection.team
-        self.fixture.away.team_selection[1] = club.squad.teamselection.subs
+            weights.append(weight)
 
+    return list(zip(weights[0::2], weights[1::2]))
 
-class Score:
-    def __init__(self, fixture):
-        self.fixture = fixture
 
-        self.calculate_skills()
+def get_home_advantage(club):
+    '''
+    Return home advantage points from form of given club.
+    '''
+    form = club.form.get_form_for_length(6)
 
-    def calculate_skills(self):
-        '''
-        Calculate player scores for team selection from skill attributes.
-        '''
-        self.weights = [1, 1] #0, 0
+    return form.count("W") * 3 + form.count("D") - form.count("L")
 
-        for count, club in enumerate((self.fixture.home.club,
-                                      self.fixture.away.club)):
-            for player in club.squad.teamselection.team:
-                if player:
-                    self.weights[count] = sum(player.get_skills())
 
-        self.total = sum(self.weights)
+def get_percentages(fixture, weights):
+    '''
+    Return home and away percentage chance for fixture with given weights.
+    '''
+    home, away = weights
+    total = home + away
 
-        self.calculate_percentages()
+    percent1 = (home / total + get_home_advantage(fixture.home.club)) * 100
+    percent1 = (percent1 * 0.05) * fixture.home.club.reputation
 
-    def home_advantage(self):
-        '''
-        Determine home advantage score based on form and fan morale.
-        '''
-        points = 0
+    percent2 = (home / total) * 100
+    percent2 = (percent2 * 0.05) * fixture.away.club.reputation
 
-        for item in self.fixture.home.club.form.get_form_for_length(6):
-            if item == "W":
-                points += 3
-            elif item == "D":
-                points += 1
-            elif item == "L":
-                points -= 1
+    return round(percent1), round(percent2)
 
-        return points
 
-    def calculate_percentages(self):
-        '''
-        Determine percentage chance of win, loss, and draw for each team.
-        '''
-        percent1 = ((self.weights[0] / self.total) + self.home_advantage()) * 100
-        percent1 = (percent1 * 0.05) * self.fixture.home.club.reputation
-        self.percent1 = round(percent1)
+def get_ranges(percent1, percent2):
+    '''
+    Return upper bounds of win, draw and loss ranges for given percentages.
+    '''
+    draw = abs(percent1 - percent2)
 
-        percent2 = (self.weights[0] / self.total) * 100
-        percent2 = (percent2 * 0.05) * self.fixture.away.club.reputation
-        self.percent2 = round(percent2)
+    bounds = (percent1, percent1 + draw, percent1 + draw + percent2)
 
-        self.determine_result()
+    if bounds == (0, 0, 0):
+        bounds = (2, 4, 6)
 
-    def determine_result(self):
-        '''
-        Produce final result for match.
-        '''
-        if self.percent1 > self.percent2:
-            draw = self.percent1 - self.percent2
-        elif self.percent1 < self.percent2:
-            draw = self.percent2 - self.percent1
-        else:
-            draw = 0
-
-        ranges = [[], [], []]
-        ranges[0] = [0, self.percent1]
-        ranges[1] = [ranges[0][1], self.percent1 + draw]
-        ranges[2] = [ranges[1][1], ranges[1][1] + self.percent2]
-
-        if ranges == [[0, 0], [0, 0], [0, 0]]:
-            ranges = [[1, 2], [3, 4], [5, 6]]
-
-        [list(map(int, item)) for item in ranges]
-
-        choice = random.randrange(0, int(ranges[2][1]))
-
-        if choice < ranges[0][1]:
-            score = self.generate_goals()
-        elif choice < ranges[1][1]:
-            score = self.generate_goals()
-            score = score[0], score[0]
-        elif choice < ranges[2][1]:
-            score = self.generate_goals()
-            score = score[1], score[0]
+    return bounds
 
-        self.fixture.result = score
 
-        substitutes = Substitutes(self.fixture.home)
-        substitutes.generate_substitutes()
+def generate_goals(club):
+    '''
+    Generate goals scored for both teams.
+    '''
+    score1 = 1
 
-        injuries = Injuries(self.fixture.home)
-        injuries.generate_injuries()
+    start = (35, 50, 65)[club.tactics.playing_style]
 
-        substitutes = Substitutes(self.fixture.away)
-        substitutes.generate_substitutes()
+    for x in range(2, 9):
+        if random.randint(0, 100) < start:
+            score1 += 1
+            start = max(int(start * 0.5), 1)
 
-        injuries = Injuries(self.fixture.away)
-        injuries.generate_injuries()
+    score2 = random.randint(0, score1 - 1)
 
-        goalscorers = Goalscorers(self.fixture.home.club, score[0])
-        self.fixture.home.goalscorers = goalscorers.generate_goalscorers()
+    return score1, score2
 
-        goalscorers = Goalscorers(self.fixture.away.club, score[1])
-        self.fixture.away.goalscorers = goalscorers.generate_goalscorers()
 
-    def generate_goals(self):
-        '''
-        Generate goals scored for both teams.
-        '''
-        score1 = 1
+def generate_result(fixture, percentages):
+    '''
+    Return final score for fixture with given home and away percentages.
+    '''
+    win, draw, loss = get_ranges(*percentages)
 
-        club = self.fixture.home.club
+    choice = random.randrange(0, int(loss))
+    score = generate_goals(fixture.home.club)
 
-        if club.tactics.playing_style == 0:
-            start = 35
-        elif club.tactics.playing_style == 1:
-            start = 50
-        elif club.tactics.playing_style == 2:
-            start = 65
+    if choice < win:
+        return score
+    elif choice < draw:
+        return score[0], score[0]
+    else:
+        return score[1], score[0]
 
-        for x in range(2, 9):
-            if random.randint(0, 100) < start:
-                score1 += 1
-                start = int(start * 0.5)
 
-                if start < 1:
-                    start = 1
+def generate_substitutes(fixtureteam):
+    '''
+    Choose substitutes brought on for given fixture team.
+    '''
+    substitutes = list(fixtureteam.club.squad.teamselection.subs)
 
-        score2 = random.randint(0, score1 - 1)
+    if len(substitutes) >= 3:
+        choice = random.randint(0, 3)
+    else:
+        choice = random.randint(0, len(substitutes))
 
-        return score1, score2
+    selected = []
 
+    for count in range(0, choice):
+        player = substitutes[count]
+        selected.append(player)
+        substitutes.remove(player)
 
-class Substitutes:
-    def __init__(self, fixtureteam):
-        self.fixtureteam = fixtureteam
+    fixtureteam.team_played[1] = selected
 
-    def generate_substitutes(self):
-        if len(self.fixtureteam.club.squad.teamselection.subs) >= 3:
-            choice = random.randint(0, 3)
-        else:
-            choice = random.randint(0, len(self.fixtureteam.club.squad.teamselection.subs))
 
-        substitutes = [player for player in self.fixtureteam.club.squad.teamselection.subs]
-        selected = []
+def generate_injury(fixtureteam):
+    '''
+    Injure player chosen from matchday team selection of fixture team.
+    '''
+    selection = []
 
-        for count in range(0, choice):
-            player = substitutes[count]
-            selected.append(player)
-            substitutes.remove(player)
+    for player in fixtureteam.club.squad.teamselection.team:
+        if player:
+            selection.append(player)
 
-        self.fixtureteam.team_played[1] = selected
+            if player.injury.fitness > 100:
+                value = int((100 - player.injury.fitness) % 4)
 
+                for count in range(0, value):
+                    selection.append(player)
 
-class Goalscorers:
-    def __init__(self, club, score):
-        self.club = club
-        self.score = score
+    if not selection:
+        return
 
-    def calculate_score(self, player):
-        '''
-        Determine chance of goalscorer.
-        '''
-        maximum = 0
+    random.shuffle(selection)
+
+    player = random.choice(selection)
+
+    injury = data.injuries.get_random_injury()
+
+    player.injury.injuryid = injury.injuryid
+    player.injury.period = random.randint(injury.period[0], injury.period[1])
+    player.injury.fitness -= random.randint(injury.impact[0], injury.impact[1])
+    player.set_changed()
+
+    if player.club is data.user.club:
+        data.user.club.news.publish("IN02",
+                                    player=player.get_name(mode=1),
+                                    weeks=player.injury.period,
+                                    injury=player.injury.get_injury_name())
+
+
+def get_goal_weight(player):
+    '''
+    Determine chance of given player scoring.
+    '''
+    maximum = 0
+
+    if player.position == "GK":
+        maximum = 1
+    elif player.position in ("DL", "DR", "DC", "D"):
+        maximum = player.tackling
+    elif player.position in ("ML", "MR", "MC", "M"):
+        maximum = player.passing * 2.5
+    elif player.position in ("AS", "AF"):
+        maximum = player.shooting * 5
+
+    return maximum
+
+
+def get_cumulative_weights(teamselection):
+    '''
+    Return players and cumulative goal weights for team selection, cached
+    until the selected team changes or the squad ratings are cleared.
+    '''
+    team = teamselection.get_team_selection()
+
+    if teamselection.goalscorers is None or teamselection.goalscorers[0] != team:
+        players = []
+        cumulative = []
+        total = 0
+
+        for player in team:
+            if player:
+                total += int(get_goal_weight(player))
+
+                players.append(player)
+                cumulative.append(total)
 
-        if player.position == "GK":
-            maximum = 1
-        elif player.position in ("DL", "DR", "DC", "D"):
-            maximum = player.tackling
-        elif player.position in ("ML", "MR", "MC", "M"):
-            maximum = player.passing * 2.5
-        elif player.position in ("AS", "AF"):
-            maximum = player.shooting * 5
+        teamselection.goalscorers = list(team), players, cumulative
 
-        return maximum
+    return teamselection.goalscorers[1:]
 
-    def generate_goalscorers(self):
+
+def generate_goalscorers(club, score):
+    '''
+    Return goalscorers for given number of goals scored by club.
+    '''
+    if score > 0:
+        players, cumulative = get_cumulative_weights(club.squad.teamselection)
+
+        if cumulative and cumulative[-1] > 0:
+            return random.choices(players, cum_weights=cumulative, k=score)
+
+        return []
+
+    return None
+
+
+class Team:
+    def __init__(self, fixture):
+        self.fixture = fixture
+
+    def set_team_selection(self):
         '''
-        Return goalscorer object for goals.
+        Set team selection for match into fixture object.
         '''
-        if self.score > 0:
-            goalscorers = []
+        club = self.fixture.home.club
+        self.fixture.home.team_selection[0] = club.squad.teamselection.team
+        self.fixture.home.team_selection[1] = club.squad.teamselection.subs
+
+        club = self.fixture.away.club
+        self.fixture.away.team_selection[0] = club.squad.teamselection.team
+        self.fixture.away.team_selection[1] = club.squad.teamselection.subs
 
-            for count in range(0, self.score):
-                scores = []
 
-                for player in self.club.squad.teamselection.get_team_selection():
-                    if player:
-                        maximum = self.calculate_score(player)
+class Computer:
+    '''
+    Play fixtures between clubs with computer-generated team selections.
+    '''
+    def __init__(self, fixtures):
+        self.fixtures = fixtures
 
-                        for count in range(0, int(maximum)):
-                            scores.append(player)
+    def play_fixtures(self):
+        '''
+        Generate squads, results and standings updates for the fixtures.
+        '''
+        for fixture in self.fixtures:
+            fixture.home.club.squad.generate_squad()
+            fixture.away.club.squad.generate_squad()
 
-                random.shuffle(scores)
+            team = Team(fixture)
+            team.set_team_selection()
 
-                goalscorer = random.choice(scores)
-                goalscorers.append(goalscorer)
+        batch = Batch(self.fixtures)
+        batch.generate_results()
 
-            return goalscorers
+        for fixture in self.fixtures:
+            fixture.league.standings.update_standing(fixture)
 
-        return None
+            data.events.process_end_of_match_events(fixture)
 
 
-class Assisters:
-    def __init__(self, club):
-        self.club = club
+class Batch:
+    '''
+    Generate results for a list of fixtures in a single pass, using the
+    same probability model as the score object.
+    '''
+    def __init__(self, fixtures):
+        self.fixtures = fixtures
 
-    def get_assister(self, goalscorer):
+    def generate_results(self):
         '''
-        Get assister for passed goalscorer.
+        Produce final results, substitutes, injuries and goalscorers.
         '''
-        players = [player for player in self.club.squad.teamselection.get_team_selection() if player]
+        weights = get_weights(self.fixtures)
 
-        return random.choice(players)
+        for fixture, weight in zip(self.fixtures, weights):
+            fixture.result = generate_result(fixture, get_percentages(fixture, weight))
+
+        fixtureteams = [fixtureteam for fixture in self.fixtures
+                        for fixtureteam in (fixture.home, fixture.away)]
+
+        for fixtureteam in fixtureteams:
+            generate_substitutes(fixtureteam)
+
+        injured = [fixtureteam for fixtureteam in fixtureteams
+                   if random.randint(0, 100) < 20]
 
+        for fixtureteam in injured:
+            generate_injury(fixtureteam)
 
-class Injuries:
+        for fixture in self.fixtures:
+            fixture.home.goalscorers = generate_goalscorers(fixture.home.club, fixture.result[0])
+            fixture.away.goalscorers = generate_goalscorers(fixture.away.club, fixture.result[1])
+
+
+class Score:
+    '''
+    Generate result for a single fixture played by the user.
+    '''
     def __init__(self, fixture):
         self.fixture = fixture
 
-    def generate_injuries(self):
+        self.weights = get_weights((fixture,))[0]
+        self.percent1, self.percent2 = get_percentages(fixture, self.weights)
+
+        self.determine_result()
+
+    def determine_result(self):
         '''
-        Generate injuries from matchday team selection.
+        Produce final result, substitutes, injuries and goalscorers.
         '''
-        if random.randint(0, 100) < 20:
-            selection = []
-
-            for player in self.fixture.club.squad.teamselection.team:
-                selection.append(player)
+        score = generate_result(self.fixture, (self.percent1, self.percent2))
+        self.fixture.result = score
 
-                if player.injury.fitness > 100:
-                    value = int((100 - player.injury.fitness) % 4)
+        for fixtureteam in (self.fixture.home, self.fixture.away):
+            generate_substitutes(fixtureteam)
 
-                    for count in range(0, value):
-                        selection.append(player)
+            if random.randint(0, 100) < 20:
+                generate_injury(fixtureteam)
 
-            random.shuffle(selection)
+        self.fixture.home.goalscorers = generate_goalscorers(self.fixture.home.club, score[0])
+        self.fixture.away.goalscorers = generate_goalscorers(self.fixture.away.club, score[1])
 
-            player = random.choice(selection)
 
-            injury = data.injuries.get_random_injury()
+class Assisters:
+    def __init__(self, club):
+        self.club = club
 
-            player.injury.injuryid = injury.injuryid
-            player.injury.period = random.randint(injury.period[0], injury.period[1])
-            player.injury.fitness -= random.randint(injury.impact[0], injury.impact[1])
+    def get_assister(self, goalscorer):
+        '''
+        Get assister for passed goalscorer.
+        '''
+        players = [player for player in self.club.squad.teamselection.get_team_selection() if player]
 
-            if player.club is data.user.club:
-                data.user.club.news.publish("IN02",
-                                            player=player.get_name(mode=1),
-                                            weeks=player.injury.period,
-                                            injury=player.injury.get_injury_name())
+        return random.choice(players)
 
 
 class Cards:
@@ -21,18 +21,10 @@ import data
 
 class Merchandise:
     def __init__(self):
-        self.merchandise = []
-
-        self.populate_data()
+        self.merchandise = data.reference.get_merchandise()
 
     def get_merchandise(self):
         '''
         Return list of merchandise items.
         '''
         return self.merchandise
-
-    def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM merchandise")
-
-        for item in data.database.cursor.fetchall():
-            self.merchandise.append(item)
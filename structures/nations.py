@@ -85,7 +85,7 @@ class Nations:
         return self.nations.items()
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM nation")
+        data.database.cursor.execute("SELECT id, name, denonym FROM nation")
 
         for item in data.database.cursor.fetchall():
             nation = self.Nation()
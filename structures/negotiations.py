@@ -19,7 +19,6 @@
 import random
 
 import data
-import uigtk.negotiations
 
 
 class TransferStatus:
@@ -79,6 +78,8 @@ class Negotiations:
         '''
         Return whether the given player id is already in transfer negotiations.
         '''
+        import uigtk.negotiations
+
         status = False
 
         for negotiation in self.negotiations.values():
@@ -158,6 +159,8 @@ class Negotiations:
         '''
         Create purchase transfer negotiation object.
         '''
+        import uigtk.negotiations
+
         if not self.get_player_in_negotiations(player):
             if player.club:
                 dialog = uigtk.negotiations.PurchaseEnquiry()
@@ -183,6 +186,8 @@ class Negotiations:
         '''
         Create loan transfer negotiation object.
         '''
+        import uigtk.negotiations
+
         if not self.get_player_in_negotiations(player):
             dialog = uigtk.negotiations.LoanEnquiry()
 
@@ -280,6 +285,8 @@ class PurchaseNegotiation(Negotiation):
         '''
         Handle response for purchase transfer types.
         '''
+        import uigtk.negotiations
+
         if self.statusid == 1:
             uigtk.negotiations.EnquiryRejection(self)
             data.negotiations.end_negotiation(self)
@@ -398,6 +405,8 @@ class LoanNegotiation(Negotiation):
         '''
         Handle response for loan transfer types.
         '''
+        import uigtk.negotiations
+
         if self.statusid == 1:
             uigtk.negotiations.EnquiryRejection(self)
             data.negotiations.end_negotiation(self)
@@ -464,6 +473,8 @@ class FreeNegotiation(Negotiation):
         '''
         Handle response for free transfer types.
         '''
+        import uigtk.negotiations
+
         if self.statusid == 9:
             uigtk.negotiations.EnquiryRejection(self)
             data.negotiations.end_negotiation(self)
@@ -16,37 +16,102 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
-import os
 import random
-import xml.dom.minidom
 
 import data
 
 
 class News:
     def __init__(self):
-        self.news = {}
+        self.news = data.reference.get_news()
         self.articles = {}
+        self.changed = set()
 
         self.newsid = 0
-
-        self.populate_news()
+        self.unread = 0
+        self.season = 0
 
     def publish(self, newsid, **kwargs):
         '''
         Publish news article for given id with passed dynamic values.
         '''
         article = Article(newsid, kwargs)
-        article.newsid = self.get_newsid()
-        self.articles[article.newsid] = article
+        article.season = self.season
+        self.add_article(self.get_newsid(), article)
+
+    def add_article(self, newsid, article):
+        '''
+        Add article under given news id and update unread count.
+        '''
+        article.newsid = newsid
+        self.articles[newsid] = article
+        self.changed.add(newsid)
 
-        data.window.mainscreen.information.update_news_visible()
+        if article.unread:
+            self.unread += 1
+
+            if self.unread == 1 and data.window and self is data.user.club.news:
+                data.window.refresh.queue(data.window.mainscreen.information.update_news_visible)
+
+    def remove_article(self, newsid):
+        '''
+        Remove article for given news id and update unread count.
+        '''
+        article = self.articles.pop(newsid, None)
+        self.changed.add(newsid)
+
+        if article and article.unread:
+            self.unread -= 1
+
+    def set_unread(self, newsid, unread):
+        '''
+        Mark article for given news id as read or unread.
+        '''
+        article = self.articles[newsid]
+
+        if article.unread != unread:
+            article.unread = unread
+            self.changed.add(newsid)
+
+            if unread:
+                self.unread += 1
+            else:
+                self.unread -= 1
+
+    def replace_name(self, previous, name):
+        '''
+        Replace previous manager name in every article.
+        '''
+        for newsid, article in self.articles.items():
+            article.replace_name(previous, name)
+            self.changed.add(newsid)
+
+    def clear_articles(self):
+        '''
+        Remove all articles.
+        '''
+        self.changed.update(self.articles)
+        self.articles.clear()
+        self.unread = 0
+
+    def end_season(self, retention):
+        '''
+        Start new season and remove articles published more than the given
+        number of seasons ago.
+        '''
+        self.season += 1
+
+        expired = [newsid for newsid, article in self.articles.items()
+                   if article.season < self.season - retention]
+
+        for newsid in expired:
+            self.remove_article(newsid)
 
     def get_unread_count(self):
         '''
         Return the number of unread articles.
         '''
-        return sum(1 for article in self.articles.values() if article.unread)
+        return self.unread
 
     def get_newsid(self):
         '''
@@ -56,43 +121,83 @@ class News:
 
         return self.newsid
 
-    def populate_news(self):
-        filepath = os.path.join("resources", "news.xml")
-        news = xml.dom.minidom.parse(filepath)
-
-        for item in news.getElementsByTagName("article"):
-            newsid = item.getAttribute("id")
-
-            title = item.getElementsByTagName("title")[0]
-            title = title.firstChild.data
-            message = item.getElementsByTagName("message")[0]
-            message = message.firstChild.data
-            category = item.getElementsByTagName("category")[0]
-            category = category.firstChild.data
-
-            if newsid in self.news.keys():
-                self.news[newsid].append([title, message, category])
-            else:
-                self.news[newsid] = [[title, message, category]]
-
 
 class Article:
+    '''
+    Article stored as template and values, with text substituted when it is
+    first displayed.
+    '''
     def __init__(self, newsid, kwargs):
-        item = random.choice(data.user.club.news.news[newsid])
+        self.item = random.choice(data.user.club.news.news[newsid])
 
         self.date = data.date.get_date_as_string()
-        self.title = item[0]
-        self.message = item[1]
-        self.category = int(item[2])
+        self.category = int(self.item[2])
         self.unread = True
 
-        keys = Keys(kwargs)
+        self.kwargs = kwargs
+        self.kwargs["season"] = data.date.get_season()
+
+        self.text = None
+
+    def get_text(self):
+        '''
+        Return title and message, substituting keys on first use.
+        '''
+        if self.text is None:
+            title, message = self.item[0], self.item[1]
+
+            keys = Keys(self.kwargs)
+
+            for key, value in keys.get_keys():
+                if value:
+                    value = str(value)
+                    title = title.replace(key, value)
+                    message = message.replace(key, value)
+
+            self.text = title, message
+
+        return self.text
+
+    def get_title(self):
+        '''
+        Return substituted article title.
+        '''
+        return self.get_text()[0]
+
+    def get_message(self):
+        '''
+        Return substituted article message.
+        '''
+        return self.get_text()[1]
+
+    title = property(get_title)
+    message = property(get_message)
+
+    def replace_name(self, previous, name):
+        '''
+        Discard substituted text so the new manager name is used.
+        '''
+        self.text = None
+
 
-        for key, value in keys.get_keys():
-            if value:
-                value = str(value)
-                self.title = self.title.replace(key, value)
-                self.message = self.message.replace(key, value)
+class StoredArticle:
+    '''
+    Article restored from a saved game with its text already substituted.
+    '''
+    def __init__(self, date, title, message, category, unread, season):
+        self.date = date
+        self.title = title
+        self.message = message
+        self.category = category
+        self.unread = unread
+        self.season = season
+
+    def replace_name(self, previous, name):
+        '''
+        Replace previous manager name in the article text.
+        '''
+        self.title = self.title.replace(previous, name)
+        self.message = self.message.replace(previous, name)
 
 
 class Keys:
@@ -103,7 +208,7 @@ class Keys:
         self.keys = {"_CLUB_": data.user.club.name,
                      "_USER_": data.user.club.manager,
                      "_CHAIRMAN_": data.user.club.chairman,
-                     "_SEASON_": data.date.get_season(),
+                     "_SEASON_": kwargs.get("season"),
                      "_FIXTURE1_": kwargs.get("fixture1"),
                      "_FIXTURE2_": kwargs.get("fixture2"),
                      "_FIXTURE3_": kwargs.get("fixture3"),
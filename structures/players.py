@@ -16,19 +16,94 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import array
 import random
 
 import data
 import structures.contract
 import structures.morale
+import structures.playertable
+import structures.pricing
 import structures.value
 import structures.wage
 
 
+def get_skill_property(name):
+    '''
+    Return player table column property which has the owning players object
+    update values derived from skills when changed.
+    '''
+    column = structures.playertable.get_column_property(name)
+
+    def set_skill(player, value):
+        column.fset(player, value)
+        player.players.update_skills(player)
+
+    return property(column.fget, set_skill)
+
+
+def get_fitness_property():
+    '''
+    Return player table fitness property which has the owning players object
+    track players below full fitness.
+    '''
+    column = structures.playertable.get_column_property("fitness")
+
+    def set_fitness(player, fitness):
+        column.fset(player, fitness)
+        player.players.set_fit(player, fitness == 100)
+
+    return property(column.fget, set_fitness)
+
+
 class Players:
     class Player:
-        def __init__(self, playerid):
+        '''
+        Player view over a row of the player table, with less frequently
+        changed details held on the object itself.
+        '''
+        __slots__ = ("playerid",
+                     "players",
+                     "table",
+                     "row",
+                     "first_name",
+                     "second_name",
+                     "common_name",
+                     "date_of_birth",
+                     "nationality",
+                     "value",
+                     "wage",
+                     "contract",
+                     "not_for_sale",
+                     "man_of_the_match",
+                     "rating",
+                     "injury",
+                     "suspension",
+                     "training",
+                     "history",
+                     "retiring")
+
+        keeping = get_skill_property("keeping")
+        tackling = get_skill_property("tackling")
+        passing = get_skill_property("passing")
+        shooting = get_skill_property("shooting")
+        heading = get_skill_property("heading")
+        pace = get_skill_property("pace")
+        stamina = get_skill_property("stamina")
+        ball_control = get_skill_property("ball_control")
+        set_pieces = get_skill_property("set_pieces")
+        training_value = structures.playertable.get_column_property("training_value")
+        fitness = get_fitness_property()
+        morale = structures.playertable.get_column_property("morale")
+        appearances = structures.playertable.get_column_property("appearances")
+        substitute = structures.playertable.get_column_property("substitute")
+
+        def __init__(self, playerid, players):
             self.playerid = playerid
+            self.players = players
+            self.table = players.table
+            self.row = self.table.add_row()
+            self.value = None
             self.first_name = ""
             self.second_name = ""
             self.common_name = None
@@ -37,29 +112,61 @@ class Players:
             self.nationality = None
             self.position = ""
             self.morale = 20
-            self.keeping = 0
-            self.tackling = 0
-            self.passing = 0
-            self.shooting = 0
-            self.heading = 0
-            self.pace = 0
-            self.stamina = 0
-            self.set_pieces = 0
-            self.ball_control = 0
-            self.value = None
+            self.fitness = 100
             self.wage = None
             self.contract = None
             self.not_for_sale = False
-            self.appearances = 0
-            self.substitute = 0
             self.man_of_the_match = 0
             self.rating = Rating()
-            self.injury = Injury()
+            self.injury = Injury(self)
             self.suspension = Suspension()
             self.training = Training()
             self.history = History(self)
             self.retiring = False
 
+        def get_club(self):
+            '''
+            Return club object for stored club id, or None if without club.
+            '''
+            return data.clubs.clubs.get(self.table.columns["club"][self.row])
+
+        def set_club(self, club):
+            '''
+            Store club id for passed club object, or zero if without club.
+            '''
+            self.table.set_value("club", self.row, club.clubid if club else 0)
+            self.players.increment_generation()
+
+        club = property(get_club, set_club)
+
+        def get_position(self):
+            '''
+            Return position string for stored position code.
+            '''
+            return structures.playertable.POSITIONS[self.table.columns["position"][self.row]]
+
+        def set_position(self, position):
+            '''
+            Store position code for passed position string.
+            '''
+            self.table.set_value("position", self.row, structures.playertable.POSITIONS.index(position))
+            self.players.update_skills(self)
+
+        position = property(get_position, set_position)
+
+        def set_changed(self):
+            '''
+            Mark player as changed after writing details held on the object.
+            '''
+            self.table.changed.add(self.row)
+            self.players.increment_generation()
+
+        def get_position_code(self):
+            '''
+            Return stored position code used for batch calculations.
+            '''
+            return self.table.columns["position"][self.row]
+
         def get_name(self, mode=0):
             '''
             Return player name for display.
@@ -140,6 +247,16 @@ class Players:
         self.players = {}
         self.season = season
 
+        self.rows = []
+        self.unfit = set()
+        self.injured = set()
+
+        self.table = structures.playertable.PlayerTable()
+        self.averages = Averages(self)
+
+        self.loaded = False
+        self.generation = 0
+
         self.populate_data()
 
     def get_players(self):
@@ -154,6 +271,100 @@ class Players:
         '''
         return self.players[playerid]
 
+    def get_player_by_row(self, row):
+        '''
+        Return player for given player table row.
+        '''
+        return self.rows[row]
+
+    def update_skills(self, player):
+        '''
+        Update values derived from skills or position of given player once
+        all players have been loaded.
+        '''
+        if self.loaded:
+            player.value.set_stale()
+            self.averages.update_player(player)
+            self.increment_generation()
+
+            if player.club:
+                player.club.squad.clear_ratings()
+
+    def increment_generation(self):
+        '''
+        Record that player details shown in listings may have changed.
+        '''
+        self.generation += 1
+
+    def set_fit(self, player, fit):
+        '''
+        Track whether given player is below full fitness.
+        '''
+        if fit:
+            self.unfit.discard(player.playerid)
+        else:
+            self.unfit.add(player.playerid)
+
+    def set_injured(self, player, injured):
+        '''
+        Track whether given player is injured.
+        '''
+        if injured:
+            self.injured.add(player.playerid)
+        else:
+            self.injured.discard(player.playerid)
+
+    def get_skill_columns(self):
+        '''
+        Return player table skill columns in the order of get_skills().
+        '''
+        names = ("keeping",
+                 "tackling",
+                 "passing",
+                 "shooting",
+                 "heading",
+                 "pace",
+                 "stamina",
+                 "set_pieces",
+                 "ball_control")
+
+        return [self.table.get_column(name) for name in names]
+
+    def get_ages(self):
+        '''
+        Return list of player ages in player table row order.
+        '''
+        ages = [0] * self.table.get_row_count()
+        date = data.date.month, data.date.day
+
+        for player in self.players.values():
+            year, month, day = player.date_of_birth
+            ages[player.row] = data.date.year - year - (date < (month, day))
+
+        return ages
+
+    def value_all(self):
+        '''
+        Recalculate cached value of every player in a single pass.
+        '''
+        ages = self.get_ages()
+        values = structures.pricing.get_values(self.get_skill_columns(),
+                                               self.table.get_column("position"),
+                                               ages)
+
+        for player in self.players.values():
+            player.value.value = values[player.row]
+            player.value.age = ages[player.row]
+
+        self.increment_generation()
+
+    def get_wages(self):
+        '''
+        Return array of calculated wages in player table row order.
+        '''
+        return structures.pricing.get_wages(self.get_skill_columns(),
+                                            self.table.get_column("position"))
+
     def update_contracts(self):
         '''
         Update contract period of players.
@@ -162,52 +373,127 @@ class Players:
             player.contract.decrement_contract_period()
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM player \
+        data.database.cursor.execute("SELECT player.id, firstname, secondname, \
+                                     commonname, dateofbirth, nation, club, \
+                                     position, keeping, tackling, passing, \
+                                     shooting, heading, pace, stamina, \
+                                     ballcontrol, setpieces, training \
+                                     FROM player \
                                      JOIN playerattr \
                                      ON player.id = playerattr.player \
-                                     WHERE year = ?",
-                                     (self.season,))
+                                     WHERE year = ? \
+                                     AND club IN (SELECT club FROM clubattr \
+                                                  WHERE year = ?)",
+                                     (self.season, self.season))
+
+        clubs = data.clubs.clubs
+        nations = data.nations.nations
 
         for item in data.database.cursor.fetchall():
-            if item[9] in data.clubs.get_club_keys():
-                player = self.Player(item[0])
-                self.players[player.playerid] = player
+            player = self.Player(item[0], self)
+            self.players[player.playerid] = player
+            self.rows.append(player)
+
+            player.first_name = item[1]
+            player.second_name = item[2]
+
+            if item[3] != "":
+                player.common_name = item[3]
+
+            player.date_of_birth = list(map(int, item[4].split("-")))
+            player.position = item[7]
 
-                player.first_name = item[1]
-                player.second_name = item[2]
+            (player.keeping,
+             player.tackling,
+             player.passing,
+             player.shooting,
+             player.heading,
+             player.pace,
+             player.stamina,
+             player.ball_control,
+             player.set_pieces,
+             player.training_value) = item[8:18]
 
-                if item[3] != "":
-                    player.common_name = item[3]
+            # Add player to squad
+            player.club = clubs[item[6]]
+            player.club.squad.add_to_squad(player)
 
-                player.date_of_birth = list(map(int, item[4].split("-")))
-                player.position = item[10]
+            # Add player to nation
+            player.nationality = nations[item[5]]
+            player.nationality.add_to_nation(player)
 
-                player.keeping = item[11]
-                player.tackling = item[12]
-                player.passing = item[13]
-                player.shooting = item[14]
-                player.heading = item[15]
-                player.pace = item[16]
-                player.stamina = item[17]
-                player.ball_control = item[18]
-                player.set_pieces = item[19]
-                player.training_value = item[20]
+            player.value = structures.value.Value(player)
 
-                # Add player to squad
-                player.club = data.clubs.get_club_by_id(item[9])
-                player.club.squad.add_to_squad(player)
+        # Set value, wage and contract values from batch calculation
+        self.value_all()
+        wages = self.get_wages()
 
-                # Add player to nation
-                player.nationality = data.nations.get_nation_by_id(item[5])
-                player.nationality.add_to_nation(player)
+        for player in self.players.values():
+            player.wage = structures.wage.Wage(player, wages[player.row])
+            player.contract = structures.contract.Contract(player)
 
-                # Set value, wage and contract values
-                player.value = structures.value.Value(player)
-                player.wage = structures.wage.Wage(player)
-                player.contract = structures.contract.Contract(player)
+        self.averages.update_all()
+
+        self.loaded = True
+
+
+class Averages:
+    '''
+    Running totals of weighted skill averages for each position, updated
+    as player skills and positions change.
+    '''
+    def __init__(self, players):
+        self.players = players
+
+        self.weights = array.array("q")
+        self.positions = array.array("B")
+        self.totals = [0] * len(structures.playertable.POSITIONS)
+        self.counts = [0] * len(structures.playertable.POSITIONS)
+
+    def get_weight(self, skills):
+        '''
+        Return weighted skill sum scaled by ten so that totals stay exact.
+        '''
+        return sum(skills[0:6]) * 10 + skills[8] * 15 + skills[5] * 2 + skills[6] * 2 + skills[7] * 15
+
+    def update_all(self):
+        '''
+        Rebuild totals for every player from the player table columns.
+        '''
+        self.weights = array.array("q", map(self.get_weight, zip(*self.players.get_skill_columns())))
+        self.positions = array.array("B", self.players.table.get_column("position"))
+        self.totals = [0] * len(structures.playertable.POSITIONS)
+        self.counts = [0] * len(structures.playertable.POSITIONS)
+
+        for weight, position in zip(self.weights, self.positions):
+            self.totals[position] += weight
+            self.counts[position] += 1
+
+    def update_player(self, player):
+        '''
+        Replace the contribution of given player after a change.
+        '''
+        weight = self.get_weight(player.get_skills())
+        position = player.get_position_code()
+
+        self.totals[self.positions[player.row]] -= self.weights[player.row]
+        self.counts[self.positions[player.row]] -= 1
+        self.totals[position] += weight
+        self.counts[position] += 1
+
+        self.weights[player.row] = weight
+        self.positions[player.row] = position
+
+    def get_average(self, position):
+        '''
+        Return mean weighted skill average of players in given position code.
+        '''
+        return self.totals[position] / (self.counts[position] * 90)
 
 
 class Rating:
+    __slots__ = ("rating",)
+
     def __init__(self):
         self.rating = []
 
@@ -241,10 +527,42 @@ class Rating:
 
 
 class Injury:
-    def __init__(self):
+    __slots__ = ("player", "_injuryid", "period")
+
+    def __init__(self, player):
+        self.player = player
+
         self.injuryid = None
         self.period = 0
-        self.fitness = 100
+
+    def get_injuryid(self):
+        '''
+        Return id of current injury, or None if not injured.
+        '''
+        return self._injuryid
+
+    def set_injuryid(self, injuryid):
+        '''
+        Store id of current injury and track whether player is injured.
+        '''
+        self._injuryid = injuryid
+        self.player.players.set_injured(self.player, injuryid is not None)
+
+    injuryid = property(get_injuryid, set_injuryid)
+
+    def get_fitness(self):
+        '''
+        Return fitness value stored for the player.
+        '''
+        return self.player.fitness
+
+    def set_fitness(self, fitness):
+        '''
+        Store fitness value for the player.
+        '''
+        self.player.fitness = fitness
+
+    fitness = property(get_fitness, set_fitness)
 
     def set_injured(self, injury):
         '''
@@ -254,6 +572,8 @@ class Injury:
         self.period = random.randint(*injury.period)
         self.fitness -= random.randint(*injury.impact)
 
+        self.player.set_changed()
+
     def get_injured(self):
         '''
         Return whether player is currently injured.
@@ -285,6 +605,8 @@ class Injury:
 
 
 class Suspension:
+    __slots__ = ("suspensionid", "period")
+
     def __init__(self):
         self.suspensionid = None
         self.period = 0
@@ -369,6 +691,8 @@ class History:
         '''
         self.history.append(season)
 
+        self.player.set_changed()
+
     def get_history(self):
         '''
         Return history in descending order by season.
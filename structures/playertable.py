@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import array
+import mmap
+import os
+import struct
+import sys
+
+
+# Column names with array typecodes in file order
+COLUMNS = (("keeping", "h"),
+           ("tackling", "h"),
+           ("passing", "h"),
+           ("shooting", "h"),
+           ("heading", "h"),
+           ("pace", "h"),
+           ("stamina", "h"),
+           ("ball_control", "h"),
+           ("set_pieces", "h"),
+           ("training_value", "h"),
+           ("position", "B"),
+           ("club", "I"),
+           ("fitness", "h"),
+           ("morale", "h"),
+           ("contract", "h"),
+           ("appearances", "H"),
+           ("substitute", "H"))
+
+POSITIONS = ("", "GK", "DL", "DR", "DC", "D", "ML", "MR", "MC", "M", "AS", "AF")
+
+# File identifier, number of rows and tag of the matching saved game
+HEADER = struct.Struct("<4sII")
+MAGIC = b"OSMP"
+
+
+class PlayerTable:
+    '''
+    Columnar store of frequently changed player attributes indexed by row.
+    '''
+    def __init__(self):
+        self.columns = {name: array.array(typecode) for name, typecode in COLUMNS}
+        self.rows = 0
+
+        self.changed = set()
+
+        self.mapping = None
+
+    def add_row(self):
+        '''
+        Append zeroed row to each column and return its index.
+        '''
+        if self.mapping:
+            self.columns = {name: array.array(typecode, self.columns[name]) for name, typecode in COLUMNS}
+            self.mapping = None
+
+        for column in self.columns.values():
+            column.append(0)
+
+        self.rows += 1
+
+        return self.rows - 1
+
+    def set_value(self, name, row, value):
+        '''
+        Store value in named column at given row and mark row as changed.
+        '''
+        self.columns[name][row] = value
+        self.changed.add(row)
+
+    def get_column(self, name):
+        '''
+        Return column of values for given attribute name.
+        '''
+        return self.columns[name]
+
+    def get_row_count(self):
+        '''
+        Return number of rows in the table.
+        '''
+        return self.rows
+
+    def write(self, filepath, tag):
+        '''
+        Write each column in little-endian order to given filepath with tag
+        identifying the saved game.  The file is replaced rather than
+        rewritten so that a table currently mapped from it is left intact.
+        '''
+        temporary = "%s.tmp" % (filepath)
+
+        with open(temporary, "wb") as tablefile:
+            tablefile.write(HEADER.pack(MAGIC, self.rows, tag))
+
+            for name, typecode in COLUMNS:
+                column = array.array(typecode, self.columns[name])
+
+                if sys.byteorder == "big":
+                    column.byteswap()
+
+                tablefile.write(column.tobytes())
+
+        os.replace(temporary, filepath)
+
+    def map(self, filepath, tag):
+        '''
+        Map columns from given filepath, returning whether the file was
+        recognised, written with given tag and holds the same number of rows
+        as the table.  Changes are kept in memory and not written to the file.
+        '''
+        if os.path.getsize(filepath) < HEADER.size:
+            return False
+
+        with open(filepath, "rb") as tablefile:
+            mapping = mmap.mmap(tablefile.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, rows, filetag = HEADER.unpack_from(mapping)
+        size = sum(rows * array.array(typecode).itemsize for name, typecode in COLUMNS)
+
+        if (magic != MAGIC or filetag != tag or rows != self.rows or
+                len(mapping) < HEADER.size + size):
+            return False
+
+        view = memoryview(mapping)
+        offset = HEADER.size
+        columns = {}
+
+        for name, typecode in COLUMNS:
+            size = rows * array.array(typecode).itemsize
+            columns[name] = view[offset:offset + size].cast(typecode)
+            offset += size
+
+        # Mapped columns are only usable directly in native byte order
+        if sys.byteorder == "big":
+            for name, typecode in COLUMNS:
+                column = array.array(typecode, columns[name])
+                column.byteswap()
+                columns[name] = column
+
+        self.columns = columns
+        self.mapping = mapping
+
+        return True
+
+
+def get_column_property(name):
+    '''
+    Return property reading and writing named column at the view row.
+    '''
+    def get_value(view):
+        return view.table.columns[name][view.row]
+
+    def set_value(view, value):
+        view.table.set_value(name, view.row, value)
+
+    return property(get_value, set_value)
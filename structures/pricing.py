@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import array
+import bisect
+
+import structures.playertable
+
+
+# Index into skills tuple of primary skill for each position code
+PRIMARY = {structures.playertable.POSITIONS.index(position): index
+           for position, index in (("", 0), ("GK", 0),
+                                   ("DL", 1), ("DR", 1), ("DC", 1), ("D", 1),
+                                   ("ML", 2), ("MR", 2), ("MC", 2), ("M", 2),
+                                   ("AS", 3), ("AF", 3))}
+
+# Lower bounds of primary skill for each value multiplier
+VALUE_BOUNDS = (41, 51, 61, 71, 76, 81, 86, 90, 96)
+VALUE_MULTIPLIERS = (0.12, 0.25, 0.55, 0.9, 1.25, 1.5, 1.8, 2.5, 3.5, 5.25)
+
+# Lower bounds of age for each age multiplier
+AGE_BOUNDS = (18, 21, 24, 26, 29, 30, 32, 34, 37)
+AGE_MULTIPLIERS = (0.5, 0.7, 0.8, 0.9, 1, 0.9, 0.75, 0.5, 0.25, 0.1)
+
+# Lower bounds of primary skill for each wage divider and value multiplier
+WAGE_BOUNDS = (40, 50, 60, 70, 75, 80, 85, 90, 95)
+WAGE_DIVIDERS = (100, 100, 120, 140, 165, 195, 225, 255, 310, 390)
+WAGE_MULTIPLIERS = (0.12, 0.22, 0.35, 0.55, 0.75, 1, 1.25, 2, 3.25, 5)
+
+
+def get_weighted_sum(skills):
+    '''
+    Return weighted skill sum shared by value and wage calculations.
+    '''
+    return sum(skills[0:6]) + (skills[8] * 1.5) + (skills[5] * 0.2) + (skills[6] * 0.2) + (skills[7] * 1.5)
+
+
+def get_rounded_value(value):
+    '''
+    Round calculated player value to nearest divisor.
+    '''
+    if value >= 1000000:
+        divisor = 100000
+    else:
+        divisor = 1000
+
+    return int(value - (value % divisor))
+
+
+def get_rounded_wage(wage):
+    '''
+    Round calculated player wage to nearest divisor.
+    '''
+    if wage >= 10000:
+        divisor = 100
+    else:
+        divisor = 10
+
+    return int(wage - (wage % divisor))
+
+
+def get_value(skills, position, age):
+    '''
+    Return value for skills tuple, position code and age of a player.
+    '''
+    primary = skills[PRIMARY[position]]
+
+    average = (get_weighted_sum(skills) + primary * 2) / 9
+    value_multiplier = VALUE_MULTIPLIERS[bisect.bisect_right(VALUE_BOUNDS, primary)]
+    age_multiplier = AGE_MULTIPLIERS[bisect.bisect_right(AGE_BOUNDS, age)]
+
+    value = ((average * 1000) * average) * value_multiplier * 0.25
+    value = value * age_multiplier
+
+    return get_rounded_value(value)
+
+
+def get_wage(skills, position):
+    '''
+    Return wage for skills tuple and position code of a player.
+    '''
+    primary = skills[PRIMARY[position]]
+
+    average = (get_weighted_sum(skills) + primary) / 9
+    index = bisect.bisect_right(WAGE_BOUNDS, primary)
+
+    value = (((average * 1000) * average) * WAGE_MULTIPLIERS[index]) * 0.25
+    wage = value / WAGE_DIVIDERS[index]
+
+    return get_rounded_wage(wage)
+
+
+def get_values(columns, positions, ages):
+    '''
+    Return array of values for each row of skill columns, position codes
+    and ages.
+    '''
+    values = array.array("q")
+
+    for row in zip(*columns, positions, ages):
+        values.append(get_value(row, row[9], row[10]))
+
+    return values
+
+
+def get_wages(columns, positions):
+    '''
+    Return array of wages for each row of skill columns and position codes.
+    '''
+    wages = array.array("q")
+
+    for row in zip(*columns, positions):
+        wages.append(get_wage(row, row[9]))
+
+    return wages
@@ -18,8 +18,6 @@
 
 import data
 import structures.advertising
-import uigtk.match
-import uigtk.squaderror
 
 
 class ContinueGame:
@@ -34,10 +32,16 @@ class ContinueGame:
         '''
         Determine whether game will continue, or handle if there is a match.
         '''
+        import uigtk.continuedialog
+
         if self.continue_allowed == 0:
             if not data.calendar.get_fixture():
                 data.date.increment_date()
-                data.window.screen.refresh_visible_screen()
+
+                dialog = uigtk.continuedialog.ContinueDialog()
+                dialog.show()
+
+                data.window.screen.queue_refresh()
 
             if data.calendar.get_fixture():
                 data.calendar.get_user_fixture()
@@ -59,6 +63,8 @@ class ContinueGame:
         '''
         Determine whether match can continue or display error.
         '''
+        import uigtk.match
+
         if self.continue_to_match.get_valid_squad():
             dialog = uigtk.match.ProceedToMatch(club.name)
 
@@ -79,6 +85,9 @@ class ContinueToMatch:
         '''
         Verify eleven selected players are eligible.
         '''
+        import uigtk.match
+        import uigtk.squaderror
+
         count = data.user.club.squad.teamselection.get_team_count()
 
         state = count == 11
@@ -98,6 +107,8 @@ class ContinueToMatch:
         '''
         Check whether the user has selected all substitutes.
         '''
+        import uigtk.match
+
         count = data.user.club.squad.teamselection.get_subs_count()
 
         state = True
@@ -124,6 +135,8 @@ class ContinueToMatch:
         '''
         Check whether the user has selected team responsibilities.
         '''
+        import uigtk.match
+
         state = True
 
         if None in (data.user.club.tactics.captain,
@@ -37,6 +37,8 @@ class Referees:
             self.yellow_cards += len(fixture.home.yellow_cards) + len(fixture.away.yellow_cards)
             self.red_cards += len(fixture.home.red_cards) + len(fixture.away.red_cards)
 
+            data.referees.changed.add(self.refereeid)
+
         def get_points(self):
             '''
             Calculate points for cards issued by referee.
@@ -47,6 +49,8 @@ class Referees:
         self.referees = {}
         self.season = season
 
+        self.changed = set()
+
         self.populate_data()
 
     def get_referees(self):
@@ -79,17 +83,20 @@ class Referees:
         return referees
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM referee \
+        data.database.cursor.execute("SELECT referee.id, name, league \
+                                     FROM referee \
                                      JOIN refereeattr \
                                      ON referee.id = refereeattr.referee \
                                      WHERE refereeattr.year = ?",
                                      (self.season,))
 
+        leagues = data.leagues.leagues
+
         for item in data.database.cursor.fetchall():
             referee = self.Referee()
             referee.refereeid = item[0]
             referee.name = item[1]
-            referee.league = data.leagues.get_league_by_id(item[5])
+            referee.league = leagues[item[2]]
             self.referees[referee.refereeid] = referee
 
             referee.league.add_referee_to_league(referee)
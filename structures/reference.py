@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import os
+import xml.dom.minidom
+
+import data
+
+
+class Reference:
+    '''
+    Process-wide store of immutable reference data shared between clubs.
+    '''
+    def __init__(self):
+        self.news = None
+        self.surnames = None
+        self.merchandise = None
+        self.catering = None
+        self.buildings = None
+
+    def get_news(self):
+        '''
+        Return dictionary of news templates for each news id.
+        '''
+        if self.news is None:
+            self.populate_news()
+
+        return self.news
+
+    def get_surnames(self):
+        '''
+        Return tuple of surnames used for generating staff names.
+        '''
+        if self.surnames is None:
+            data.database.cursor.execute("SELECT * FROM staff")
+            self.surnames = tuple(name[0] for name in data.database.cursor.fetchall())
+
+        return self.surnames
+
+    def get_merchandise(self):
+        '''
+        Return tuple of merchandise items.
+        '''
+        if self.merchandise is None:
+            data.database.cursor.execute("SELECT * FROM merchandise")
+            self.merchandise = tuple(data.database.cursor.fetchall())
+
+        return self.merchandise
+
+    def get_catering(self):
+        '''
+        Return tuple of catering items.
+        '''
+        if self.catering is None:
+            data.database.cursor.execute("SELECT * FROM catering")
+            self.catering = tuple(data.database.cursor.fetchall())
+
+        return self.catering
+
+    def get_buildings(self):
+        '''
+        Return tuple of building name, size and cost rows.
+        '''
+        if self.buildings is None:
+            data.database.cursor.execute("SELECT * FROM buildings")
+            self.buildings = tuple(data.database.cursor.fetchall())
+
+        return self.buildings
+
+    def clear(self):
+        '''
+        Discard loaded reference data so it is read again on next access.
+        '''
+        self.__init__()
+
+    def populate_news(self):
+        filepath = os.path.join("resources", "news.xml")
+        news = xml.dom.minidom.parse(filepath)
+
+        self.news = {}
+
+        for item in news.getElementsByTagName("article"):
+            newsid = item.getAttribute("id")
+
+            title = item.getElementsByTagName("title")[0]
+            title = title.firstChild.data
+            message = item.getElementsByTagName("message")[0]
+            message = message.firstChild.data
+            category = item.getElementsByTagName("category")[0]
+            category = category.firstChild.data
+
+            self.news.setdefault(newsid, []).append((title, message, category))
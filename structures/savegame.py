@@ -0,0 +1,1411 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import array
+import os
+import struct
+import sys
+import zlib
+
+import data
+import structures.coaches
+import structures.fixtures
+import structures.loans
+import structures.negotiations
+import structures.news
+import structures.scouts
+import structures.start
+import structures.tickets
+
+
+# File identifier, format version, starting season and user club id
+HEADER = struct.Struct("<4sHHI")
+MAGIC = b"OSMS"
+VERSION = 3
+
+SKILLS = ("keeping",
+          "tackling",
+          "passing",
+          "shooting",
+          "heading",
+          "pace",
+          "stamina",
+          "ball_control",
+          "set_pieces",
+          "training_value")
+
+STANDING = ("played",
+            "wins",
+            "draws",
+            "losses",
+            "goals_for",
+            "goals_against",
+            "goal_difference",
+            "points")
+
+NEGOTIATIONS = (structures.negotiations.PurchaseNegotiation,
+                structures.negotiations.LoanNegotiation,
+                structures.negotiations.FreeNegotiation)
+
+RESPONSIBILITIES = ("captain",
+                    "corner_taker",
+                    "free_kick_taker",
+                    "penalty_taker")
+
+# Field types of season records in player and club history
+PLAYER_HISTORY = (str, str, str, str, int, int, str, int)
+CLUB_HISTORY = (str, str, int, int, int, int, int, int, int)
+
+
+def join_records(records):
+    '''
+    Return records joined as tab separated fields on separate lines.
+    '''
+    return "\n".join("\t".join(str(field) for field in record) for record in records)
+
+
+def split_records(text, types):
+    '''
+    Return list of records split from text with fields of given types.
+    '''
+    records = []
+
+    for line in text.split("\n") if text else ():
+        records.append([cast(field) for cast, field in zip(types, line.split("\t"))])
+
+    return records
+
+
+def get_playerid(player):
+    '''
+    Return id of given player, or zero for no player.
+    '''
+    return player.playerid if player else 0
+
+
+def get_player(playerid):
+    '''
+    Return player for given id, or None for zero.
+    '''
+    return data.players.get_player_by_id(playerid) if playerid else None
+
+
+class Writer:
+    '''
+    Buffer of little-endian value columns with a shared string table.
+    '''
+    def __init__(self):
+        self.columns = []
+        self.strings = {}
+
+    def add_column(self, typecode, values):
+        '''
+        Append column of values packed as the given array typecode.
+        '''
+        column = array.array(typecode, values)
+
+        if sys.byteorder == "big":
+            column.byteswap()
+
+        self.columns.append(struct.pack("<I", len(column)))
+        self.columns.append(column.tobytes())
+
+    def add_strings(self, values):
+        '''
+        Append column of references into the string table.
+        '''
+        strings = self.strings
+
+        self.add_column("I", [strings.setdefault(value, len(strings)) for value in values])
+
+    def add_rows(self, typecodes, keys, rows):
+        '''
+        Append column of keys followed by one column per row field.
+        '''
+        self.add_column("I", keys)
+
+        for index, typecode in enumerate(typecodes):
+            values = (row[index] for row in rows)
+
+            if typecode == "s":
+                self.add_strings(values)
+            else:
+                self.add_column(typecode, values)
+
+    def get_content(self):
+        '''
+        Return string table followed by each of the columns.
+        '''
+        strings = "\0".join(self.strings).encode("utf-8")
+        header = struct.pack("<II", len(self.strings), len(strings))
+
+        return b"".join([header, strings] + self.columns)
+
+
+class Reader:
+    '''
+    Sequential reader of columns written by the Writer object.
+    '''
+    def __init__(self, content):
+        self.content = content
+
+        count, size = struct.unpack_from("<II", content)
+        self.offset = 8 + size
+
+        if count:
+            self.strings = content[8:self.offset].decode("utf-8").split("\0")
+        else:
+            self.strings = []
+
+    def get_column(self, typecode):
+        '''
+        Return next column as array of given typecode.
+        '''
+        count, = struct.unpack_from("<I", self.content, self.offset)
+        self.offset += 4
+
+        column = array.array(typecode)
+        size = count * column.itemsize
+        column.frombytes(self.content[self.offset:self.offset + size])
+        self.offset += size
+
+        if sys.byteorder == "big":
+            column.byteswap()
+
+        return column
+
+    def get_strings(self):
+        '''
+        Return next column of string table references as strings.
+        '''
+        strings = self.strings
+
+        return [strings[index] for index in self.get_column("I")]
+
+    def get_rows(self, typecodes):
+        '''
+        Return keys and rows written with the given field typecodes.
+        '''
+        keys = self.get_column("I")
+        columns = []
+
+        for typecode in typecodes:
+            if typecode == "s":
+                columns.append(self.get_strings())
+            else:
+                columns.append(self.get_column(typecode))
+
+        return keys, zip(*columns)
+
+
+class Section:
+    '''
+    Group of saved state rows keyed by id with fixed field typecodes.
+    '''
+    def __init__(self, typecodes):
+        self.typecodes = typecodes
+
+    def get_keys(self):
+        '''
+        Return keys of each row currently held in game.
+        '''
+        return ()
+
+    def get_row(self, key):
+        '''
+        Return current row tuple for given key, or None if key is absent.
+        '''
+
+    def get_rows(self):
+        '''
+        Return dictionary of current row tuples for each key.
+        '''
+        return {key: self.get_row(key) for key in self.get_keys()}
+
+    def get_changes(self):
+        '''
+        Return keys of rows changed since changes were last cleared, or None
+        if every row is to be compared.
+        '''
+        return None
+
+    def clear_changes(self):
+        '''
+        Forget changes once they have been recorded.
+        '''
+
+    def set_row(self, key, row):
+        '''
+        Apply saved row for given key to in-game state.
+        '''
+
+    def remove_row(self, key):
+        '''
+        Remove in-game object for given key.
+        '''
+
+    def update(self):
+        '''
+        Rebuild derived state after rows have been applied.
+        '''
+
+
+class GameSection(Section):
+    def __init__(self):
+        Section.__init__(self, "iiiiiiiiIIIIIIIhB")
+
+        self.season = None
+
+    def get_keys(self):
+        return (0,)
+
+    def get_row(self, key):
+        club = data.user.club
+
+        return (data.date.day,
+                data.date.month,
+                data.date.year,
+                data.date.week,
+                data.date.week_count,
+                data.date.ordinal,
+                data.calendar.season.get_date(0)[2],
+                data.calendar.event,
+                data.negotiations.negotiationid,
+                club.news.newsid,
+                club.news.season,
+                club.coaches.coachid,
+                club.scouts.scoutid,
+                club.hoardings.advertid,
+                club.programmes.advertid,
+                data.advertising.timeout,
+                club.assistant.advertising)
+
+    def set_row(self, key, row):
+        club = data.user.club
+
+        (data.date.day,
+         data.date.month,
+         data.date.year,
+         data.date.week,
+         data.date.week_count,
+         data.date.ordinal,
+         self.season,
+         data.calendar.event,
+         data.negotiations.negotiationid,
+         club.news.newsid,
+         club.news.season,
+         club.coaches.coachid,
+         club.scouts.scoutid,
+         club.hoardings.advertid,
+         club.programmes.advertid,
+         data.advertising.timeout,
+         advertising) = row
+
+        club.assistant.advertising = bool(advertising)
+
+    def update(self):
+        if self.season is not None:
+            data.calendar.compile_season(self.season)
+
+
+class ClubSection(Section):
+    def __init__(self):
+        items = self.get_items(data.user.club.accounts)
+
+        Section.__init__(self, "hsssddd" + "dd" * len(items))
+
+    def get_items(self, accounts):
+        '''
+        Return list of income and expenditure items in fixed order.
+        '''
+        return list(accounts.incomes.values()) + list(accounts.expenditures.values())
+
+    def get_keys(self):
+        return data.clubs.get_club_keys()
+
+    def get_changes(self):
+        changes = {data.user.club.clubid}
+
+        for clubid, club in data.clubs.get_clubs():
+            if club.accounts.changed or club.form.changed or club.history.changed:
+                changes.add(clubid)
+
+        return changes
+
+    def clear_changes(self):
+        for clubid, club in data.clubs.get_clubs():
+            club.accounts.changed = False
+            club.form.changed = False
+            club.history.changed = False
+
+    def get_row(self, key):
+        club = data.clubs.get_club_by_id(key)
+
+        row = [club.reputation,
+               club.manager,
+               "".join(club.form.get_form()),
+               join_records(club.history.get_history()),
+               club.accounts.balance,
+               club.accounts.income,
+               club.accounts.expenditure]
+
+        for item in self.get_items(club.accounts):
+            row.append(item.week)
+            row.append(item.season)
+
+        return tuple(row)
+
+    def set_row(self, key, row):
+        club = data.clubs.get_club_by_id(key)
+
+        club.reputation = row[0]
+        club.manager = row[1]
+        club.form.form = list(row[2])
+        club.history.history = split_records(row[3], CLUB_HISTORY)
+
+        club.accounts.balance = row[4]
+        club.accounts.income = row[5]
+        club.accounts.expenditure = row[6]
+
+        for index, item in enumerate(self.get_items(club.accounts)):
+            item.week = row[7 + index * 2]
+            item.season = row[8 + index * 2]
+
+
+class PlayerSection(Section):
+    def __init__(self, mapped=False):
+        Section.__init__(self, "Ih" + "h" * len(SKILLS) + "BBHHHihhihhi" + "iddddd" + "ss")
+
+        self.mapped = mapped
+
+    def get_keys(self):
+        return data.players.players.keys()
+
+    def get_changes(self):
+        return [data.players.get_player_by_row(row).playerid for row in data.players.table.changed]
+
+    def clear_changes(self):
+        data.players.table.changed.clear()
+
+    def get_row(self, key):
+        player = data.players.get_player_by_id(key)
+
+        row = [player.club.clubid if player.club else 0, player.morale]
+        row.extend(getattr(player, skill) for skill in SKILLS)
+        row.extend((player.not_for_sale,
+                    player.retiring,
+                    player.appearances,
+                    player.substitute,
+                    player.man_of_the_match,
+                    -1 if player.injury.injuryid is None else player.injury.injuryid,
+                    player.injury.period,
+                    player.injury.fitness,
+                    -1 if player.suspension.suspensionid is None else player.suspension.suspensionid,
+                    player.suspension.period,
+                    player.training.rate,
+                    player.training.points,
+                    player.contract.contract,
+                    player.contract.leaguechamp,
+                    player.contract.leaguerunnerup,
+                    player.contract.winbonus,
+                    player.contract.goalbonus,
+                    player.wage.get_wage(),
+                    join_records((rating,) for rating in player.rating.rating),
+                    join_records(player.history.history)))
+
+        return tuple(row)
+
+    def set_row(self, key, row):
+        player = data.players.players.get(key)
+
+        if not player:
+            return
+
+        (not_for_sale,
+         retiring,
+         appearances,
+         substitute,
+         player.man_of_the_match,
+         injuryid,
+         player.injury.period,
+         fitness,
+         suspensionid,
+         player.suspension.period,
+         player.training.rate,
+         player.training.points,
+         contract,
+         player.contract.leaguechamp,
+         player.contract.leaguerunnerup,
+         player.contract.winbonus,
+         player.contract.goalbonus,
+         wage,
+         rating,
+         history) = row[2 + len(SKILLS):]
+
+        # Mapped player table columns already hold the saved values
+        if not self.mapped:
+            player.club = data.clubs.clubs.get(row[0])
+            player.morale = row[1]
+
+            for skill, value in zip(SKILLS, row[2:]):
+                setattr(player, skill, value)
+
+            player.appearances = appearances
+            player.substitute = substitute
+            player.injury.fitness = fitness
+            player.contract.contract = contract
+
+        player.not_for_sale = bool(not_for_sale)
+        player.retiring = bool(retiring)
+        player.injury.injuryid = None if injuryid == -1 else injuryid
+        player.suspension.suspensionid = None if suspensionid == -1 else suspensionid
+        player.wage.set_wage(wage)
+        player.rating.rating = [record[0] for record in split_records(rating, (float,))]
+        player.history.history = [tuple(record) for record in split_records(history, PLAYER_HISTORY)]
+
+    def update(self):
+        for clubid, club in data.clubs.get_clubs():
+            club.squad.squad.clear()
+            club.squad.clear_ratings()
+
+        for playerid, player in data.players.get_players():
+            if player.club:
+                player.club.squad.add_to_squad(player)
+
+            if self.mapped:
+                data.players.set_fit(player, player.fitness == 100)
+
+        if self.mapped:
+            data.players.value_all()
+            data.players.averages.update_all()
+
+
+class FixtureSection(Section):
+    def __init__(self, league):
+        Section.__init__(self, "HIIIBBhhI")
+
+        self.league = league
+
+    def get_keys(self):
+        return self.league.fixtures.get_fixtures().keys()
+
+    def get_changes(self):
+        return self.league.fixtures.changed
+
+    def clear_changes(self):
+        self.league.fixtures.changed.clear()
+
+    def get_row(self, key):
+        fixture = self.league.fixtures.get_fixtures().get(key)
+
+        if not fixture:
+            return None
+
+        if fixture.result:
+            home, away = fixture.result[0], fixture.result[1]
+        else:
+            home, away = -1, -1
+
+        return (fixture.week,
+                fixture.home.club.clubid,
+                fixture.away.club.clubid,
+                fixture.referee.refereeid,
+                fixture.played,
+                fixture.televised,
+                home,
+                away,
+                fixture.attendance)
+
+    def set_row(self, key, row):
+        fixtures = self.league.fixtures
+        fixture = fixtures.get_fixtures().get(key)
+
+        if not fixture:
+            fixtures.league = self.league
+            fixtures.clubs = self.league.clubs
+            fixtures.fixtureid = max(fixtures.fixtureid, key)
+
+            fixture = structures.fixtures.Fixture()
+            fixture.fixtureid = key
+            fixture.league = self.league
+            fixture.week = row[0]
+            fixture.home.club = data.clubs.get_club_by_id(row[1])
+            fixture.away.club = data.clubs.get_club_by_id(row[2])
+
+            fixtures.add_fixture(fixture)
+
+        fixture.referee = data.referees.get_referee_by_id(row[3])
+        fixture.played = bool(row[4])
+        fixture.televised = bool(row[5])
+        fixture.attendance = row[8]
+
+        if row[6] != -1:
+            fixture.result = row[6], row[7]
+
+
+class StandingSection(Section):
+    def __init__(self, league):
+        Section.__init__(self, "h" * len(STANDING))
+
+        self.league = league
+
+    def get_keys(self):
+        return self.league.standings.standings.keys()
+
+    def get_changes(self):
+        return self.league.standings.changed
+
+    def clear_changes(self):
+        self.league.standings.changed.clear()
+
+    def get_row(self, key):
+        standing = self.league.standings.standings.get(key)
+
+        if not standing:
+            return None
+
+        return tuple(getattr(standing, attribute) for attribute in STANDING)
+
+    def set_row(self, key, row):
+        standing = self.league.standings.standings[key]
+
+        for attribute, value in zip(STANDING, row):
+            setattr(standing, attribute, value)
+
+    def update(self):
+        standings = self.league.standings
+        standings.order.sort(key=standings.get_rank_key)
+
+        for position, clubid in enumerate(standings.order):
+            standings.positions[clubid] = position
+
+
+class RefereeSection(Section):
+    def __init__(self):
+        Section.__init__(self, "HHH")
+
+    def get_keys(self):
+        return data.referees.referees.keys()
+
+    def get_changes(self):
+        return data.referees.changed
+
+    def clear_changes(self):
+        data.referees.changed.clear()
+
+    def get_row(self, key):
+        referee = data.referees.get_referee_by_id(key)
+
+        return (referee.games, referee.yellow_cards, referee.red_cards)
+
+    def set_row(self, key, row):
+        referee = data.referees.get_referee_by_id(key)
+
+        referee.games, referee.yellow_cards, referee.red_cards = row
+
+
+class ChartSection(Section):
+    def __init__(self):
+        Section.__init__(self, "HHHH")
+
+    def get_keys(self):
+        return data.goalscorers.goals.keys() | data.assists.assists.keys() | data.cards.cards.keys()
+
+    def get_changes(self):
+        return data.goalscorers.changed | data.assists.changed | data.cards.changed
+
+    def clear_changes(self):
+        data.goalscorers.changed.clear()
+        data.assists.changed.clear()
+        data.cards.changed.clear()
+
+    def get_row(self, key):
+        goal = data.goalscorers.goals.get(key)
+        assist = data.assists.assists.get(key)
+        card = data.cards.cards.get(key)
+
+        if not (goal or assist or card):
+            return None
+
+        return (goal.league if goal else 0,
+                assist.league if assist else 0,
+                card.yellow if card else 0,
+                card.red if card else 0)
+
+    def set_row(self, key, row):
+        player = data.players.get_player_by_id(key)
+        goals, assists, yellow, red = row
+
+        self.remove_row(key)
+
+        if goals:
+            goal = data.goalscorers.Goal(player)
+            goal.league = goals
+            data.goalscorers.goals[key] = goal
+
+        if assists:
+            assist = data.assists.Assist(player)
+            assist.league = assists
+            data.assists.assists[key] = assist
+
+        if yellow or red:
+            card = data.cards.Card(player)
+            card.yellow = yellow
+            card.red = red
+            data.cards.cards[key] = card
+
+    def remove_row(self, key):
+        data.goalscorers.goals.pop(key, None)
+        data.assists.assists.pop(key, None)
+        data.cards.cards.pop(key, None)
+
+
+class TacticsSection(Section):
+    def __init__(self):
+        Section.__init__(self, "BBBBBB" + "I" * 4 + "I" * 16)
+
+    def get_keys(self):
+        return data.clubs.get_club_keys()
+
+    def get_changes(self):
+        changes = {data.user.club.clubid}
+
+        for clubid, club in data.clubs.get_clubs():
+            if club.squad.teamselection.changed:
+                changes.add(clubid)
+
+        return changes
+
+    def clear_changes(self):
+        for clubid, club in data.clubs.get_clubs():
+            club.squad.teamselection.changed = False
+
+    def get_row(self, key):
+        club = data.clubs.get_club_by_id(key)
+        tactics = club.tactics
+        selection = club.squad.teamselection
+
+        row = [tactics.formationid,
+               tactics.offside_trap,
+               tactics.tackling_style,
+               tactics.passing_style,
+               tactics.playing_style,
+               tactics.bonus or 0]
+        row.extend(get_playerid(getattr(tactics, responsibility)) for responsibility in RESPONSIBILITIES)
+        row.extend(get_playerid(player) for player in selection.team + selection.subs)
+
+        return tuple(row)
+
+    def set_row(self, key, row):
+        club = data.clubs.get_club_by_id(key)
+        tactics = club.tactics
+        selection = club.squad.teamselection
+
+        (tactics.formationid,
+         offside_trap,
+         tactics.tackling_style,
+         tactics.passing_style,
+         tactics.playing_style,
+         bonus) = row[:6]
+
+        tactics.offside_trap = bool(offside_trap)
+        tactics.bonus = bonus or None
+
+        for responsibility, playerid in zip(RESPONSIBILITIES, row[6:10]):
+            setattr(tactics, responsibility, get_player(playerid))
+
+        players = [get_player(playerid) for playerid in row[10:]]
+        selection.team = players[:len(selection.team)]
+        selection.subs = players[len(selection.team):]
+        selection.clear_goalscorers()
+
+
+class StadiumSection(Section):
+    def __init__(self):
+        buildings = len(data.reference.get_buildings())
+
+        Section.__init__(self, "hhhh" + "IBBH" * 4 + "IBB" * 4 + "H" * buildings)
+
+    def get_keys(self):
+        return data.stadiums.stadiums.keys()
+
+    def get_changes(self):
+        return (data.user.club.stadium.stadiumid,)
+
+    def get_row(self, key):
+        stadium = data.stadiums.get_stadium_by_id(key)
+
+        row = [stadium.condition,
+               stadium.maintenance,
+               stadium.warnings,
+               stadium.fines]
+
+        for stand in stadium.main_stands:
+            row.extend((stand.capacity, stand.seating, stand.roof, stand.box))
+
+        for stand in stadium.corner_stands:
+            row.extend((stand.capacity, stand.seating, stand.roof))
+
+        row.extend(building.number for building in stadium.buildings.get_buildings())
+
+        return tuple(row)
+
+    def set_row(self, key, row):
+        stadium = data.stadiums.get_stadium_by_id(key)
+
+        (stadium.condition,
+         stadium.maintenance,
+         stadium.warnings,
+         stadium.fines) = row[:4]
+
+        offset = 4
+
+        for stand in stadium.main_stands:
+            stand.capacity, seating, roof, stand.box = row[offset:offset + 4]
+            stand.seating = bool(seating)
+            stand.roof = bool(roof)
+            offset += 4
+
+        for stand in stadium.corner_stands:
+            stand.capacity, seating, roof = row[offset:offset + 3]
+            stand.seating = bool(seating)
+            stand.roof = bool(roof)
+            offset += 3
+
+        for building, number in zip(stadium.buildings.get_buildings(), row[offset:]):
+            building.number = number
+
+
+class NegotiationSection(Section):
+    def __init__(self):
+        Section.__init__(self, "BIIBhsdh")
+
+    def get_keys(self):
+        return data.negotiations.negotiations.keys()
+
+    def get_row(self, key):
+        negotiation = data.negotiations.negotiations.get(key)
+
+        if not negotiation:
+            return None
+
+        return (negotiation.transfer_type,
+                negotiation.player.playerid,
+                negotiation.club.clubid,
+                negotiation.statusid,
+                negotiation.timeout,
+                negotiation.offer_date,
+                getattr(negotiation, "amount", 0),
+                getattr(negotiation, "period", 0))
+
+    def set_row(self, key, row):
+        negotiation = data.negotiations.negotiations.get(key)
+
+        if not negotiation:
+            player = data.players.get_player_by_id(row[1])
+
+            negotiation = NEGOTIATIONS[row[0]](key, player)
+            data.negotiations.negotiations[key] = negotiation
+
+        negotiation.club = data.clubs.get_club_by_id(row[2])
+        negotiation.statusid = row[3]
+        negotiation.timeout = row[4]
+        negotiation.offer_date = row[5]
+
+        if row[6]:
+            negotiation.amount = row[6]
+
+        if row[0] == 1:
+            negotiation.period = row[7]
+
+    def remove_row(self, key):
+        data.negotiations.negotiations.pop(key, None)
+
+
+class MarketSection(Section):
+    '''
+    Players listed for purchase or loan, and players on the user shortlist.
+    '''
+    def __init__(self):
+        Section.__init__(self, "BdBB")
+
+    def get_keys(self):
+        shortlist = {player.playerid for player in data.user.club.shortlist.get_shortlist()}
+
+        return data.purchase_list.listed.keys() | data.loan_list.listed.keys() | shortlist
+
+    def get_changes(self):
+        return data.purchase_list.changed | data.loan_list.changed | data.user.club.shortlist.changed
+
+    def clear_changes(self):
+        data.purchase_list.changed.clear()
+        data.loan_list.changed.clear()
+        data.user.club.shortlist.changed.clear()
+
+    def get_row(self, key):
+        player = data.players.get_player_by_id(key)
+        listing = data.purchase_list.listed.get(key)
+        loan = key in data.loan_list.listed
+        shortlist = data.user.club.shortlist.get_player_in_shortlist(player)
+
+        if not (listing or loan or shortlist):
+            return None
+
+        return (listing is not None,
+                listing.value if listing else 0,
+                loan,
+                shortlist)
+
+    def set_row(self, key, row):
+        player = data.players.get_player_by_id(key)
+        purchase, value, loan, shortlist = row
+
+        if purchase:
+            data.purchase_list.listed[key] = data.purchase_list.PurchaseListing(player, value)
+        else:
+            data.purchase_list.remove_from_list(player)
+
+        if loan:
+            data.loan_list.add_to_list(data.loan_list.LoanListing(player))
+        else:
+            data.loan_list.remove_from_list(player)
+
+        if shortlist:
+            data.user.club.shortlist.add_to_shortlist(player)
+        else:
+            data.user.club.shortlist.remove_from_shortlist(player)
+
+    def remove_row(self, key):
+        self.set_row(key, (False, 0, False, False))
+
+
+class LoanSection(Section):
+    def __init__(self):
+        Section.__init__(self, "IIh")
+
+    def get_loan(self, key):
+        '''
+        Return loan for given player id, or None if not on loan.
+        '''
+        for loan in data.loans.loans:
+            if loan.player.playerid == key:
+                return loan
+
+        return None
+
+    def get_borrower(self, loan):
+        '''
+        Return club which has taken given loan in.
+        '''
+        for clubid, club in data.clubs.get_clubs():
+            if loan in club.loans_in.loans:
+                return club
+
+        return None
+
+    def get_keys(self):
+        return [loan.player.playerid for loan in data.loans.loans]
+
+    def get_row(self, key):
+        loan = self.get_loan(key)
+
+        if not loan:
+            return None
+
+        borrower = self.get_borrower(loan)
+
+        return (loan.club.clubid,
+                borrower.clubid if borrower else 0,
+                loan.period)
+
+    def set_row(self, key, row):
+        loan = self.get_loan(key)
+
+        if not loan:
+            player = data.players.get_player_by_id(key)
+
+            loan = structures.loans.Loan(player, row[2])
+            loan.club = data.clubs.get_club_by_id(row[0])
+            data.loans.loans.append(loan)
+
+            loan.club.loans_out.loans.append(loan)
+
+            if row[1]:
+                data.clubs.get_club_by_id(row[1]).loans_in.loans.append(loan)
+
+        loan.period = row[2]
+
+    def remove_row(self, key):
+        loan = self.get_loan(key)
+
+        if loan:
+            data.loans.loans.remove(loan)
+
+            for clubid, club in data.clubs.get_clubs():
+                for loans in (club.loans_in.loans, club.loans_out.loans):
+                    if loan in loans:
+                        loans.remove(loan)
+
+
+class StaffSection(Section):
+    '''
+    Coaches or scouts available to and hired by the user club.
+    '''
+    def __init__(self, staff, member):
+        Section.__init__(self, "BsBBIHBBB")
+
+        self.staff = staff
+        self.member = member
+
+    def get_keys(self):
+        return self.staff.available.keys() | self.staff.hired.keys()
+
+    def get_row(self, key):
+        hired = key in self.staff.hired
+        member = self.staff.hired.get(key) or self.staff.available.get(key)
+
+        if not member:
+            return None
+
+        return (hired,
+                member.name,
+                member.age,
+                member.ability,
+                member.wage,
+                member.contract,
+                member.morale,
+                member.retiring,
+                getattr(member, "speciality", 0))
+
+    def set_row(self, key, row):
+        member = self.staff.hired.get(key) or self.staff.available.get(key)
+
+        if not member:
+            member = self.member(key)
+
+        (hired,
+         member.name,
+         member.age,
+         member.ability,
+         member.wage,
+         member.contract,
+         member.morale,
+         retiring,
+         speciality) = row
+
+        member.retiring = bool(retiring)
+
+        if hasattr(member, "speciality"):
+            member.speciality = speciality
+
+        self.remove_row(key)
+
+        if hired:
+            self.staff.hired[key] = member
+        else:
+            self.staff.available[key] = member
+
+    def remove_row(self, key):
+        self.staff.hired.pop(key, None)
+        self.staff.available.pop(key, None)
+
+
+class TrainingSection(Section):
+    '''
+    Individual training of players at the user club.
+    '''
+    def __init__(self):
+        Section.__init__(self, "IBBhB")
+
+    def get_keys(self):
+        return data.user.club.individual_training.individual_training.keys()
+
+    def get_row(self, key):
+        if not data.user.club.individual_training.get_player_in_training(key):
+            return None
+
+        training = data.user.club.individual_training.get_individual_training_by_playerid(key)
+
+        return (training.coach.coachid,
+                training.skill,
+                training.intensity,
+                training.start_value,
+                training.status)
+
+    def set_row(self, key, row):
+        club = data.user.club
+
+        training = club.individual_training.Item()
+        training.player = data.players.get_player_by_id(key)
+        training.coach = club.coaches.hired.get(row[0])
+
+        (coachid,
+         training.skill,
+         training.intensity,
+         training.start_value,
+         training.status) = row
+
+        club.individual_training.individual_training[key] = training
+
+    def remove_row(self, key):
+        data.user.club.individual_training.remove_from_training(key)
+
+
+class AdvertSection(Section):
+    '''
+    Adverts available to and taken up by the user club.
+    '''
+    def __init__(self, advertising):
+        Section.__init__(self, "BsBhi")
+
+        self.advertising = advertising
+
+    def get_keys(self):
+        return self.advertising.available.keys() | self.advertising.current.keys()
+
+    def get_row(self, key):
+        current = key in self.advertising.current
+        advert = self.advertising.current.get(key) or self.advertising.available.get(key)
+
+        if not advert:
+            return None
+
+        return (current,
+                advert.name,
+                advert.quantity,
+                advert.period,
+                advert.amount)
+
+    def set_row(self, key, row):
+        current, name, quantity, period, amount = row
+
+        advert = self.advertising.Advert(name)
+        advert.quantity = quantity
+        advert.period = period
+        advert.amount = amount
+
+        self.remove_row(key)
+
+        if current:
+            self.advertising.current[key] = advert
+        else:
+            self.advertising.available[key] = advert
+
+    def remove_row(self, key):
+        self.advertising.current.pop(key, None)
+        self.advertising.available.pop(key, None)
+
+
+class FinanceSection(Section):
+    '''
+    Bank loan, overdraft, grant and flotation of the user club.
+    '''
+    def __init__(self):
+        Section.__init__(self, "dhhhdhhhBBh")
+
+    def get_keys(self):
+        return (0,)
+
+    def get_row(self, key):
+        finances = data.user.club.finances
+
+        return (finances.loan.amount,
+                finances.loan.period,
+                finances.loan.interest,
+                finances.loan.timeout,
+                finances.overdraft.amount,
+                finances.overdraft.interest,
+                finances.overdraft.timeout,
+                finances.grant.weeks,
+                finances.flotation.pending,
+                finances.flotation.public,
+                finances.flotation.timeout)
+
+    def set_row(self, key, row):
+        finances = data.user.club.finances
+
+        (finances.loan.amount,
+         finances.loan.period,
+         finances.loan.interest,
+         finances.loan.timeout,
+         finances.overdraft.amount,
+         finances.overdraft.interest,
+         finances.overdraft.timeout,
+         finances.grant.weeks,
+         pending,
+         public,
+         finances.flotation.timeout) = row
+
+        finances.flotation.pending = bool(pending)
+        finances.flotation.public = bool(public)
+
+
+class SponsorshipSection(Section):
+    def __init__(self):
+        Section.__init__(self, "BhBshd")
+
+    def get_keys(self):
+        return (0,)
+
+    def get_row(self, key):
+        sponsorship = data.user.club.sponsorship
+        offer = sponsorship.offer
+
+        return (sponsorship.status,
+                sponsorship.timeout,
+                offer is not None,
+                offer.company if offer else "",
+                offer.period if offer else 0,
+                offer.amount if offer else 0)
+
+    def set_row(self, key, row):
+        sponsorship = data.user.club.sponsorship
+        status, timeout, offered, company, period, amount = row
+
+        sponsorship.status = status
+        sponsorship.timeout = timeout
+        sponsorship.offer = None
+
+        if offered:
+            sponsorship.offer = sponsorship.Offer()
+            sponsorship.offer.company = company
+            sponsorship.offer.period = period
+            sponsorship.offer.amount = amount
+
+
+class TicketSection(Section):
+    '''
+    Ticket prices and allocations of the user club, with prices of -1 for
+    stadium categories without tickets.
+    '''
+    def __init__(self):
+        categories = len(data.user.club.tickets.get_ticket_prices())
+
+        Section.__init__(self, "IBB" + "iiiiii" * categories)
+
+    def get_keys(self):
+        return (0,)
+
+    def get_row(self, key):
+        tickets = data.user.club.tickets
+
+        row = [tickets.school_tickets,
+               tickets.season_tickets,
+               tickets.season_tickets_available]
+
+        for category in tickets.get_ticket_prices():
+            if category:
+                row.extend(category.prices)
+                row.extend(category.base)
+            else:
+                row.extend((-1,) * 6)
+
+        return tuple(row)
+
+    def set_row(self, key, row):
+        tickets = data.user.club.tickets
+
+        (tickets.school_tickets,
+         tickets.season_tickets,
+         available) = row[:3]
+
+        tickets.season_tickets_available = bool(available)
+
+        categories = tickets.get_ticket_prices()
+
+        for index in range(len(categories)):
+            values = row[3 + index * 6:9 + index * 6]
+
+            if values[0] == -1:
+                categories[index] = None
+            else:
+                category = structures.tickets.TicketPrices(0)
+                category.prices = list(values[:3])
+                category.base = list(values[3:])
+                categories[index] = category
+
+
+class TeamTrainingSection(Section):
+    def __init__(self):
+        sessions = len(data.user.club.team_training.team_training)
+
+        Section.__init__(self, "B" * sessions + "h")
+
+    def get_keys(self):
+        return (0,)
+
+    def get_row(self, key):
+        training = data.user.club.team_training
+
+        return tuple(training.team_training) + (training.timeout,)
+
+    def set_row(self, key, row):
+        training = data.user.club.team_training
+
+        training.team_training = list(row[:-1])
+        training.timeout = row[-1]
+
+
+class NewsSection(Section):
+    def __init__(self):
+        Section.__init__(self, "sssBBI")
+
+    def get_keys(self):
+        return data.user.club.news.articles.keys()
+
+    def get_changes(self):
+        return data.user.club.news.changed
+
+    def clear_changes(self):
+        data.user.club.news.changed.clear()
+
+    def get_row(self, key):
+        article = data.user.club.news.articles.get(key)
+
+        if not article:
+            return None
+
+        return (article.date,
+                article.title,
+                article.message,
+                article.category,
+                article.unread,
+                article.season)
+
+    def set_row(self, key, row):
+        news = data.user.club.news
+        date, title, message, category, unread, season = row
+
+        article = structures.news.StoredArticle(date, title, message, category, bool(unread), season)
+
+        if key in news.articles:
+            news.set_unread(key, article.unread)
+
+            article.newsid = key
+            news.articles[key] = article
+        else:
+            news.add_article(key, article)
+
+    def remove_row(self, key):
+        data.user.club.news.remove_article(key)
+
+
+def get_sections(mapped=False):
+    '''
+    Return list of saved state sections in file order, with player rows
+    leaving table columns alone if mapped from the saved game.
+    '''
+    sections = [GameSection(), ClubSection(), MarketSection(), PlayerSection(mapped)]
+
+    for leagueid, league in sorted(data.leagues.get_leagues()):
+        sections.append(FixtureSection(league))
+        sections.append(StandingSection(league))
+
+    sections.extend((RefereeSection(),
+                     ChartSection(),
+                     TacticsSection(),
+                     StadiumSection(),
+                     NegotiationSection(),
+                     LoanSection(),
+                     StaffSection(data.user.club.coaches, structures.coaches.Coach),
+                     StaffSection(data.user.club.scouts, structures.scouts.Scout),
+                     TrainingSection(),
+                     AdvertSection(data.user.club.hoardings),
+                     AdvertSection(data.user.club.programmes),
+                     FinanceSection(),
+                     SponsorshipSection(),
+                     TicketSection(),
+                     TeamTrainingSection(),
+                     NewsSection()))
+
+    return sections
+
+
+class SaveGame:
+    '''
+    Compact saved game storing in-game state as columns referenced by id,
+    with the static world rebuilt from the database on load.
+    '''
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.tablepath = "%s.osp" % (os.path.splitext(filepath)[0])
+
+    def save(self):
+        '''
+        Write current in-game state to the saved game file.
+        '''
+        writer = Writer()
+
+        for section in get_sections():
+            rows = section.get_rows()
+            keys = sorted(rows)
+
+            writer.add_rows(section.typecodes, keys, [rows[key] for key in keys])
+
+        header = HEADER.pack(MAGIC, VERSION, data.players.season, data.user.clubid)
+        content = zlib.compress(writer.get_content(), 1)
+
+        with open(self.filepath, "wb") as savefile:
+            savefile.write(header)
+            savefile.write(content)
+
+        data.players.table.write(self.tablepath, zlib.crc32(content))
+
+    def load(self):
+        '''
+        Rebuild in-game state from the saved game file, returning whether
+        the file was recognised.
+        '''
+        with open(self.filepath, "rb") as savefile:
+            content = savefile.read()
+
+        if len(content) < HEADER.size:
+            return False
+
+        magic, version, season, clubid = HEADER.unpack_from(content)
+
+        if magic != MAGIC or version != VERSION:
+            return False
+
+        reader = Reader(zlib.decompress(content[HEADER.size:]))
+
+        start = structures.start.Start(clubid, season)
+
+        # Map player table columns written alongside the saved game
+        mapped = False
+
+        if os.path.exists(self.tablepath):
+            mapped = data.players.table.map(self.tablepath, zlib.crc32(content[HEADER.size:]))
+
+        sections = get_sections(mapped)
+
+        for section in sections:
+            keys, rows = reader.get_rows(section.typecodes)
+
+            for key, row in zip(keys, rows):
+                section.set_row(key, row)
+
+        for section in sections:
+            section.update()
+
+        start.setup_club_limits()
+
+        data.unsaved = False
+
+        return True
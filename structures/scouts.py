@@ -17,6 +17,7 @@
 
 
 import data
+import structures.pricing
 import structures.staff
 
 
@@ -121,23 +122,9 @@ class Recommendations:
         '''
         Get scout report on given player.
         '''
-        averages = []
+        score = data.players.averages.get_average(shortlist_player.get_position_code())
 
-        for playerid, player in data.players.get_players():
-            if player.position == shortlist_player.position:
-                skills = player.get_skills()
-
-                average = sum(skills[0:6]) + (skills[8] * 1.5) + (skills[5] * 0.2) + (skills[6] * 0.2) + (skills[7] * 1.5)
-                average = average / 9
-
-                averages.append(average)
-
-        score = sum(averages) / len(averages)
-
-        skills = shortlist_player.get_skills()
-
-        average = sum(skills[0:6]) + (skills[8] * 1.5) + (skills[5] * 0.2) + (skills[6] * 0.2) + (skills[7] * 1.5)
-        average = average / 9
+        average = structures.pricing.get_weighted_sum(shortlist_player.get_skills()) / 9
 
         if average > score:
             statusid = 2
@@ -152,36 +139,9 @@ class Recommendations:
         '''
         Get scout recommendation status for given player.
         '''
-        shortlist_position = shortlist_player.position
-
-        equivalents = []
-
-        for playerid, player in data.user.club.squad.get_squad():
-            if shortlist_position in ("GK",):
-                equivalents.append(player)
-            elif shortlist_position in ("DL", "DR", "DC", "D"):
-                equivalents.append(player)
-            elif shortlist_position in ("ML", "MR", "MC", "M"):
-                equivalents.append(player)
-            elif shortlist_position in ("AF", "AS"):
-                equivalents.append(player)
-
-        averages = []
-
-        for player in equivalents:
-            skills = player.get_skills()
-
-            average = sum(skills[0:6]) + (skills[8] * 1.5) + (skills[5] * 0.2) + (skills[6] * 0.2) + (skills[7] * 1.5)
-            average = average / 9
-
-            averages.append(average)
-
-        position_average = sum(averages) / len(averages)
-
-        skills = shortlist_player.get_skills()
+        position_average = data.user.club.squad.get_ratings().average
 
-        average = sum(skills[0:6]) + (skills[8] * 1.5) + (skills[5] * 0.2) + (skills[6] * 0.2) + (skills[7] * 1.5)
-        average = average / 9
+        average = structures.pricing.get_weighted_sum(shortlist_player.get_skills()) / 9
 
         status = average < position_average
 
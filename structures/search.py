@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import unicodedata
+
+import data
+import structures.filters
+import structures.playertable
+
+
+# Position codes matched by each position filter option
+GROUPS = {1: ("GK",),
+          2: ("DL", "DR", "DC", "D"),
+          3: ("ML", "MR", "MC", "M"),
+          4: ("AF", "AS")}
+
+SKILLS = ("keeping",
+          "tackling",
+          "passing",
+          "shooting",
+          "heading",
+          "pace",
+          "stamina",
+          "ball_control",
+          "set_pieces")
+
+
+def fold_text(text):
+    '''
+    Return text with accents removed and case folded for matching.
+    '''
+    text = unicodedata.normalize("NFD", text)
+
+    return "".join(c for c in text if unicodedata.category(c) != "Mn").casefold()
+
+
+class NameIndex:
+    '''
+    Accent-folded player names and ids in player table row order.
+    '''
+    def __init__(self, players):
+        count = players.table.get_row_count()
+
+        self.names = [""] * count
+        self.playerids = [0] * count
+
+        for playerid, player in players.get_players():
+            self.names[player.row] = fold_text(player.get_name())
+            self.playerids[player.row] = playerid
+
+    def get_rows(self, text):
+        '''
+        Return rows of players whose name contains the given text.
+        '''
+        text = fold_text(text)
+
+        return [row for row, name in enumerate(self.names) if text in name]
+
+
+class Query:
+    '''
+    Player search compiled from filter options into tests over the player
+    table columns, returning the set of matching player ids.
+    '''
+    def __init__(self):
+        self.players = None
+        self.index = None
+
+    def get_index(self):
+        '''
+        Return name index, rebuilding it when a new game has been loaded.
+        '''
+        if self.players is not data.players:
+            self.players = data.players
+            self.index = NameIndex(data.players)
+
+        return self.index
+
+    def get_values(self):
+        '''
+        Return list of cached player values in player table row order.
+        '''
+        values = [0] * data.players.table.get_row_count()
+
+        for player in data.players.players.values():
+            values[player.row] = player.value.get_value()
+
+        return values
+
+    def get_tests(self, options):
+        '''
+        Return list of column, minimum and maximum tuples for each range
+        option which differs from its default.
+        '''
+        defaults = structures.filters.Player.defaults
+        table = data.players.table
+
+        tests = []
+
+        for name in SKILLS:
+            if options[name] != defaults[name]:
+                tests.append((table.get_column(name), *options[name]))
+
+        if options["age"] != defaults["age"]:
+            tests.append((data.players.get_ages(), *options["age"]))
+
+        if options["value"] != defaults["value"]:
+            tests.append((self.get_values(), *options["value"]))
+
+        return tests
+
+    def get_rows(self, options, text=""):
+        '''
+        Return player table rows matching search text and filter options.
+        '''
+        index = self.get_index()
+        table = data.players.table
+
+        if text:
+            rows = index.get_rows(text)
+        else:
+            rows = range(0, table.get_row_count())
+
+        if not options["own_players"]:
+            clubs = table.get_column("club")
+            rows = [row for row in rows if clubs[row] != data.user.clubid]
+
+        if options["position"] in GROUPS:
+            codes = {structures.playertable.POSITIONS.index(position)
+                     for position in GROUPS[options["position"]]}
+            positions = table.get_column("position")
+            rows = [row for row in rows if positions[row] in codes]
+
+        for column, minimum, maximum in self.get_tests(options):
+            rows = [row for row in rows if minimum <= column[row] <= maximum]
+
+        if options["status"] == 1:
+            rows = [row for row in rows
+                    if index.playerids[row] in data.purchase_list.listed]
+        elif options["status"] == 2:
+            rows = [row for row in rows
+                    if index.playerids[row] in data.loan_list.listed]
+        elif options["status"] == 3:
+            contracts = table.get_column("contract")
+            rows = [row for row in rows if contracts[row] == 0]
+        elif options["status"] == 4:
+            contracts = table.get_column("contract")
+            rows = [row for row in rows if contracts[row] <= 52]
+
+        if options["scout_recommends"]:
+            recommendations = data.user.club.scouts.recommendations
+            rows = [row for row in rows
+                    if recommendations.get_scout_recommends(data.players.get_player_by_row(row))]
+
+        return rows
+
+    def get_matches(self, options, text=""):
+        '''
+        Return set of player ids matching search text and filter options.
+        '''
+        index = self.get_index()
+
+        return {index.playerids[row] for row in self.get_rows(options, text)}
@@ -23,6 +23,8 @@ class Shortlist:
     def __init__(self):
         self.shortlist = set()
 
+        self.changed = set()
+
     def get_shortlist(self):
         '''
         Return complete set of shortlisted players.
@@ -40,6 +42,7 @@ class Shortlist:
         Add specified player id to the shortlist.
         '''
         self.shortlist.add(player)
+        self.changed.add(player.playerid)
 
     def remove_from_shortlist(self, player):
         '''
@@ -47,3 +50,4 @@ class Shortlist:
         '''
         if player in self.shortlist:
             self.shortlist.remove(player)
+            self.changed.add(player.playerid)
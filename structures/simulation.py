@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import random
+
+import data
+import structures.match
+import structures.start
+
+
+class Simulation:
+    '''
+    Headless season simulation which runs without window or dialogs.
+    '''
+    def __init__(self, season, seed=None, clubid=None):
+        self.season = season
+        self.seed = seed
+        self.clubid = clubid
+
+    def get_default_clubid(self):
+        '''
+        Return lowest club id in the season for use as the user club.
+        '''
+        data.database.cursor.execute("SELECT club FROM clubattr \
+                                     WHERE year = ? \
+                                     ORDER BY club",
+                                     (self.season,))
+
+        return data.database.cursor.fetchone()[0]
+
+    def setup(self):
+        '''
+        Seed random generator and initialise in-game data structures.
+        '''
+        if not data.database.connection:
+            data.database.connect(data.preferences.database_path)
+
+        random.seed(self.seed)
+
+        if self.clubid is None:
+            self.clubid = self.get_default_clubid()
+
+        start = structures.start.Start(self.clubid, self.season)
+        data.clubs.set_initial_balance(-1)
+        start.setup_initial_values()
+
+    def get_season_complete(self):
+        '''
+        Return whether every league has played its final round of fixtures.
+        '''
+        for leagueid, league in data.leagues.get_leagues():
+            rounds = min(league.fixtures.get_number_of_rounds(),
+                         len(league.fixtures.events))
+
+            if data.calendar.event < rounds:
+                return False
+
+        return True
+
+    def play_fixtures(self):
+        '''
+        Play every fixture scheduled for the current event in all leagues.
+        '''
+        fixtures = []
+
+        for leagueid, league in data.leagues.get_leagues():
+            fixtures.extend(league.fixtures.get_fixtures_for_week(data.calendar.event).values())
+
+        computer = structures.match.Computer(fixtures)
+        computer.play_fixtures()
+
+    def run(self):
+        '''
+        Advance through the season until all fixtures have been played.
+        '''
+        while not self.get_season_complete():
+            if data.calendar.get_fixture():
+                self.play_fixtures()
+                data.calendar.increment_event()
+            elif not data.date.skip_to_next_event():
+                break
+
+        data.events.process_end_of_season_events()
+
+    def get_standings(self):
+        '''
+        Return dictionary of final standings data for each league.
+        '''
+        standings = {}
+
+        for leagueid, league in data.leagues.get_leagues():
+            standings[leagueid] = league.standings.get_data()
+
+        return standings
+
+
+def simulate_season(season, seed=None, clubid=None):
+    '''
+    Simulate an entire season and return the final league standings.
+    '''
+    simulation = Simulation(season, seed, clubid)
+    simulation.setup()
+    simulation.run()
+
+    return simulation.get_standings()
@@ -19,7 +19,6 @@
 import random
 
 import data
-import uigtk.sponsorship
 
 
 class Sponsorship:
@@ -100,6 +99,8 @@ class Sponsorship:
         '''
         Determine which message dialog to display to the user.
         '''
+        import uigtk.sponsorship
+
         if self.status == 0:
             uigtk.sponsorship.NoOffer()
         elif self.status == 1:
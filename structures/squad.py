@@ -20,7 +20,7 @@ import random
 
 import data
 import structures.formations
-import uigtk.shared
+import structures.pricing
 
 
 class Squad:
@@ -31,18 +31,41 @@ class Squad:
         self.teamselection = TeamSelection()
         self.teamgenerator = TeamGenerator(club)
 
+        self.ratings = None
+        self.teamselection.clear_goalscorers()
+
     def add_to_squad(self, player):
         '''
         Add player id to squad list.
         '''
         self.squad[player.playerid] = player
 
+        self.clear_ratings()
+
     def remove_from_squad(self, playerid):
         '''
         Remove passed player id from squad list.
         '''
         del self.squad[playerid]
 
+        self.clear_ratings()
+
+    def get_ratings(self):
+        '''
+        Return rating index for squad, building it if out of date.
+        '''
+        if self.ratings is None:
+            self.ratings = Ratings(self.squad.values())
+
+        return self.ratings
+
+    def clear_ratings(self):
+        '''
+        Invalidate rating index after squad or skill changes.
+        '''
+        self.ratings = None
+        self.teamselection.clear_goalscorers()
+
     def get_player_in_squad(self, player):
         '''
         Return whether player id is in squad listing.
@@ -97,6 +120,8 @@ class Squad:
         '''
         Determine whether player can be released from club.
         '''
+        import uigtk.shared
+
         if len(self.squad) < 17:
             uigtk.shared.SquadSize(1)
             return False
@@ -132,6 +157,10 @@ class TeamSelection:
         self.team = [None] * 11
         self.subs = [None] * 5
 
+        self.goalscorers = None     # Cached goalscorer weights
+
+        self.changed = False
+
     def add_to_team(self, player, positionid):
         '''
         Add player to team or move if already in team.
@@ -139,6 +168,7 @@ class TeamSelection:
         self.remove_from_team(player)
 
         self.team[positionid] = player
+        self.changed = True
 
     def add_to_subs(self, player, positionid):
         '''
@@ -147,6 +177,7 @@ class TeamSelection:
         self.remove_from_team(player)
 
         self.subs[positionid] = player
+        self.changed = True
 
     def remove_from_team(self, player):
         '''
@@ -169,6 +200,7 @@ class TeamSelection:
         player = self.team[positionid]
         data.user.club.tactics.remove_responsiblity(player)
         self.team[positionid] = None
+        self.changed = True
 
     def remove_from_subs_by_position(self, positionid):
         '''
@@ -177,6 +209,13 @@ class TeamSelection:
         player = self.team[positionid]
         data.user.club.tactics.remove_responsiblity(player)
         self.subs[positionid] = None
+        self.changed = True
+
+    def clear_goalscorers(self):
+        '''
+        Invalidate cached goalscorer weights after skill or position changes.
+        '''
+        self.goalscorers = None
 
     def get_team_selection(self):
         '''
@@ -276,32 +315,17 @@ class TeamGenerator:
         formationid = self.generate_formation()
         formation = self.formation.get_formation_by_id(formationid)
 
+        ratings = self.club.squad.get_ratings()
+
         selection = []
+        selected = set()
 
         for position in formation[1]:
-            scores = {}
-
-            for playerid, player in self.club.squad.get_squad():
-                if player not in selection:
-                    skills = player.get_skills()
-                    score = sum(skills)
-
-                    if position == player.position:
-                        if position in ("GK"):
-                            score = player.keeping * 2.5
-                        elif position in ("DL", "DR", "DC", "D"):
-                            score = player.tackling * 2.5
-                        elif position in ("ML", "MR", "MC", "M"):
-                            score = player.passing * 2.5
-                        elif position in ("AS", "AF"):
-                            score = player.shooting * 2.5
-                    else:
-                        score *= 0.1
-
-                    scores[player] = score
-
-            sorted_scores = sorted(scores, key=lambda x: scores[x], reverse=True)
-            selection.append(sorted_scores[0])
+            player = ratings.get_best_for_position(position, selected)
+
+            if player:
+                selection.append(player)
+                selected.add(player)
 
         for count, player in enumerate(selection):
             self.teamselection.add_to_team(player, count)
@@ -310,32 +334,96 @@ class TeamGenerator:
         '''
         Generate five substitution members and assign to substitutions.
         '''
-        selection = []
+        ratings = self.club.squad.get_ratings()
+
+        excluded = set(self.teamselection.get_team_selection())
+        selection = ratings.get_best_players(excluded, 5)
 
-        for count in range(0, 5):
-            scores = {}
+        for count, player in enumerate(selection):
+            self.teamselection.add_to_subs(player, count)
 
-            for playerid, player in self.club.squad.get_squad():
-                if player not in selection:
-                    if player not in self.teamselection.get_team_selection():
-                        skills = player.get_skills()
-                        score = sum(skills)
 
-                        if player.position in ("GK"):
-                            score = player.keeping * 2.5
-                        elif player.position in ("DL", "DR", "DC", "D"):
-                            score = player.tackling * 2.5
-                        elif player.position in ("ML", "MR", "MC", "M"):
-                            score = player.passing * 2.5
-                        elif player.position in ("AS", "AF"):
-                            score = player.shooting * 2.5
-                        else:
-                            score *= 0.1
+class Ratings:
+    '''
+    Ranked index of squad players by position, built once per squad change.
+    '''
+    def __init__(self, players):
+        self.positions = {}
+        self.totals = []
+        self.ranked = []
+        self.average = 0
 
-                        scores[player] = score
+        for order, player in enumerate(players):
+            score = self.get_position_score(player)
+            skills = player.get_skills()
+            total = sum(skills) * 0.1
 
-            sorted_scores = sorted(scores, key=lambda x: scores[x], reverse=True)
-            selection.append(sorted_scores[0])
+            self.average += structures.pricing.get_weighted_sum(skills) / 9
 
-        for count, player in enumerate(selection):
-            self.teamselection.add_to_subs(player, count)
+            self.positions.setdefault(player.position, []).append((-score, order, player))
+            self.totals.append((-total, order, player))
+            self.ranked.append((-score, order, player))
+
+        if self.ranked:
+            self.average /= len(self.ranked)
+
+        for ranking in self.positions.values():
+            ranking.sort()
+
+        self.totals.sort()
+        self.ranked.sort()
+
+    def get_position_score(self, player):
+        '''
+        Return score for player playing in their own position.
+        '''
+        if player.position in ("GK"):
+            score = player.keeping * 2.5
+        elif player.position in ("DL", "DR", "DC", "D"):
+            score = player.tackling * 2.5
+        elif player.position in ("ML", "MR", "MC", "M"):
+            score = player.passing * 2.5
+        elif player.position in ("AS", "AF"):
+            score = player.shooting * 2.5
+        else:
+            score = sum(player.get_skills()) * 0.1
+
+        return score
+
+    def get_best_for_position(self, position, selected):
+        '''
+        Return highest scoring unselected player for formation position.
+        '''
+        best = None
+
+        for item in self.positions.get(position, ()):
+            if item[2] not in selected:
+                best = item
+                break
+
+        for item in self.totals:
+            if item[2] not in selected and item[2].position != position:
+                if best is None or item[:2] < best[:2]:
+                    best = item
+
+                break
+
+        if best:
+            return best[2]
+
+        return None
+
+    def get_best_players(self, excluded, count):
+        '''
+        Return highest scoring players not in the excluded set.
+        '''
+        selection = []
+
+        for score, order, player in self.ranked:
+            if len(selection) == count:
+                break
+
+            if player not in excluded:
+                selection.append(player)
+
+        return selection
@@ -240,7 +240,20 @@ class Stadiums:
         return self.stadiums[stadiumid]
 
     def populate_data(self):
-        data.database.cursor.execute("SELECT * FROM stadium \
+        data.database.cursor.execute("SELECT stadium.id, name, \
+                                     north, east, south, west, \
+                                     northeast, northwest, southeast, southwest, \
+                                     northbox, eastbox, southbox, westbox, \
+                                     northroof, eastroof, southroof, westroof, \
+                                     northeastroof, northwestroof, \
+                                     southeastroof, southwestroof, \
+                                     northseating, eastseating, \
+                                     southseating, westseating, \
+                                     northeastseating, northwestseating, \
+                                     southeastseating, southwestseating, \
+                                     stall, programme, smallshop, largeshop, \
+                                     bar, burgerbar, cafe, restaurant \
+                                     FROM stadium \
                                      JOIN stadiumattr \
                                      ON stadium.id = stadiumattr.stadium \
                                      WHERE year = ?",
@@ -253,12 +266,12 @@ class Stadiums:
 
             stadium.name = item[1]
 
-            main_capacity = item[5:9]
-            corner_capacity = item[9:13]
-            box_capacity = item[13:17]
-            roof = item[17:25]
-            seating = item[25:33]
-            shops = item[33:]
+            main_capacity = item[2:6]
+            corner_capacity = item[6:10]
+            box_capacity = item[10:14]
+            roof = item[14:22]
+            seating = item[22:30]
+            shops = item[30:]
 
             for count in range(0, 4):
                 stand = MainStand()
@@ -24,13 +24,11 @@ import data
 
 class Staff:
     def __init__(self):
-        self.surnames = []
+        self.surnames = data.reference.get_surnames()
 
         self.available = {}
         self.hired = {}
 
-        self.populate_surnames()
-
     def get_staff_count(self):
         '''
         Return the number of staff which have been hired.
@@ -43,12 +41,6 @@ class Staff:
         '''
         return sum(staff.wage for staff in self.hired.values())
 
-    def populate_surnames(self):
-        data.database.cursor.execute("SELECT * FROM staff")
-
-        for name in data.database.cursor.fetchall():
-            self.surnames.append(name[0])
-
 
 class Member(Staff):
     '''
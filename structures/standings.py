@@ -23,6 +23,11 @@ import structures.number
 class Standings:
     def __init__(self):
         self.standings = {}
+        self.changed = set()
+
+        self.order = []
+        self.positions = {}
+        self.added = {}
 
         self.number = structures.number.Number()
 
@@ -31,52 +36,88 @@ class Standings:
         Adds passed clubid to standing with new object.
         '''
         self.standings[clubid] = Standing(clubid)
+        self.changed.add(clubid)
 
-    def get_data(self):
+        self.added[clubid] = len(self.added)
+        self.positions[clubid] = len(self.order)
+        self.order.append(clubid)
+
+    def get_rank_key(self, clubid):
         '''
-        Return the sorted league standings.
+        Return ascending sort key for the standing of given club id.
+        '''
+        standing = self.standings[clubid]
+
+        return (-standing.points,
+                -standing.goal_difference,
+                -standing.goals_for,
+                -standing.goals_against,
+                self.added[clubid])
+
+    def update_order(self, clubids):
+        '''
+        Reinsert passed club ids into rank order after their standing changed.
         '''
-        standings = []
+        for clubid in clubids:
+            self.order.remove(clubid)
 
-        for clubid, standing in self.standings.items():
-            club = data.clubs.get_club_by_id(clubid)
-            item = standing.get_standing_data()
-            standings.append(item)
+        for clubid in clubids:
+            key = self.get_rank_key(clubid)
 
+            low = 0
+            high = len(self.order)
+
+            while low < high:
+                middle = (low + high) // 2
+
+                if self.get_rank_key(self.order[middle]) < key:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            self.order.insert(low, clubid)
+
+        for position, clubid in enumerate(self.order):
+            self.positions[clubid] = position
+
+    def get_order(self):
+        '''
+        Return list of club ids in current standings order.
+        '''
         if data.calendar.event == 0:
-            standings = sorted(standings,
-                               key=lambda item: data.clubs.get_club_by_id(item[0]).name)
-        else:
-            standings = sorted(standings,
-                               key=lambda item: (item[8], item[7], item[5], item[6]),
-                               reverse=True)
+            return sorted(self.order,
+                          key=lambda clubid: data.clubs.get_club_by_id(clubid).name)
 
-        return standings
+        return self.order
+
+    def get_data(self):
+        '''
+        Return the sorted league standings.
+        '''
+        return [self.standings[clubid].get_standing_data() for clubid in self.get_order()]
 
     def get_standing_for_club(self, clubid):
         '''
         Get standing data list for given club id.
         '''
-        for standing in self.get_data():
-            if clubid == standing[0]:
-                return standing
+        return self.standings[clubid].get_standing_data()
 
     def get_position_for_club(self, clubid):
         '''
         Return the position for the given club id.
         '''
-        for position, standing in enumerate(self.get_data(), start=1):
-            if clubid == standing[0]:
-                return self.number.get_ordinal_number(position)
+        if data.calendar.event == 0:
+            position = self.get_order().index(clubid)
+        else:
+            position = self.positions[clubid]
+
+        return self.number.get_ordinal_number(position + 1)
 
     def get_club_for_position(self, position):
         '''
         Return the clubid for the given position.
         '''
-        standings = self.get_data()
-        clubid = standings[position - 1]
-
-        return clubid
+        return self.get_order()[position - 1]
 
     def update_standing(self, fixture):
         '''
@@ -129,14 +170,33 @@ class Standings:
             fixture.home.club.form.add_form("D")
             fixture.away.club.form.add_form("D")
 
+        self.changed.update((home.clubid, away.clubid))
+
+        self.update_order((home.clubid, away.clubid))
+
     def clear_standings(self):
         '''
         Completely empty standings list.
         '''
+        self.changed.update(self.standings)
         self.standings.clear()
 
+        self.order.clear()
+        self.positions.clear()
+        self.added.clear()
+
 
 class Standing:
+    __slots__ = ("clubid",
+                 "played",
+                 "wins",
+                 "draws",
+                 "losses",
+                 "goals_for",
+                 "goals_against",
+                 "goal_difference",
+                 "points")
+
     def __init__(self, clubid):
         self.clubid = clubid
         self.played = 0
@@ -16,31 +16,35 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import logging
+
 import data
 import structures.buildings
 import structures.calendar
+import structures.catering
 import structures.charts
-import structures.clubs
 import structures.companies
+import structures.comparison
 import structures.computer
 import structures.date
 import structures.events
 import structures.finances
 import structures.injuries
-import structures.leagues
+import structures.loader
 import structures.loans
-import structures.nations
+import structures.merchandise
 import structures.negotiations
-import structures.players
 import structures.proceed
-import structures.referees
 import structures.seasons
-import structures.stadiums
 import structures.staff
 import structures.suspensions
+import structures.transfer
 import structures.user
 
 
+logger = logging.getLogger(__name__)
+
+
 class Start:
     '''
     Object initialisation for in-game data structures.
@@ -48,6 +52,10 @@ class Start:
     def __init__(self, clubid, season):
         data.unsaved = True
 
+        data.journal = None
+
+        data.reference.clear()
+
         data.calendar = structures.calendar.Calendar()
         data.date = structures.date.Date(season)
         data.continuegame = structures.proceed.ContinueGame()
@@ -63,13 +71,12 @@ class Start:
         data.injuries = structures.injuries.Injuries()
         data.suspensions = structures.suspensions.Suspensions()
         data.comparison = structures.comparison.Comparison()
+        data.purchase_list = structures.transfer.PurchaseList()
+        data.loan_list = structures.transfer.LoanList()
 
-        data.nations = structures.nations.Nations()
-        data.leagues = structures.leagues.Leagues(season)
-        data.referees = structures.referees.Referees(season)
-        data.stadiums = structures.stadiums.Stadiums(season)
-        data.clubs = structures.clubs.Clubs(season)
-        data.players = structures.players.Players(season)
+        self.loader = structures.loader.Loader(season)
+        self.loader.load()
+        self.log_load_timings()
 
         data.goalscorers = structures.charts.Goalscorers()
         data.assists = structures.charts.Assists()
@@ -82,6 +89,15 @@ class Start:
 
         data.user = structures.user.User(clubid)
 
+    def log_load_timings(self):
+        '''
+        Log time taken by each phase of loading the game world.
+        '''
+        for name, seconds in self.loader.get_timings():
+            logger.debug("Loaded %s in %.3f seconds", name, seconds)
+
+        logger.debug("Loaded game world in %.3f seconds", self.loader.get_total_time())
+
     def set_manager_name(self, name):
         '''
         Set passed manager name argument and add to names list.
@@ -94,36 +110,49 @@ class Start:
         Setup initial values for each club.
         '''
         data.leagues.generate_fixtures()
+        data.calendar.compile_season(data.date.year)
 
-        data.purchase_list = structures.transfer.PurchaseList()
-        data.loan_list = structures.transfer.LoanList()
+        self.setup_club_values()
+
+        self.publish_initial_news()
+
+    def setup_club_values(self):
+        '''
+        Setup transfer lists and initial values for the user club.
+        '''
+        data.purchase_list.refresh_list()
+        data.loan_list.refresh_list()
 
-        data.user.club.hoardings.maximum = 48
         data.user.club.hoardings.generate_adverts(36)
+        data.user.club.programmes.generate_adverts(24)
+
+        data.user.club.coaches.generate_initial_staff()
+        data.user.club.scouts.generate_initial_staff()
+
+        data.user.club.tickets.set_initial_prices()
+        data.user.club.tickets.set_initial_school_tickets()
+        data.user.club.tickets.set_initial_season_tickets()
+
+        self.setup_club_limits()
+
+    def setup_club_limits(self):
+        '''
+        Setup limits and expectation derived from the user club reputation.
+        '''
+        data.user.club.hoardings.maximum = 48
 
         if data.user.club.reputation < 10:
             data.user.club.programmes.maximum = 36
         else:
             data.user.club.programmes.maximum = 48
 
-        data.user.club.programmes.generate_adverts(24)
-
         if data.user.club.reputation < 13:
             data.user.club.stadium.buildings.maximum_plots = 60
         else:
             data.user.club.stadium.buildings.maximum_plots = 80
 
-        data.user.club.coaches.generate_initial_staff()
-        data.user.club.scouts.generate_initial_staff()
-
-        data.user.club.tickets.set_initial_prices()
-        data.user.club.tickets.set_initial_school_tickets()
-        data.user.club.tickets.set_initial_season_tickets()
-
         data.user.club.expectation.generate_expectation()
 
-        self.publish_initial_news()
-
     def publish_initial_news(self):
         '''
         Publish initial news articles for user on starting new game.
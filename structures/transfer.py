@@ -16,11 +16,49 @@
 #  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import array
 import random
 
 import data
 
 
+def get_skill_totals():
+    '''
+    Return array of summed skills for every player in player table row order.
+    '''
+    return array.array("i", map(sum, zip(*data.players.get_skill_columns())))
+
+
+def get_candidates(bonuses=None):
+    '''
+    Return players at computer clubs scoring below their squad threshold,
+    with optional score bonuses given in player table row order.
+    '''
+    totals = get_skill_totals()
+
+    randint = random.randint
+    choice = random.choice
+    flags = (False, True)
+
+    candidates = []
+
+    for clubid, club in data.clubs.get_clubs():
+        if club is not data.user.club:
+            players = list(club.squad.squad.values())
+            scores = [totals[player.row] * randint(1, 3) for player in players]
+
+            if bonuses:
+                scores = [score + bonuses[player.row] for score, player in zip(scores, players)]
+
+            average = sum(score / count for count, score in enumerate(scores, start=1))
+            threshold = average * 0.125
+
+            candidates.extend(player for player, score in zip(players, scores)
+                              if choice(flags) and score < threshold)
+
+    return candidates
+
+
 class Transfers:
     '''
     List of in-game transfers between clubs.
@@ -48,40 +86,40 @@ class TransferType:
 
 class TransferList:
     def __init__(self):
-        self.listed = []
+        self.listed = {}
+
+        self.changed = set()
 
     def get_listed(self):
         '''
-        Return list of players available for transfer.
+        Return list of players available for transfer in listing order.
         '''
-        return self.listed
+        return list(self.listed.values())
 
     def get_player_listed(self, player):
         '''
         Return if player is listed for transfer.
         '''
-        state = False
-
-        for listing in self.listed:
-            if listing.player is player:
-                state = True
-
-        return state
+        return player.playerid in self.listed
 
     def add_to_list(self, listing):
         '''
-        Add specified player to the list.
+        Add specified player to the list if not already listed.
         '''
-        if listing not in self.listed:
-            self.listed.append(listing)
+        if listing.player.playerid not in self.listed:
+            self.listed[listing.player.playerid] = listing
+            self.changed.add(listing.player.playerid)
+
+            data.players.increment_generation()
 
     def remove_from_list(self, player):
         '''
         Remove specified player from the list.
         '''
-        for listing in self.listed:
-            if listing.player is player:
-                self.listed.remove(listing)
+        if self.listed.pop(player.playerid, None):
+            self.changed.add(player.playerid)
+
+            data.players.increment_generation()
 
 
 class PurchaseList(TransferList):
@@ -97,35 +135,23 @@ class PurchaseList(TransferList):
             self.value = value
 
             player.not_for_sale = False
-
-    def __init__(self):
-        TransferList.__init__(self)
-
-        self.refresh_list()
+            player.set_changed()
 
     def refresh_list(self):
         '''
         Update players listed for purchase.
         '''
-        for clubid, club in data.clubs.get_clubs():
-            if club is not data.user.club:
-                score = {}
-                average = 0
-
-                for count, (playerid, player) in enumerate(club.squad.get_squad(), start=1):
-                    skills = player.get_skills()
-                    score[playerid] = sum(skills) * random.randint(1, 3)
-
-                    average += score[playerid] / count
-
-                for playerid in score:
-                    player = data.players.get_player_by_id(playerid)
+        listings = {}
 
-                    choice = random.choice((False, True))
+        for player in get_candidates():
+            if player.playerid in self.listed:
+                player.not_for_sale = False
+                player.set_changed()
+            else:
+                listings[player.playerid] = self.PurchaseListing(player, player.value.get_value())
 
-                    if score[playerid] < average * 0.125 and choice:
-                        listing = self.PurchaseListing(player, player.value.get_value())
-                        self.add_to_list(listing)
+        self.listed.update(listings)
+        self.changed.update(listings)
 
 
 class LoanList(TransferList):
@@ -136,36 +162,15 @@ class LoanList(TransferList):
         def __init__(self, player):
             self.player = player
 
-    def __init__(self):
-        TransferList.__init__(self)
-
-        self.refresh_list()
-
     def refresh_list(self):
         '''
         Update players listed for loan.
         '''
-        for clubid, club in data.clubs.get_clubs():
-            if club is not data.user.club:
-                score = {}
-                average = 0
-
-                for count, (playerid, player) in enumerate(club.squad.get_squad(), start=1):
-                    skills = player.get_skills()
-                    score[playerid] = sum(skills) * random.randint(1, 3)
-
-                    age = player.get_age()
-
-                    if age < 24:
-                        score[playerid] += 24 - age * age
-
-                    average += score[playerid] / count
-
-                for playerid in score:
-                    player = data.players.get_player_by_id(playerid)
+        bonuses = [24 - age * age if age < 24 else 0 for age in data.players.get_ages()]
 
-                    choice = random.choice((False, True))
+        listings = {player.playerid: self.LoanListing(player)
+                    for player in get_candidates(bonuses)
+                    if player.playerid not in self.listed}
 
-                    if score[playerid] < average * 0.125 and choice:
-                        listing = self.LoanListing(player)
-                        self.add_to_list(listing)
+        self.listed.update(listings)
+        self.changed.update(listings)
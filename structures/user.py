@@ -74,9 +74,7 @@ class Names:
         '''
         self.add_name(name)
 
-        for article in data.user.club.news.articles.values():
-            article.title = article.title.replace(data.user.club.manager, name)
-            article.message = article.message.replace(data.user.club.manager, name)
+        data.user.club.news.replace_name(data.user.club.manager, name)
 
         data.user.club.manager = name
 
@@ -17,96 +17,44 @@
 
 
 import data
+import structures.pricing
 
 
 class Value:
     def __init__(self, player):
         self.player = player
 
+        self.value = None
+        self.age = None
+
     def get_value(self):
         '''
-        Get player value for associated attributes.
+        Return player value, recalculated if skills, position or age changed.
         '''
         age = self.player.get_age()
-        skills = self.player.get_skills()
-
-        if self.player.position in ("GK"):
-            primary = skills[0]
-        elif self.player.position in ("DL", "DR", "DC", "D"):
-            primary = skills[1]
-        elif self.player.position in ("ML", "MR", "MC", "M"):
-            primary = skills[2]
-        elif self.player.position in ("AS", "AF"):
-            primary = skills[3]
-
-        average = sum(skills[0:6]) + (skills[8] * 1.5) + (skills[5] * 0.2) + (skills[6] * 0.2) + (skills[7] * 1.5)
-        average += primary * 2
-        average = average / 9
 
-        if primary > 95:
-            value_multiplier = 5.25
-        elif primary >= 90:
-            value_multiplier = 3.5
-        elif primary > 85:
-            value_multiplier = 2.5
-        elif primary > 80:
-            value_multiplier = 1.8
-        elif primary > 75:
-            value_multiplier = 1.5
-        elif primary > 70:
-            value_multiplier = 1.25
-        elif primary > 60:
-            value_multiplier = 0.9
-        elif primary > 50:
-            value_multiplier = 0.55
-        elif primary > 40:
-            value_multiplier = 0.25
-        else:
-            value_multiplier = 0.12
+        if self.value is None or age != self.age:
+            self.value = self.calculate_value(age)
+            self.age = age
 
-        # Age modifier
-        if age >= 37:
-            age_multiplier = 0.1
-        elif age >= 34:
-            age_multiplier = 0.25
-        elif age >= 32:
-            age_multiplier = 0.5
-        elif age >= 30:
-            age_multiplier = 0.75
-        elif age == 29:
-            age_multiplier = 0.9
-        elif age >= 26:
-            age_multiplier = 1
-        elif age >= 24:
-            age_multiplier = 0.9
-        elif age >= 21:
-            age_multiplier = 0.8
-        elif age >= 18:
-            age_multiplier = 0.7
-        else:
-            age_multiplier = 0.5
+        return self.value
 
-        value = ((average * 1000) * average) * value_multiplier * 0.25
-        value = value * age_multiplier
-        value = self.value_rounder(value)
+    def set_stale(self):
+        '''
+        Mark cached value for recalculation on next request.
+        '''
+        self.value = None
 
-        return value
+    def calculate_value(self, age):
+        '''
+        Calculate player value for associated attributes at given age.
+        '''
+        return structures.pricing.get_value(self.player.get_skills(),
+                                            self.player.get_position_code(),
+                                            age)
 
     def get_value_as_string(self):
         '''
         Return player value with set currency as string.
         '''
         return data.currency.get_rounded_amount(self.get_value())
-
-    def value_rounder(self, value):
-        '''
-        Round calculated player value to nearest divisor.
-        '''
-        if value >= 1000000:
-            divisor = 100000
-        elif value >= 10000:
-            divisor = 1000
-
-        value = int(value - (value % divisor))
-
-        return value
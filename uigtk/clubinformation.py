@@ -22,6 +22,7 @@ from gi.repository import Gdk
 import data
 import structures.number
 import structures.skills
+import uigtk.contextmenu
 import uigtk.playersearch
 import uigtk.widgets
 
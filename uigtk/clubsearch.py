@@ -23,6 +23,7 @@ import unicodedata
 
 import data
 import structures.filters
+import uigtk.shared
 import uigtk.widgets
 
 
@@ -20,6 +20,7 @@ from gi.repository import Gtk
 
 import data
 import structures.transfer
+import uigtk.shared
 import uigtk.widgets
 
 
@@ -124,7 +125,7 @@ class ContextMenu1(ContextMenu):
         '''
         Query user to renew contract of selected player.
         '''
-        dialog = uigtk.squad.RenewContract(self.player)
+        dialog = RenewContract(self.player)
 
         if dialog.show():
             data.window.screen.refresh_visible_screen()
@@ -133,7 +134,7 @@ class ContextMenu1(ContextMenu):
         '''
         Query user to terminate contract of selected player.
         '''
-        dialog = uigtk.squad.TerminateContract(self.player)
+        dialog = TerminateContract(self.player)
 
         if dialog.show():
             self.player.contract.terminate_contract()
@@ -144,6 +145,7 @@ class ContextMenu1(ContextMenu):
         Toggle not for sale flag on player object.
         '''
         self.player.not_for_sale = checkmenuitem.get_active()
+        self.player.set_changed()
 
     def update_sensitivity(self):
         '''
@@ -199,7 +201,7 @@ class ContextMenu2(ContextMenu):
         '''
         Remove player from shortlist.
         '''
-        dialog = uigtk.shortlist.RemoveShortlist()
+        dialog = RemoveShortlist()
 
         if dialog.show(self.player):
             data.user.club.shortlist.remove_from_shortlist(self.player)
@@ -219,3 +221,63 @@ class ContextMenu2(ContextMenu):
         else:
             self.menuitemPurchase.set_label("Make Offer To _Sign")
             self.menuitemLoan.set_sensitive(False)
+
+
+class RenewContract(uigtk.shared.ContractNegotiation):
+    def __init__(self, player):
+        self.player = player
+
+        uigtk.shared.ContractNegotiation.__init__(self)
+        self.set_title("Renew Contract")
+        self.add_button("_Renew", Gtk.ResponseType.OK)
+
+        self.labelContract.set_label("Contract renewal details for %s." % (player.get_name(mode=1)))
+
+
+class TerminateContract(Gtk.MessageDialog):
+    '''
+    Confirmation dialog to arrange termination of a players contract.
+    '''
+    def __init__(self, player):
+        payout = data.currency.get_amount(player.contract.get_termination_payout())
+        payout = data.currency.get_comma_value(payout)
+
+        Gtk.MessageDialog.__init__(self)
+        self.set_transient_for(data.window)
+        self.set_modal(True)
+        self.set_title("Terminate Contract")
+        self.set_property("message-type", Gtk.MessageType.QUESTION)
+        self.set_markup("<span size='12000'><b>Do you wish to terminate the contract of %s?</b></span>" % (player.get_name(mode=1)))
+        self.format_secondary_text("The player will be paid %s%s for the remainder of his contract." % (data.currency.get_currency_symbol(), payout))
+        self.add_button("_Do Not Terminate", Gtk.ResponseType.CANCEL)
+        self.add_button("_Terminate Contract", Gtk.ResponseType.OK)
+        self.set_default_response(Gtk.ResponseType.CANCEL)
+
+    def show(self):
+        state = self.run() == Gtk.ResponseType.OK
+        self.destroy()
+
+        return state
+
+
+class RemoveShortlist(Gtk.MessageDialog):
+    '''
+    Message dialog displayed when user attempts to remove player from shortlist.
+    '''
+    def __init__(self):
+        Gtk.MessageDialog.__init__(self)
+        self.set_transient_for(data.window)
+        self.set_title("Remove From Shortlist")
+        self.set_property("message-type", Gtk.MessageType.QUESTION)
+        self.format_secondary_text("Removal will not affect any ongoing transfer negotiations.")
+        self.add_button("_Do Not Remove", Gtk.ResponseType.CANCEL)
+        self.add_button("_Remove", Gtk.ResponseType.OK)
+        self.set_default_response(Gtk.ResponseType.CANCEL)
+
+    def show(self, player):
+        self.set_markup("<span size='12000'><b>Remove %s from shortlist?</b></span>" % (player.get_name(mode=1)))
+
+        state = self.run() == Gtk.ResponseType.OK
+        self.destroy()
+
+        return state
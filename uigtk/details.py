@@ -19,6 +19,9 @@
 from gi.repository import Gtk
 
 import data
+import structures.finances
+import structures.journal
+import structures.seasons
 import structures.start
 import uigtk.mainscreen
 import uigtk.widgets
@@ -331,6 +334,8 @@ class Details(uigtk.widgets.Grid):
 
         start.setup_initial_values()
 
+        structures.journal.start_autosave()
+
         data.database.close()
 
     def set_initial_finances(self):
@@ -19,6 +19,9 @@
 from gi.repository import Gtk
 
 import data
+import structures.journal
+import structures.savegame
+import uigtk.quitdialog
 
 
 class LoadDialog(Gtk.FileChooserDialog):
@@ -45,6 +48,108 @@ class LoadDialog(Gtk.FileChooserDialog):
         self.show()
 
     def on_response(self, dialog, response):
+        self.hide()
+
+        if response == Gtk.ResponseType.OK:
+            self.load_game(self.get_filename())
+
+        self.destroy()
+
+    def get_game_running(self):
+        '''
+        Return whether the main game screen is currently displayed.
+        '''
+        return data.window.mainscreen.get_parent() is data.window
+
+    def get_discard_confirmed(self):
+        '''
+        Offer to save unsaved game before it is replaced, returning whether
+        loading should continue.
+        '''
+        if not data.unsaved:
+            return True
+
+        dialog = uigtk.quitdialog.UnsavedDialog()
+        dialog.set_title("Load Game")
+        response = dialog.run()
+        dialog.destroy()
+
+        if response == Gtk.ResponseType.ACCEPT:
+            dialog = SaveDialog()
+            response = dialog.run()
+            dialog.destroy()
+
+            return response == Gtk.ResponseType.OK
+
+        return response == Gtk.ResponseType.REJECT
+
+    def load_game(self, filepath):
+        '''
+        Load saved game from given filepath and display main game screen.
+        '''
+        running = self.get_game_running()
+
+        if running and not self.get_discard_confirmed():
+            return
+
+        calendar = data.calendar
+
+        data.database.connect(data.preferences.database_path)
+
+        journal = structures.journal.Journal(filepath)
+
+        try:
+            loaded = journal.load()
+            error = "The file is not a recognised saved game."
+        except Exception as exception:
+            loaded = False
+            error = str(exception)
+
+        if not loaded:
+            data.database.close()
+
+            # Game data is only replaced once the file header has been read
+            if running and data.calendar is not calendar:
+                data.window.welcome.set_show_welcome_screen()
+
+            LoadError(error)
+
+            return
+
+        if not running:
+            data.window.remove(data.window.welcome)
+            data.window.add(data.window.mainscreen)
+            data.window.mainscreen.grid.attach(data.window.screen, 0, 0, 1, 1)
+
+        data.window.mainscreen.information.update_date()
+
+        data.window.screen.run()
+        data.window.screen.change_visible_screen(data.preferences.start_screen)
+        data.window.screen.clear_previous_screens()
+
+        structures.journal.start_autosave()
+
+        data.database.close()
+
+
+class LoadError(Gtk.MessageDialog):
+    '''
+    Dialog displayed when a saved game could not be loaded.
+    '''
+    def __init__(self, error):
+        Gtk.MessageDialog.__init__(self)
+        self.set_transient_for(data.window)
+        self.set_modal(True)
+        self.set_title("Load Game")
+        self.set_property("message-type", Gtk.MessageType.ERROR)
+        self.set_markup("<span size='12000'><b>The saved game could not be loaded.</b></span>")
+        self.format_secondary_text(error)
+        self.add_button("_Close", Gtk.ResponseType.CLOSE)
+        self.connect("response", self.on_response)
+
+        self.show()
+
+    def on_response(self, *args):
         self.destroy()
 
 
@@ -62,8 +167,21 @@ class SaveDialog(Gtk.FileChooserDialog):
         self.set_default_response(Gtk.ResponseType.OK)
         self.set_action(Gtk.FileChooserAction.SAVE)
         self.set_current_folder(data.preferences.save_path)
+        self.connect("response", self.on_response)
 
         filefilter = Gtk.FileFilter()
         filefilter.set_name("Saved Game")
         filefilter.add_pattern("*.osm")
         self.add_filter(filefilter)
+
+    def on_response(self, dialog, response):
+        if response == Gtk.ResponseType.OK:
+            filepath = self.get_filename()
+
+            if not filepath.endswith(".osm"):
+                filepath = "%s.osm" % (filepath)
+
+            savegame = structures.savegame.SaveGame(filepath)
+            savegame.save()
+
+            data.unsaved = False
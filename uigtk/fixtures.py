@@ -189,24 +189,23 @@ class Fixtures(uigtk.widgets.Grid):
         rounds = data.user.club.league.fixtures.get_number_of_rounds()
 
         for week in range(0, rounds):
-            fixtures = data.user.club.league.fixtures.get_fixtures_for_week(week)
-
-            for fixtureid, fixture in fixtures.items():
-                if data.user.club in (fixture.home.club, fixture.away.club):
-                    home = data.clubs.get_club_by_id(fixture.home.club.clubid)
-                    away = data.clubs.get_club_by_id(fixture.away.club.clubid)
-
-                    if fixture.result:
-                        result = "%i - %i" % (fixture.result)
-                    else:
-                        result = ""
-
-                    self.treestore.append(None, [fixtureid,
-                                                 home.name,
-                                                 result,
-                                                 away.name,
-                                                 home.stadium.name,
-                                                 400])
+            fixture = data.user.club.league.fixtures.get_fixture_for_club(week, data.user.club)
+
+            if fixture:
+                home = data.clubs.get_club_by_id(fixture.home.club.clubid)
+                away = data.clubs.get_club_by_id(fixture.away.club.clubid)
+
+                if fixture.result:
+                    result = "%i - %i" % (fixture.result)
+                else:
+                    result = ""
+
+                self.treestore.append(None, [fixture.fixtureid,
+                                             home.name,
+                                             result,
+                                             away.name,
+                                             home.stadium.name,
+                                             400])
 
     def run(self):
         self.populate_leagues()
@@ -23,6 +23,7 @@ import data
 import structures.individualtraining
 import structures.intensity
 import structures.skills
+import structures.speciality
 import uigtk.widgets
 
 
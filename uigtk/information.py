@@ -20,6 +20,7 @@ from gi.repository import Gtk
 
 import data
 import uigtk.infotip
+import uigtk.widgets
 
 
 class Information(Gtk.Grid):
@@ -113,26 +113,17 @@ class Match(uigtk.widgets.Grid):
         data.events.process_end_of_match_events(self.fixture)
 
         # Update other fixtures
+        fixtures = []
+
         for leagueid, league in data.leagues.get_leagues():
             for fixtureid in data.calendar.get_other_fixtures(leagueid):
                 fixture = league.fixtures.get_fixture_by_id(fixtureid)
 
                 if data.user.club not in (fixture.home.club, fixture.away.club):
-                    fixture.home.club.squad.generate_squad()
-                    fixture.away.club.squad.generate_squad()
-
-                    club = fixture.home.club
-                    fixture.home.team_selection[0] = club.squad.teamselection.team
-                    fixture.home.team_selection[1] = club.squad.teamselection.subs
-
-                    club = fixture.away.club
-                    fixture.away.team_selection[0] = club.squad.teamselection.team
-                    fixture.away.team_selection[1] = club.squad.teamselection.subs
-
-                    structures.match.Score(fixture)
-                    league.standings.update_standing(fixture)
+                    fixtures.append(fixture)
 
-                    data.events.process_end_of_match_events(fixture)
+        computer = structures.match.Computer(fixtures)
+        computer.play_fixtures()
 
         button.set_sensitive(False)
         self.buttonHomeTactics.set_sensitive(False)
@@ -21,9 +21,11 @@ from gi.repository import Gtk
 import data
 import uigtk.aboutdialog
 import uigtk.comparison
+import uigtk.deletedialog
 import uigtk.filedialog
 import uigtk.managername
 import uigtk.playersearch
+import uigtk.preferences
 import uigtk.printdialog
 import uigtk.quitdialog
 import uigtk.screen
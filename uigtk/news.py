@@ -22,6 +22,7 @@ import re
 
 import data
 import structures.news
+import uigtk.refresh
 import uigtk.widgets
 
 
@@ -142,7 +143,7 @@ class News(uigtk.widgets.Grid):
         if treeiter:
             newsid = model[treeiter][0]
             article = data.user.club.news.articles[newsid]
-            article.unread = False
+            data.user.club.news.set_unread(newsid, False)
 
             self.textview.textbuffer.set_text(article.message)
             self.textview.set_sensitive(True)
@@ -196,7 +197,7 @@ class News(uigtk.widgets.Grid):
         return display
 
     def populate_news(self):
-        self.liststoreNews.clear()
+        rows = []
 
         for articleid, article in data.user.club.news.articles.items():
             if article.unread:
@@ -204,14 +205,16 @@ class News(uigtk.widgets.Grid):
             else:
                 weight = 400
 
-            self.liststoreNews.append([articleid,
-                                       article.date,
-                                       article.title,
-                                       article.message,
-                                       article.category,
-                                       self.categories.get_category_by_id(article.category),
-                                       article.unread,
-                                       weight])
+            rows.append([articleid,
+                         article.date,
+                         article.title,
+                         article.message,
+                         article.category,
+                         self.categories.get_category_by_id(article.category),
+                         article.unread,
+                         weight])
+
+        uigtk.refresh.update_rows(self.liststoreNews, rows)
 
     def run(self):
         self.populate_news()
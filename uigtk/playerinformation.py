@@ -20,6 +20,7 @@ from gi.repository import Gtk
 from gi.repository import Gdk
 
 import data
+import structures.morale
 import structures.position
 import structures.skills
 import uigtk.contextmenu
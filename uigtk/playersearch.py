@@ -18,20 +18,71 @@
 
 from gi.repository import Gtk
 from gi.repository import Gdk
-import re
-import unicodedata
+from gi.repository import GObject
 
 import data
 import structures.filters
+import structures.search
 import structures.shortlist
 import structures.skills
 import uigtk.contextmenu
 import uigtk.negotiations
 import uigtk.shared
 import uigtk.shortlist
+import uigtk.squad
 import uigtk.widgets
 
 
+def get_clubid(player):
+    '''
+    Return club id of player, or zero if without club.
+    '''
+    return player.club.clubid if player.club else 0
+
+
+def get_club_name(player):
+    '''
+    Return club name of player, or empty string if without club.
+    '''
+    return player.club.name if player.club else ""
+
+
+# Type and value function of each player list column
+COLUMNS = ((int, lambda player: player.playerid),
+           (str, lambda player: player.get_name()),
+           (int, lambda player: player.get_age()),
+           (int, get_clubid),
+           (str, get_club_name),
+           (str, lambda player: player.nationality.name),
+           (str, lambda player: player.position),
+           (int, lambda player: player.keeping),
+           (int, lambda player: player.tackling),
+           (int, lambda player: player.passing),
+           (int, lambda player: player.shooting),
+           (int, lambda player: player.heading),
+           (int, lambda player: player.pace),
+           (int, lambda player: player.stamina),
+           (int, lambda player: player.ball_control),
+           (int, lambda player: player.set_pieces),
+           (int, lambda player: player.value.get_value()),
+           (str, lambda player: player.value.get_value_as_string()),
+           (int, lambda player: player.wage.get_wage()),
+           (str, lambda player: player.wage.get_wage_as_string()),
+           (int, lambda player: player.contract.contract),
+           (str, lambda player: player.contract.get_contract()),
+           (bool, lambda player: data.purchase_list.get_player_listed(player)),
+           (bool, lambda player: data.loan_list.get_player_listed(player)),
+           (str, lambda player: player.get_appearances()),
+           (int, lambda player: data.goalscorers.get_goals_for_player(player)),
+           (int, lambda player: data.assists.get_assists_for_player(player)),
+           (str, lambda player: data.cards.get_cards_string_for_player(player)),
+           (int, lambda player: player.man_of_the_match),
+           (str, lambda player: player.rating.get_average_rating()),
+           (bool, lambda player: player.injury.get_injured()),
+           (bool, lambda player: player.suspension.get_suspended()),
+           (bool, lambda player: False))
+
+
 class PlayerSearch(uigtk.widgets.Grid):
     __name__ = "playersearch"
 
@@ -79,17 +130,11 @@ class PlayerSearch(uigtk.widgets.Grid):
 
         PlayerSearch.playerlist = PlayerList()
 
-        self.treemodelfilter = PlayerSearch.playerlist.filter_new()
-        self.treemodelfilter.set_visible_func(self.filter_visible,
-                                              data.players.get_players())
-        self.treemodelsort = Gtk.TreeModelSort(self.treemodelfilter)
-        self.treemodelsort.set_sort_column_id(16, Gtk.SortType.DESCENDING)
-
         self.treeview = uigtk.widgets.TreeView()
         self.treeview.set_hexpand(True)
         self.treeview.set_vexpand(True)
         self.treeview.set_headers_clickable(True)
-        self.treeview.set_model(self.treemodelsort)
+        self.treeview.set_model(PlayerSearch.playerlist)
         self.treeview.connect("row-activated", self.on_row_activated)
         self.treeview.connect("button-release-event", self.on_button_release_event)
         self.treeview.connect("key-press-event", self.on_key_press_event)
@@ -101,7 +146,7 @@ class PlayerSearch(uigtk.widgets.Grid):
 
         # Personal
         treeviewcolumn = uigtk.widgets.TreeViewColumn(title="Name", column=1)
-        treeviewcolumn.set_sort_column_id(1)
+        self.set_sort_column(treeviewcolumn, 1)
         self.treeview.append_column(treeviewcolumn)
         treeviewcolumn = uigtk.widgets.TreeViewColumn(title="Age", column=2)
         self.treeview.append_column(treeviewcolumn)
@@ -112,10 +157,10 @@ class PlayerSearch(uigtk.widgets.Grid):
         treeviewcolumn = uigtk.widgets.TreeViewColumn(title="Position", column=6)
         self.treeview.append_column(treeviewcolumn)
         treeviewcolumn = uigtk.widgets.TreeViewColumn(title="Value", column=17)
-        treeviewcolumn.set_sort_column_id(16)
+        self.set_sort_column(treeviewcolumn, 16)
         self.tree_columns[0].append(treeviewcolumn)
         treeviewcolumn = uigtk.widgets.TreeViewColumn(title="Wage", column=19)
-        treeviewcolumn.set_sort_column_id(18)
+        self.set_sort_column(treeviewcolumn, 18)
         self.tree_columns[0].append(treeviewcolumn)
         treeviewcolumn = uigtk.widgets.TreeViewColumn(title="Contract", column=21)
         self.tree_columns[0].append(treeviewcolumn)
@@ -170,12 +215,53 @@ class PlayerSearch(uigtk.widgets.Grid):
                 column.set_visible(False)
                 self.treeview.append_column(column)
 
+        # Fixed row heights let the view only request values for drawn rows
+        for column in self.treeview.get_columns():
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+
+        self.treeview.set_fixed_height_mode(True)
+
         self.contextmenu1 = uigtk.contextmenu.ContextMenu1()
         self.contextmenu2 = uigtk.contextmenu.ContextMenu2()
         self.filter_dialog = Filter()
 
         PlayerSearch.playerfilter = structures.filters.Player()
 
+        self.query = structures.search.Query()
+        self.matches = set()
+
+    def set_sort_column(self, treeviewcolumn, column):
+        '''
+        Sort player list by given model column when header is clicked.
+        '''
+        treeviewcolumn.set_clickable(True)
+        treeviewcolumn.connect("clicked", self.on_sort_clicked, column)
+
+        if column == PlayerSearch.playerlist.sort_column:
+            treeviewcolumn.set_sort_indicator(True)
+            treeviewcolumn.set_sort_order(Gtk.SortType.DESCENDING)
+
+    def on_sort_clicked(self, treeviewcolumn, column):
+        '''
+        Change sort column, or reverse order if already sorted by column.
+        '''
+        if column == PlayerSearch.playerlist.sort_column:
+            descending = not PlayerSearch.playerlist.descending
+        else:
+            descending = column != 1
+
+        PlayerSearch.playerlist.set_sort(column, descending)
+
+        for item in self.treeview.get_columns():
+            item.set_sort_indicator(item is treeviewcolumn)
+
+        if descending:
+            treeviewcolumn.set_sort_order(Gtk.SortType.DESCENDING)
+        else:
+            treeviewcolumn.set_sort_order(Gtk.SortType.ASCENDING)
+
+        self.update_model()
+
     def on_view_changed(self, combobox):
         '''
         Change visible columns in view.
@@ -293,110 +379,31 @@ class PlayerSearch(uigtk.widgets.Grid):
         '''
         Refilter tree view and highlight top row.
         '''
-        self.treemodelfilter.refilter()
+        self.update_matches()
+        self.update_model()
 
-        if len(self.treemodelfilter) > 0:
+        if len(PlayerSearch.playerlist) > 0:
             self.treeview.scroll_to_cell(0)
             self.treeselection.select_path(0)
 
-    def filter_visible(self, model, treeiter, values):
-        visible = True
-
-        # Filter by search criteria
-        criteria = self.entrySearch.get_text()
-
-        for search in (model[treeiter][1],):
-            search = "".join((c for c in unicodedata.normalize("NFD", search) if unicodedata.category(c) != "Mn"))
-
-            if not re.findall(criteria, search, re.IGNORECASE):
-                visible = False
-
-        options = PlayerSearch.playerfilter.options
+    def update_matches(self):
+        '''
+        Run query for current search text and filter options.
+        '''
+        self.matches = set(self.query.get_rows(PlayerSearch.playerfilter.options,
+                                               self.entrySearch.get_text()))
 
-        # Filter user club
-        if visible:
-            if not options["own_players"]:
-                if model[treeiter][3] == data.user.clubid:
-                    visible = False
-
-        # Filter position
-        if visible:
-            if options["position"] == 1:
-                if model[treeiter][6] not in ("GK",):
-                    visible = False
-            elif options["position"] == 2:
-                if model[treeiter][6] not in ("DL", "DR", "DC", "D"):
-                    visible = False
-            elif options["position"] == 3:
-                if model[treeiter][6] not in ("ML", "MR", "MC", "M"):
-                    visible = False
-            elif options["position"] == 4:
-                if model[treeiter][6] not in ("AF", "AS"):
-                    visible = False
-
-        # Filter age
-        if visible:
-            visible = options["age"][0] <= model[treeiter][2] <= options["age"][1]
-
-        # Filter value
-        if visible:
-            visible = options["value"][0] <= model[treeiter][16] <= options["value"][1]
-
-        # Filter status
-        if visible:
-            if options["status"] == 1:
-                if not model[treeiter][22]:
-                    visible = False
-            if options["status"] == 2:
-                if not model[treeiter][23]:
-                    visible = False
-            elif options["status"] == 3:
-                if model[treeiter][20] != 0:
-                    visible = False
-            elif options["status"] == 4:
-                if model[treeiter][20] > 52:
-                    visible = False
-
-        # Filter skills
-        if visible:
-            visible = options["keeping"][0] <= model[treeiter][7] <= options["keeping"][1]
-
-        if visible:
-            visible = options["tackling"][0] <= model[treeiter][8] <= options["tackling"][1]
-
-        if visible:
-            visible = options["passing"][0] <= model[treeiter][9] <= options["passing"][1]
-
-        if visible:
-            visible = options["shooting"][0] <= model[treeiter][10] <= options["shooting"][1]
-
-        if visible:
-            visible = options["heading"][0] <= model[treeiter][11] <= options["heading"][1]
-
-        if visible:
-            visible = options["pace"][0] <= model[treeiter][12] <= options["pace"][1]
-
-        if visible:
-            visible = options["stamina"][0] <= model[treeiter][13] <= options["stamina"][1]
-
-        if visible:
-            visible = options["ball_control"][0] <= model[treeiter][14] <= options["ball_control"][1]
-
-        if visible:
-            visible = options["set_pieces"][0] <= model[treeiter][15] <= options["set_pieces"][1]
-
-        # Show scout recommended
-        if visible:
-            if options["scout_recommends"]:
-                playerid = model[treeiter][0]
-                player = data.players.get_player_by_id(playerid)
-
-                visible = data.user.club.scouts.recommendations.get_scout_recommends(player)
-
-        return visible
+    def update_model(self):
+        '''
+        Update displayed rows, detaching model while its rows are replaced.
+        '''
+        self.treeview.set_model(None)
+        PlayerSearch.playerlist.update(self.matches)
+        self.treeview.set_model(PlayerSearch.playerlist)
 
     def populate_data(self):
-        PlayerSearch.playerlist.update()
+        self.update_matches()
+        self.update_model()
 
     def run(self):
         self.populate_data()
@@ -405,58 +412,149 @@ class PlayerSearch(uigtk.widgets.Grid):
         PlayerSearch.treeselection.select_path(0)
 
 
-class PlayerList(Gtk.ListStore):
+class PlayerList(GObject.GObject, Gtk.TreeModel):
+    '''
+    List model over player table rows, computing display values only when
+    rows are drawn and sorting through a cached index of rows.
+    '''
     def __init__(self):
-        Gtk.ListStore.__init__(self)
-        self.set_column_types([int, str, int, int, str, str, str, int, int, int,
-                               int, int, int, int, int, int, int, str,int, str,
-                               int, str, bool, bool, str, int, int, str, int,
-                               str, bool, bool, bool])
-
-    def update(self):
-        self.clear()
-
-        for playerid, player in data.players.get_players():
-            if player.club:
-                clubid = player.club.clubid
-                club = player.club.name
-            else:
-                clubid = None
-                club = ""
-
-            self.append([playerid,
-                         player.get_name(),
-                         player.get_age(),
-                         clubid,
-                         club,
-                         player.nationality.name,
-                         player.position,
-                         player.keeping,
-                         player.tackling,
-                         player.passing,
-                         player.shooting,
-                         player.heading,
-                         player.pace,
-                         player.stamina,
-                         player.ball_control,
-                         player.set_pieces,
-                         player.value.get_value(),
-                         player.value.get_value_as_string(),
-                         player.wage.get_wage(),
-                         player.wage.get_wage_as_string(),
-                         player.contract.contract,
-                         player.contract.get_contract(),
-                         data.purchase_list.get_player_listed(player),
-                         data.loan_list.get_player_listed(player),
-                         player.get_appearances(),
-                         data.goalscorers.get_goals_for_player(player),
-                         data.assists.get_assists_for_player(player),
-                         data.cards.get_cards_string_for_player(player),
-                         player.man_of_the_match,
-                         player.rating.get_average_rating(),
-                         player.injury.get_injured(),
-                         player.suspension.get_suspended(),
-                         False])
+        GObject.GObject.__init__(self)
+
+        self.rows = []
+        self.indexes = {}
+        self.generation = None
+
+        self.sort_column = 16
+        self.descending = True
+
+    def get_sort_keys(self, column):
+        '''
+        Return sort key of given column for each player table row.
+        '''
+        keys = [None] * data.players.table.get_row_count()
+        function = COLUMNS[column][1]
+
+        for player in data.players.players.values():
+            keys[player.row] = function(player)
+
+        if COLUMNS[column][0] is str:
+            keys = [structures.search.fold_text(key) for key in keys]
+
+        return keys
+
+    def get_index(self, column):
+        '''
+        Return player table rows in ascending order of given column, keeping
+        indexes until player data changes or a new game is loaded.
+        '''
+        generation = data.players, data.players.generation
+
+        if self.generation != generation:
+            self.generation = generation
+            self.clear_indexes()
+
+        if column not in self.indexes:
+            keys = self.get_sort_keys(column)
+            self.indexes[column] = sorted(range(0, len(keys)), key=keys.__getitem__)
+
+        return self.indexes[column]
+
+    def clear_indexes(self):
+        '''
+        Discard sort indexes after player data has changed.
+        '''
+        self.indexes.clear()
+
+    def set_sort(self, column, descending):
+        '''
+        Set column and direction used to order rows.
+        '''
+        self.sort_column = column
+        self.descending = descending
+
+    def update(self, matches):
+        '''
+        Set displayed rows to given player table rows in sort order.
+        '''
+        index = self.get_index(self.sort_column)
+
+        if self.descending:
+            index = reversed(index)
+
+        self.rows = [row for row in index if row in matches]
+
+    def get_iter_for_position(self, position):
+        '''
+        Return iter for given list position, storing position offset by
+        one so that the first row does not hold a null pointer.
+        '''
+        if 0 <= position < len(self.rows):
+            treeiter = Gtk.TreeIter()
+            treeiter.user_data = position + 1
+
+            return True, treeiter
+
+        return False, None
+
+    def do_get_flags(self):
+        return Gtk.TreeModelFlags.LIST_ONLY
+
+    def do_get_n_columns(self):
+        return len(COLUMNS)
+
+    def do_get_column_type(self, column):
+        return COLUMNS[column][0]
+
+    def do_get_iter(self, path):
+        return self.get_iter_for_position(path.get_indices()[0])
+
+    def do_get_path(self, treeiter):
+        return Gtk.TreePath((treeiter.user_data - 1,))
+
+    def do_get_value(self, treeiter, column):
+        player = data.players.get_player_by_row(self.rows[treeiter.user_data - 1])
+
+        return COLUMNS[column][1](player)
+
+    def do_iter_next(self, treeiter):
+        if treeiter.user_data < len(self.rows):
+            treeiter.user_data += 1
+
+            return True
+
+        return False
+
+    def do_iter_previous(self, treeiter):
+        if treeiter.user_data > 1:
+            treeiter.user_data -= 1
+
+            return True
+
+        return False
+
+    def do_iter_children(self, parent):
+        if parent is None:
+            return self.get_iter_for_position(0)
+
+        return False, None
+
+    def do_iter_has_child(self, treeiter):
+        return False
+
+    def do_iter_n_children(self, treeiter):
+        if treeiter is None:
+            return len(self.rows)
+
+        return 0
+
+    def do_iter_nth_child(self, parent, position):
+        if parent is None:
+            return self.get_iter_for_position(position)
+
+        return False, None
+
+    def do_iter_parent(self, child):
+        return False, None
 
 
 class Filter(Gtk.Dialog):
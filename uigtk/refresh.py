@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+#  This file is part of OpenSoccerManager.
+#
+#  OpenSoccerManager is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  OpenSoccerManager is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+#  or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+#  more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  OpenSoccerManager.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from gi.repository import GObject
+
+
+class Refresh:
+    '''
+    Scheduler collecting interface updates requested during a tick and
+    running each of them once when the main loop is next idle.
+    '''
+    def __init__(self):
+        self.callbacks = {}
+        self.sourceid = None
+
+    def queue(self, callback):
+        '''
+        Queue callback to be run once the main loop is idle.
+        '''
+        self.callbacks[callback] = None
+
+        if self.sourceid is None:
+            self.sourceid = GObject.idle_add(self.on_idle_event)
+
+    def on_idle_event(self, *args):
+        '''
+        Run each queued callback once and clear the queue.
+        '''
+        callbacks = list(self.callbacks)
+
+        self.callbacks.clear()
+        self.sourceid = None
+
+        for callback in callbacks:
+            callback()
+
+        return False
+
+
+def update_rows(liststore, rows):
+    '''
+    Update list store to match given rows keyed by their first column,
+    changing only rows and values which differ.
+    '''
+    treeiters = {item[0]: item.iter for item in liststore}
+    keys = set()
+
+    for values in rows:
+        key = values[0]
+        keys.add(key)
+
+        treeiter = treeiters.get(key)
+
+        if treeiter is None:
+            liststore.append(values)
+        else:
+            current = liststore[treeiter][:]
+            columns = [column for column, value in enumerate(values)
+                       if current[column] != value]
+
+            if columns:
+                liststore.set(treeiter, columns, [values[column] for column in columns])
+
+    for key, treeiter in treeiters.items():
+        if key not in keys:
+            liststore.remove(treeiter)
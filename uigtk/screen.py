@@ -17,37 +17,45 @@
 
 
 from gi.repository import Gtk
+from gi.repository import GObject
+import importlib
 
 import data
-import uigtk.accounts
-import uigtk.advertising
-import uigtk.buildings
-import uigtk.catering
-import uigtk.charts
-import uigtk.clubinformation
-import uigtk.clubsearch
-import uigtk.evaluation
-import uigtk.finances
-import uigtk.fixtures
-import uigtk.individualtraining
-import uigtk.match
-import uigtk.merchandise
-import uigtk.nationsearch
-import uigtk.negotiations
-import uigtk.news
-import uigtk.playerinformation
-import uigtk.playersearch
-import uigtk.result
-import uigtk.shortlist
-import uigtk.squad
-import uigtk.stadium
-import uigtk.staff
-import uigtk.standings
-import uigtk.tactics
-import uigtk.teamtraining
-import uigtk.tickets
-import uigtk.trainingcamp
-import uigtk.unavailable
+
+
+# Module and class name of each screen, imported when first displayed
+SCREENS = {"accounts": ("uigtk.accounts", "Accounts"),
+           "advertising": ("uigtk.advertising", "Advertising"),
+           "buildings": ("uigtk.buildings", "Buildings"),
+           "catering": ("uigtk.catering", "Catering"),
+           "charts": ("uigtk.charts", "Charts"),
+           "clubinformation": ("uigtk.clubinformation", "ClubInformation"),
+           "clubsearch": ("uigtk.clubsearch", "ClubSearch"),
+           "evaluation": ("uigtk.evaluation", "Evaluation"),
+           "finances": ("uigtk.finances", "Finances"),
+           "fixtures": ("uigtk.fixtures", "Fixtures"),
+           "individualtraining": ("uigtk.individualtraining", "IndividualTraining"),
+           "match": ("uigtk.match", "Match"),
+           "merchandise": ("uigtk.merchandise", "Merchandise"),
+           "nationsearch": ("uigtk.nationsearch", "NationSearch"),
+           "negotiations": ("uigtk.negotiations", "Negotiations"),
+           "news": ("uigtk.news", "News"),
+           "playerinformation": ("uigtk.playerinformation", "PlayerInformation"),
+           "playersearch": ("uigtk.playersearch", "PlayerSearch"),
+           "result": ("uigtk.result", "Result"),
+           "shortlist": ("uigtk.shortlist", "Shortlist"),
+           "staff": ("uigtk.staff", "Staff"),
+           "squad": ("uigtk.squad", "Squad"),
+           "stadium": ("uigtk.stadium", "Stadium"),
+           "standings": ("uigtk.standings", "Standings"),
+           "tactics": ("uigtk.tactics", "Tactics"),
+           "teamtraining": ("uigtk.teamtraining", "TeamTraining"),
+           "tickets": ("uigtk.tickets", "Tickets"),
+           "trainingcamp": ("uigtk.trainingcamp", "TrainingCamp"),
+           "unavailable": ("uigtk.unavailable", "Unavailable")}
+
+# Screens commonly visited after starting or loading a game
+PREWARM = ("news", "fixtures", "playerinformation", "tactics")
 
 
 class Screen(Gtk.Grid):
@@ -59,44 +67,34 @@ class Screen(Gtk.Grid):
         self.history = []
         self.active = None
 
-    def screen_initialiser(self):
-        '''
-        Screen object loading class.
-        '''
-        screens = (uigtk.accounts.Accounts(),
-                   uigtk.advertising.Advertising(),
-                   uigtk.buildings.Buildings(),
-                   uigtk.catering.Catering(),
-                   uigtk.charts.Charts(),
-                   uigtk.clubinformation.ClubInformation(),
-                   uigtk.clubsearch.ClubSearch(),
-                   uigtk.evaluation.Evaluation(),
-                   uigtk.finances.Finances(),
-                   uigtk.fixtures.Fixtures(),
-                   uigtk.individualtraining.IndividualTraining(),
-                   uigtk.match.Match(),
-                   uigtk.merchandise.Merchandise(),
-                   uigtk.nationsearch.NationSearch(),
-                   uigtk.negotiations.Negotiations(),
-                   uigtk.news.News(),
-                   uigtk.playerinformation.PlayerInformation(),
-                   uigtk.playersearch.PlayerSearch(),
-                   uigtk.result.Result(),
-                   uigtk.shortlist.Shortlist(),
-                   uigtk.staff.Staff(),
-                   uigtk.squad.Squad(),
-                   uigtk.stadium.Stadium(),
-                   uigtk.standings.Standings(),
-                   uigtk.tactics.Tactics(),
-                   uigtk.teamtraining.TeamTraining(),
-                   uigtk.tickets.Tickets(),
-                   uigtk.trainingcamp.TrainingCamp(),
-                   uigtk.unavailable.Unavailable())
-
         self.screens = {}
 
-        for screen in screens:
-            self.screens[screen.__name__] = screen
+    def get_screen(self, name):
+        '''
+        Return screen object for given name, building it on first use.
+        '''
+        if name not in self.screens:
+            modulename, classname = SCREENS[name]
+            module = importlib.import_module(modulename)
+
+            self.screens[name] = getattr(module, classname)()
+
+        return self.screens[name]
+
+    def prewarm_screens(self, names):
+        '''
+        Build given screens one at a time while the main loop is idle.
+        '''
+        pending = [name for name in names if name not in self.screens]
+
+        def on_idle_event():
+            if pending:
+                self.get_screen(pending.pop(0))
+
+            return len(pending) > 0
+
+        if pending:
+            GObject.idle_add(on_idle_event)
 
     def change_visible_screen(self, name, **kwargs):
         '''
@@ -106,7 +104,7 @@ class Screen(Gtk.Grid):
             self.history.append(self.active)
             self.remove(self.active)
 
-        self.active = self.screens[name]
+        self.active = self.get_screen(name)
         self.active.name = name
         self.add(self.active)
         self.active.kwargs = kwargs
@@ -119,6 +117,12 @@ class Screen(Gtk.Grid):
         if self.active:
             self.active.run()
 
+    def queue_refresh(self):
+        '''
+        Refresh the visible screen once the current tick has finished.
+        '''
+        data.window.refresh.queue(self.refresh_visible_screen)
+
     def get_visible_screen(self):
         '''
         Retrieve visible screen object.
@@ -143,6 +147,7 @@ class Screen(Gtk.Grid):
         self.history.clear()
 
     def run(self):
-        self.screen_initialiser()
+        self.screens = {}
+        self.prewarm_screens(PREWARM)
 
         self.show_all()
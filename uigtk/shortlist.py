@@ -22,6 +22,7 @@ from gi.repository import Gdk
 import data
 import structures.scouts
 import structures.skills
+import uigtk.contextmenu
 import uigtk.widgets
 
 
@@ -175,7 +176,7 @@ class Shortlist(Gtk.Grid):
 
         player = data.players.get_player_by_id(playerid)
 
-        dialog = RemoveShortlist()
+        dialog = uigtk.contextmenu.RemoveShortlist()
 
         if dialog.show(player):
             data.user.club.shortlist.remove_from_shortlist(player)
@@ -290,7 +291,7 @@ class ContextMenu(uigtk.contextmenu.ContextMenu2):
         '''
         Ask to remove selected player from shortlist.
         '''
-        dialog = RemoveShortlist()
+        dialog = uigtk.contextmenu.RemoveShortlist()
 
         if dialog.show(self.player):
             data.user.club.shortlist.remove_from_shortlist(self.player)
@@ -323,29 +324,6 @@ class ContextMenu(uigtk.contextmenu.ContextMenu2):
         self.show_all()
 
 
-class RemoveShortlist(Gtk.MessageDialog):
-    '''
-    Message dialog displayed when user attempts to remove player from shortlist.
-    '''
-    def __init__(self):
-        Gtk.MessageDialog.__init__(self)
-        self.set_transient_for(data.window)
-        self.set_title("Remove From Shortlist")
-        self.set_property("message-type", Gtk.MessageType.QUESTION)
-        self.format_secondary_text("Removal will not affect any ongoing transfer negotiations.")
-        self.add_button("_Do Not Remove", Gtk.ResponseType.CANCEL)
-        self.add_button("_Remove", Gtk.ResponseType.OK)
-        self.set_default_response(Gtk.ResponseType.CANCEL)
-
-    def show(self, player):
-        self.set_markup("<span size='12000'><b>Remove %s from shortlist?</b></span>" % (player.get_name(mode=1)))
-
-        state = self.run() == Gtk.ResponseType.OK
-        self.destroy()
-
-        return state
-
-
 class ScoutReport(Gtk.MessageDialog):
     '''
     Message dialog reporting on the quality of the selected player.
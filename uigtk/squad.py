@@ -26,6 +26,8 @@ import structures.filters
 import structures.position
 import structures.skills
 import uigtk.contextmenu
+import uigtk.refresh
+import uigtk.shared
 import uigtk.widgets
 
 
@@ -303,7 +305,7 @@ class SquadList(Gtk.ListStore):
         '''
         Call to update squad listing interface.
         '''
-        self.clear()
+        rows = []
 
         for playerid, player in data.user.club.squad.get_squad():
             if not player.injury.get_injured():
@@ -311,7 +313,7 @@ class SquadList(Gtk.ListStore):
             else:
                 injury = "Out for %s with a %s." % (player.injury.get_injury_period(), player.injury.get_injury_name())
 
-            self.append([playerid,
+            rows.append([playerid,
                          player.get_name(),
                          player.get_age(),
                          player.position,
@@ -341,6 +343,8 @@ class SquadList(Gtk.ListStore):
                          data.loans.get_player_on_loan(player),
                          injury])
 
+        uigtk.refresh.update_rows(self, rows)
+
 
 class Team:
     '''
@@ -941,43 +945,6 @@ class ContextMenu2(Gtk.Menu):
         self.show_all()
 
 
-class RenewContract(uigtk.shared.ContractNegotiation):
-    def __init__(self, player):
-        self.player = player
-
-        uigtk.shared.ContractNegotiation.__init__(self)
-        self.set_title("Renew Contract")
-        self.add_button("_Renew", Gtk.ResponseType.OK)
-
-        self.labelContract.set_label("Contract renewal details for %s." % (player.get_name(mode=1)))
-
-
-class TerminateContract(Gtk.MessageDialog):
-    '''
-    Confirmation dialog to arrange termination of a players contract.
-    '''
-    def __init__(self, player):
-        payout = data.currency.get_amount(player.contract.get_termination_payout())
-        payout = data.currency.get_comma_value(payout)
-
-        Gtk.MessageDialog.__init__(self)
-        self.set_transient_for(data.window)
-        self.set_modal(True)
-        self.set_title("Terminate Contract")
-        self.set_property("message-type", Gtk.MessageType.QUESTION)
-        self.set_markup("<span size='12000'><b>Do you wish to terminate the contract of %s?</b></span>" % (player.get_name(mode=1)))
-        self.format_secondary_text("The player will be paid %s%s for the remainder of his contract." % (data.currency.get_currency_symbol(), payout))
-        self.add_button("_Do Not Terminate", Gtk.ResponseType.CANCEL)
-        self.add_button("_Terminate Contract", Gtk.ResponseType.OK)
-        self.set_default_response(Gtk.ResponseType.CANCEL)
-
-    def show(self):
-        state = self.run() == Gtk.ResponseType.OK
-        self.destroy()
-
-        return state
-
-
 class StatusDialog(Gtk.MessageDialog):
     '''
     Status dialog for display when status button is clicked.
@@ -24,6 +24,7 @@ import data
 import structures.ability
 import structures.morale
 import structures.speciality
+import uigtk.accounts
 import uigtk.widgets
 
 
@@ -24,8 +24,11 @@ from gi.repository import GdkPixbuf
 import os
 
 import data
+import uigtk.filedialog
 import uigtk.helpdialog
+import uigtk.mainscreen
 import uigtk.quitdialog
+import uigtk.refresh
 import uigtk.screen
 import uigtk.welcome
 
@@ -98,6 +101,7 @@ class Window(Gtk.Window):
         return True
 
     def run(self):
+        self.refresh = uigtk.refresh.Refresh()
         self.mainscreen = uigtk.mainscreen.MainScreen()
         self.screen = uigtk.screen.Screen()
         self.help_dialog = uigtk.helpdialog.HelpDialog()